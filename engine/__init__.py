@@ -0,0 +1,13 @@
+"""
+Engine core shared by space_exp and spacinator: timers, geometry, collision broadphases and
+spatial indexes, render caches, entity base classes, the game loop, save files and the
+sector store. Both games are built on these, so a fix or speed-up made here lands in both.
+"""
+from engine.timers import Timer, TimerWheel
+from engine.geometry import distance, segment_circle_hit, turn_towards
+from engine.collision import SpatialGrid, IndexedGroup, TargetIndex, ToroidalHash, CollisionLayers, raycast_sprites
+from engine.caches import TextCache, HudText, HudBar, StampCache, SpriteAtlas
+from engine.entities import Entity
+from engine.loop import Game, run
+from engine.saves import SaveWorker, pack_tables, unpack_tables, read_save, write_save
+from engine.sectors import SectorStore
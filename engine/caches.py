@@ -0,0 +1,244 @@
+"""
+Render caches: text, HUD labels and bars, sprite stamps and the sprite atlas.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_MAX_ENTRIES = 256 # Default number of rendered text surfaces kept around
+TEXT_ALPHA_STEP = 16 # Default text alpha quantization, so fading labels still hit the cache
+STAMP_CACHE_MAX_ENTRIES = 1024 # Default number of pre-scaled (and pre-rotated) sprite stamps kept around
+SPRITE_ATLAS_SIZE = 1024 # Default edge length of the atlas page scaled sprites are packed into
+HUD_BAR_OUTLINE_COLOR = (150, 150, 150)
+
+class TextCache:
+    """
+    Caches rendered text surfaces keyed by (font, text, color, alpha), evicting the least
+    recently used ones past max_entries; alpha is quantized to multiples of alpha_step. Also hands
+    out shared default fonts by size, so code that needs a scaled font doesn't construct a new
+    Font every frame.
+    """
+    def __init__(self, max_entries=TEXT_CACHE_MAX_ENTRIES, alpha_step=TEXT_ALPHA_STEP):
+        self.lock = threading.Lock() # Shared by the main and render threads
+        self.max_entries = max_entries
+        self.alpha_step = alpha_step
+        self.fonts = {} # {size: pygame.font.Font}
+        self.surfaces = OrderedDict() # {(font, text, color, alpha): pygame.Surface}
+
+    def get_font(self, size):
+        """Returns the shared default font for the given size."""
+        with self.lock:
+            font = self.fonts.get(size)
+            if font is None:
+                font = pygame.font.Font(None, size)
+                self.fonts[size] = font
+            return font
+
+    def render(self, font, text, color, alpha=255):
+        """Returns an antialiased text surface, rendering it only on a cache miss."""
+        with self.lock:
+            if alpha < 255:
+                alpha = alpha // self.alpha_step * self.alpha_step
+            key = (font, text, color, alpha)
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+                return surface
+
+            surface = font.render(text, True, color)
+            if alpha < 255:
+                surface.set_alpha(alpha)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_entries:
+                self.surfaces.popitem(last=False)
+            return surface
+
+class HudText:
+    """
+    A HUD label built from a format string. The label is only re-rendered when the
+    values fed to it (health, XP, charge, cooldown...) or its color change.
+    """
+    def __init__(self, font, text_format, color):
+        self.font = font
+        self.text_format = text_format
+        self.color = color
+        self.values = None
+        self.rendered_color = None
+        self.surface = None
+
+    def get_surface(self, *values, color=None):
+        """Returns the label surface for these values, re-rendering only if they changed."""
+        color = color or self.color
+        if values != self.values or color != self.rendered_color:
+            self.values = values
+            self.rendered_color = color
+            self.surface = self.font.render(self.text_format.format(*values), True, color)
+        return self.surface
+
+    def draw(self, screen, pos, *values, color=None):
+        """Blits the label with its top-left corner at pos."""
+        screen.blit(self.get_surface(*values, color=color), pos)
+
+class HudBar:
+    """
+    A HUD progress bar (outline plus fill). The bar is cached as a surface and only
+    re-rendered when the filled width in pixels changes.
+    """
+    def __init__(self, width, height, fill_color, outline_color=HUD_BAR_OUTLINE_COLOR):
+        self.width = width
+        self.height = height
+        self.fill_color = fill_color
+        self.outline_color = outline_color
+        self.fill_width = None
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+    def draw(self, screen, pos, fraction):
+        """Draws the bar at pos filled to the given fraction (0.0 to 1.0)."""
+        fill_width = int(self.width * max(0.0, min(1.0, fraction)))
+        if fill_width != self.fill_width:
+            self.fill_width = fill_width
+            self.surface.fill((0, 0, 0, 0))
+            pygame.draw.rect(self.surface, self.outline_color, (0, 0, self.width, self.height), 2) # Outline
+            pygame.draw.rect(self.surface, self.fill_color, (0, 0, fill_width, self.height)) # Fill
+        screen.blit(self.surface, pos)
+
+class StampCache:
+    """
+    Pre-built, pre-scaled sprite images ("stamps") shared by every sprite that looks the same,
+    e.g. all projectiles of one color or all material drops of one type and size at a zoom level.
+    """
+    def __init__(self, max_entries=STAMP_CACHE_MAX_ENTRIES):
+        self.lock = threading.Lock() # Shared by the main and render threads
+        self.max_entries = max_entries
+        self.stamps = OrderedDict() # (key, size) -> Surface
+
+    def _store(self, cache_key, stamp):
+        self.stamps[cache_key] = stamp
+        if len(self.stamps) > self.max_entries:
+            self.stamps.popitem(last=False)
+        return stamp
+
+    def get_rect(self, color, size):
+        """Returns a solid rectangle stamp of the given color and (width, height)."""
+        with self.lock:
+            cache_key = (("rect", color), size)
+            stamp = self.stamps.get(cache_key)
+            if stamp is not None:
+                self.stamps.move_to_end(cache_key)
+                return stamp
+            stamp = pygame.Surface(size, pygame.SRCALPHA)
+            stamp.fill(color)
+            return self._store(cache_key, stamp)
+
+    def get_circle(self, color, diameter):
+        """Returns a filled disc stamp of the given color and diameter."""
+        with self.lock:
+            cache_key = (("circle", color), diameter)
+            stamp = self.stamps.get(cache_key)
+            if stamp is not None:
+                self.stamps.move_to_end(cache_key)
+                return stamp
+            stamp = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, color, (diameter / 2, diameter / 2), diameter / 2)
+            return self._store(cache_key, stamp)
+
+    def get_scaled(self, key, image, size):
+        """
+        Returns image scaled to (width, height). key must identify what the image looks like,
+        since sprites sharing a key share the stamp.
+        """
+        with self.lock:
+            cache_key = (key, size)
+            stamp = self.stamps.get(cache_key)
+            if stamp is not None:
+                self.stamps.move_to_end(cache_key)
+                return stamp
+            return self._store(cache_key, pygame.transform.scale(image, size))
+
+    def get_rotated(self, key, image, size, angle):
+        """Returns image scaled to (width, height) and rotated by angle degrees. Callers snap the angle."""
+        with self.lock:
+            cache_key = ((key, angle), size)
+            stamp = self.stamps.get(cache_key)
+            if stamp is not None:
+                self.stamps.move_to_end(cache_key)
+                return stamp
+            return self._store(cache_key, pygame.transform.rotate(pygame.transform.scale(image, size), angle))
+
+class SpriteAtlas:
+    """
+    Loads the PNGs in directory once, scales them to the sizes the game asks for and packs
+    the results into one display-format (convert_alpha) atlas page. Sprites get subsurfaces
+    of the page, so every instance of a kind shares a single converted image.
+    """
+    def __init__(self, directory, page_size=SPRITE_ATLAS_SIZE):
+        self.lock = threading.Lock()
+        self.directory = directory
+        self.page_size = page_size
+        self.page = None # Created on first use, once the display mode is set
+        self.sources = {} # Sprite name -> source image cropped to its content, or None if missing
+        self.regions = {} # (name, size, angle) -> shared surface
+        self.shelf_x = 0 # Simple shelf packing: images are placed left to right in rows
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def get_source(self, name):
+        if name not in self.sources:
+            path = os.path.join(self.directory, name + ".png")
+            try:
+                image = pygame.image.load(path)
+            except (pygame.error, FileNotFoundError):
+                print(f"Could not load sprite {path}, using the built-in shape instead.")
+                image = None
+            else:
+                # Crop the transparent margin; in the display format it can be scaled straight into the page
+                image = image.subsurface(image.get_bounding_rect()).convert_alpha()
+            self.sources[name] = image
+        return self.sources[name]
+
+    def allocate(self, size):
+        """Reserves an area of the given size on the page. Returns its rect, or None if the page is full."""
+        width, height = size
+        if self.shelf_x + width > self.page_size: # Start a new shelf
+            self.shelf_x = 0
+            self.shelf_y += self.shelf_height
+            self.shelf_height = 0
+        if width > self.page_size or self.shelf_y + height > self.page_size:
+            return None
+        rect = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        self.shelf_x += width
+        self.shelf_height = max(self.shelf_height, height)
+        return rect
+
+    def get(self, name, size, angle=0):
+        """
+        Returns sprite name scaled to (width, height), optionally rotated by angle degrees first,
+        as a shared surface. Returns None if the PNG is not available. Callers must not draw
+        into the returned surface.
+        """
+        key = (name, tuple(size), angle)
+        with self.lock:
+            if key in self.regions:
+                return self.regions[key]
+            source = self.get_source(name)
+            if source is None:
+                self.regions[key] = None
+                return None
+            if angle:
+                source = pygame.transform.rotate(source, angle)
+
+            if self.page is None:
+                self.page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA).convert_alpha()
+            rect = self.allocate(size)
+            if rect is None: # Page full, the image still gets converted
+                print(f"Sprite atlas full, {name} at {size} gets its own surface.")
+                region = pygame.transform.smoothscale(source, size)
+            else:
+                # Scaled straight into the page instead of blitted: a blit onto the page would fail
+                # while the render thread holds a lock on it for scaling an earlier region
+                region = self.page.subsurface(rect)
+                pygame.transform.smoothscale(source, size, region)
+            self.regions[key] = region
+            return region
@@ -0,0 +1,281 @@
+"""
+Collision broadphases and spatial indexes.
+"""
+import math
+
+import pygame
+
+from engine.geometry import segment_circle_hit
+
+SPATIAL_GRID_CELL_SIZE = 500 # Default SpatialGrid cell edge length, in world units
+TARGET_INDEX_CELL_SIZE = 100 # Default TargetIndex cell edge length
+SPATIAL_HASH_CELL_SIZE = 50 # Default ToroidalHash cell edge length; must divide the playfield width and height
+
+class SpatialGrid:
+    """
+    Uniform grid over world space for range queries. Sprites are bucketed by their (x, y)
+    world coordinates; sprites that move must be re-inserted with move().
+    """
+    def __init__(self, cell_size=SPATIAL_GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {} # (cell_x, cell_y) -> set of sprites
+        self.sprite_cells = {} # sprite -> (cell_x, cell_y)
+        self.version = 0
+        self.cell_versions = {} # (cell_x, cell_y) -> version of the last change, lets caches redraw only changed cells
+
+    def get_cell(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, sprite):
+        cell = self.get_cell(sprite.x, sprite.y)
+        self.cells.setdefault(cell, set()).add(sprite)
+        self.sprite_cells[sprite] = cell
+        self.touch_cell(cell)
+
+    def remove(self, sprite):
+        cell = self.sprite_cells.pop(sprite, None)
+        if cell is not None:
+            bucket = self.cells[cell]
+            bucket.discard(sprite)
+            if not bucket:
+                del self.cells[cell]
+            self.touch_cell(cell)
+
+    def touch_cell(self, cell):
+        self.version += 1
+        self.cell_versions[cell] = self.version
+
+    def touch(self, sprite):
+        """Marks a sprite's cell as changed when the sprite's appearance changed but it didn't move."""
+        cell = self.sprite_cells.get(sprite)
+        if cell is not None:
+            self.touch_cell(cell)
+
+    def move(self, sprite):
+        """Updates a sprite's cell after it moved."""
+        if self.sprite_cells.get(sprite) != self.get_cell(sprite.x, sprite.y):
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def query_rect(self, left, top, right, bottom):
+        """Yields the sprites whose position lies within the given world-space bounds."""
+        first_x, first_y = self.get_cell(left, top)
+        last_x, last_y = self.get_cell(right, bottom)
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                for sprite in self.cells.get((cell_x, cell_y), ()):
+                    if left <= sprite.x <= right and top <= sprite.y <= bottom:
+                        yield sprite
+
+    def query_radius(self, x, y, radius):
+        """Yields the sprites within radius of (x, y)."""
+        for sprite in self.query_rect(x - radius, y - radius, x + radius, y + radius):
+            if (sprite.x - x) ** 2 + (sprite.y - y) ** 2 <= radius * radius:
+                yield sprite
+
+class IndexedGroup(pygame.sprite.Group):
+    """
+    A sprite group that keeps its sprites in a SpatialGrid, so the grid stays in sync with
+    add(), kill(), remove() and empty() without any extra bookkeeping at the call sites.
+    """
+    def __init__(self, *sprites, cell_size=SPATIAL_GRID_CELL_SIZE):
+        self.grid = SpatialGrid(cell_size)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.grid.insert(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.grid.remove(sprite)
+
+class TargetIndex:
+    """
+    Nearest-neighbour index over the centers of a sprite group, for auto-targeting. The grid is
+    built on the first query after invalidate(), so ticks without a query don't pay for it.
+    """
+    def __init__(self, sprites, cell_size=TARGET_INDEX_CELL_SIZE):
+        self.sprites = sprites
+        self.cell_size = cell_size
+        self.cells = None # (cell x, cell y) -> [(center x, center y, sprite)], None until built
+
+    def invalidate(self):
+        """Marks the index stale; call after the sprites moved or the group changed."""
+        self.cells = None
+
+    def build(self):
+        self.cells = {}
+        for sprite in self.sprites:
+            x, y = sprite.rect.center
+            self.cells.setdefault((x // self.cell_size, y // self.cell_size), []).append((x, y, sprite))
+
+    def nearest(self, pos):
+        """Returns the sprite whose center is closest to pos, or None if there are none."""
+        if self.cells is None:
+            self.build()
+        if not self.cells:
+            return None
+        cx, cy = pos[0] // self.cell_size, pos[1] // self.cell_size
+        max_ring = max(max(abs(kx - cx), abs(ky - cy)) for kx, ky in self.cells)
+        best, best_dist_sq = None, float('inf')
+        for ring in range(int(max_ring) + 1):
+            # Everything in this ring or further out is at least (ring - 1) cells away
+            if best is not None and ((ring - 1) * self.cell_size) ** 2 > best_dist_sq:
+                break
+            for kx in range(int(cx) - ring, int(cx) + ring + 1):
+                for ky in range(int(cy) - ring, int(cy) + ring + 1):
+                    if max(abs(kx - cx), abs(ky - cy)) != ring: continue # Inner rings were already searched
+                    for x, y, sprite in self.cells.get((kx, ky), ()):
+                        dist_sq = (x - pos[0]) ** 2 + (y - pos[1]) ** 2
+                        if dist_sq < best_dist_sq:
+                            best, best_dist_sq = sprite, dist_sq
+        return best
+
+class ToroidalHash:
+    """
+    Collision broadphase for the wrapping playfield. Sprites are hashed by the grid cell of their
+    center, with cell coordinates taken modulo the grid, so a sprite near one edge is found from
+    the opposite edge too, and overlap is tested with wrapped distances. The hashed sprites'
+    centers are expected on the playfield, so wrapping sprites must wrap their own positions. With
+    wrap=False it is a plain spatial hash, for sprites that don't wrap.
+    """
+    def __init__(self, width, height, cell_size=SPATIAL_HASH_CELL_SIZE, wrap=True):
+        self.wrap = wrap
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.columns = width // cell_size
+        self.rows = height // cell_size
+        self.cells = {} # (column, row) -> [sprite]
+        self.max_width = 0 # Largest sprite hashed, by which queries reach into neighbouring cells
+        self.max_height = 0
+
+    def build(self, sprites):
+        """Rehashes the hash with sprites; call once per tick after they moved."""
+        self.cells = {}
+        self.max_width = self.max_height = 0
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def insert(self, sprite):
+        rect = sprite.rect
+        key = (rect.centerx // self.cell_size % self.columns, rect.centery // self.cell_size % self.rows)
+        self.cells.setdefault(key, []).append(sprite)
+        if rect.width > self.max_width: self.max_width = rect.width
+        if rect.height > self.max_height: self.max_height = rect.height
+
+    def overlaps(self, a, b):
+        """Like Rect.colliderect, but across the wrapped edges. Works on doubled centers to stay in integers."""
+        dx = (2 * b.x + b.width - 2 * a.x - a.width + self.width) % (2 * self.width) - self.width
+        dy = (2 * b.y + b.height - 2 * a.y - a.height + self.height) % (2 * self.height) - self.height
+        return abs(dx) < a.width + b.width and abs(dy) < a.height + b.height
+
+    def query(self, rect):
+        """Returns the live sprites whose rect overlaps rect."""
+        # Any sprite overlapping rect has its center inside rect grown by that sprite's size
+        reach = rect.inflate(self.max_width + 2, self.max_height + 2)
+        columns = range(reach.left // self.cell_size, (reach.right - 1) // self.cell_size + 1)
+        rows = range(reach.top // self.cell_size, (reach.bottom - 1) // self.cell_size + 1)
+        if len(columns) > self.columns: columns = range(self.columns)
+        if len(rows) > self.rows: rows = range(self.rows)
+        # Away from the edges nothing wraps, so the plain Rect test will do
+        wrapped = self.wrap and (reach.left < 0 or reach.top < 0 or reach.right > self.width or reach.bottom > self.height)
+        overlaps = self.overlaps if wrapped else pygame.Rect.colliderect
+        hits = []
+        for column in columns:
+            for row in rows:
+                for sprite in self.cells.get((column % self.columns, row % self.rows), ()):
+                    if overlaps(rect, sprite.rect) and sprite.alive():
+                        hits.append(sprite)
+        return hits
+
+    def raycast(self, start, end):
+        """
+        Like raycast_sprites over the hashed sprites, but only the sprites hashed in the cells along
+        the segment are tested, at each copy of them the segment can meet across the wrapped edges.
+        """
+        # A sprite the segment crosses has its center within half its size of the segment; samples
+        # along it are less than a cell apart, so that is at most reach cells from some sample's cell
+        reach = max(self.max_width, self.max_height) // 2 // self.cell_size + 1
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        steps = int(math.hypot(dx, dy) // self.cell_size) + 1
+        cells = set()
+        for step in range(steps + 1):
+            column = int((start[0] + dx * step / steps) // self.cell_size)
+            row = int((start[1] + dy * step / steps) // self.cell_size)
+            for kx in range(column - reach, column + reach + 1):
+                for ky in range(row - reach, row + reach + 1):
+                    cells.add((kx, ky))
+        candidates = []
+        for kx, ky in cells:
+            # Past an edge, a wrapping hash's cells hold the sprites on the other side, shifted a playfield over
+            offset = ((kx // self.columns) * self.width, (ky // self.rows) * self.height) if self.wrap else (0, 0)
+            for sprite in self.cells.get((kx % self.columns, ky % self.rows), ()):
+                if sprite.alive():
+                    candidates.append((sprite, sprite.rect.move(offset)))
+        return _first_hit(start, end, candidates)
+
+class CollisionLayers:
+    """
+    The sprites of a game sorted into named collision layers. Every layer that can be hit is kept
+    in a ToroidalHash over the width x height playfield, and pairs() queries it only for the layers
+    the collision matrix (layer -> the layers its sprites can hit, in order) lets meet. Only the
+    layers named in wrapping wrap around the playfield edges.
+    """
+    def __init__(self, matrix, width, height, cell_size=SPATIAL_HASH_CELL_SIZE, wrapping=()):
+        self.matrix = matrix
+        self.hashes = {target: ToroidalHash(width, height, cell_size, wrap=target in wrapping)
+                       for targets in matrix.values() for target in targets}
+        self.layers = {}
+
+    def build(self, layers):
+        """Takes layer name -> sprites and rehashes the layers that can be hit; call once per tick after they moved."""
+        self.layers = layers
+        for name, layer_hash in self.hashes.items():
+            layer_hash.build(layers[name])
+
+    def pairs(self):
+        """
+        Yields (layer, sprite, target layer, hits) for each sprite that overlaps sprites of a layer it
+        can hit. Pairs are found lazily, so sprites killed while resolving an earlier pair drop out.
+        """
+        for name, targets in self.matrix.items():
+            for sprite in list(self.layers[name]):
+                for target in targets:
+                    if not sprite.alive():
+                        break
+                    hits = self.hashes[target].query(sprite.rect)
+                    if hits:
+                        yield name, sprite, target, hits
+
+    def raycast(self, layer, start, end):
+        """Casts the segment start -> end against a layer that can be hit, as rehashed by the last build()."""
+        return self.hashes[layer].raycast(start, end)
+
+def raycast_sprites(start, end, sprites):
+    """
+    Casts the segment start -> end against sprites, each treated as the circle inscribed in its
+    rect. Returns the first sprite hit and the hit point, or (None, end). Every sprite is tested;
+    ToroidalHash.raycast narrows this down to the sprites near the segment.
+    """
+    return _first_hit(start, end, [(sprite, sprite.rect) for sprite in sprites])
+
+def _first_hit(start, end, candidates):
+    """
+    Returns the first of candidates, (sprite, rect) pairs, whose rect's inscribed circle the segment
+    start -> end hits, and the hit point, or (None, end). Rect.clipline skips the circle test for
+    rects the segment doesn't cross.
+    """
+    hit = None
+    hit_t = 1.0
+    for sprite, rect in candidates:
+        if not rect.clipline(start, end):
+            continue
+        t = segment_circle_hit(start, end, rect.center, rect.width / 2)
+        if t is not None and t <= hit_t:
+            hit, hit_t = sprite, t
+    if hit is None:
+        return None, end
+    return hit, (start[0] + (end[0] - start[0]) * hit_t, start[1] + (end[1] - start[1]) * hit_t)
@@ -0,0 +1,29 @@
+"""
+Base classes for game entities.
+"""
+import pygame
+
+class Entity(pygame.sprite.Sprite):
+    """
+    A sprite at a float position (x, y) moving by (vx, vy) per update. Its rect is kept centered
+    on the position, so sub-pixel velocities accumulate instead of being truncated by the rect.
+    """
+    def __init__(self, x, y, image):
+        super().__init__()
+        self.image = image
+        self.rect = image.get_rect(center=(int(x), int(y)))
+        self.x = float(x)
+        self.y = float(y)
+        self.vx = 0.0
+        self.vy = 0.0
+
+    def move(self):
+        """Moves the entity by its velocity."""
+        self.x += self.vx
+        self.y += self.vy
+        self.rect.center = (int(self.x), int(self.y))
+
+    def set_image(self, image):
+        """Swaps the image (e.g. for a rotated one), keeping the rect centered on the position."""
+        self.image = image
+        self.rect = image.get_rect(center=(int(self.x), int(self.y)))
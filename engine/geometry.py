@@ -0,0 +1,46 @@
+"""
+Geometry helpers: distances, segment tests and homing steering.
+"""
+import math
+
+def distance(pos1, pos2):
+    """Returns the Euclidean distance between two points."""
+    return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
+
+def segment_circle_hit(start, end, center, radius):
+    """
+    Returns how far along the segment start -> end (0 to 1) it first touches the circle,
+    0 if start is inside it, or None if the segment misses it.
+    """
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    fx = start[0] - center[0]
+    fy = start[1] - center[1]
+    c = fx * fx + fy * fy - radius * radius
+    if c <= 0:
+        return 0.0 # Starts inside the circle
+    a = dx * dx + dy * dy
+    b = 2 * (fx * dx + fy * dy)
+    discriminant = b * b - 4 * a * c
+    if a == 0 or discriminant < 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / (2 * a) # Nearer of the two intersections
+    return t if 0 <= t <= 1 else None
+
+def turn_towards(vx, vy, dx, dy, max_turn, speed):
+    """
+    Steers the velocity (vx, vy) towards the direction (dx, dy), turning by at most max_turn
+    degrees. Returns the new velocity, at the given speed. A standing start heads straight for
+    (dx, dy); a zero direction leaves the velocity as it is.
+    """
+    if dx == 0 and dy == 0:
+        return vx, vy
+    desired_angle = math.atan2(dy, dx)
+    if vx == 0 and vy == 0:
+        angle = desired_angle
+    else:
+        current_angle = math.atan2(vy, vx)
+        angle_diff = (desired_angle - current_angle + math.pi) % (2 * math.pi) - math.pi
+        max_turn = math.radians(max_turn)
+        angle = current_angle + max(-max_turn, min(max_turn, angle_diff))
+    return speed * math.cos(angle), speed * math.sin(angle)
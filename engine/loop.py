@@ -0,0 +1,38 @@
+"""
+The game loop shared by both games.
+"""
+import pygame
+
+class Game:
+    """
+    What run() drives. Each frame step() applies the frame's pygame events and advances the game,
+    draw() draws the frame and present() shows it. The loop ends once running is False.
+    """
+    running = True
+
+    def step(self, events):
+        raise NotImplementedError
+
+    def draw(self):
+        raise NotImplementedError
+
+    def present(self):
+        pygame.display.flip()
+
+    def frame_done(self, work_ms):
+        """Called after each frame with the milliseconds it took, excluding the frame cap's wait."""
+
+    def close(self):
+        """Called once the loop ends, before pygame quits."""
+
+def run(game, fps):
+    """Runs game at up to fps frames per second until it stops running, then quits pygame."""
+    clock = pygame.time.Clock()
+    while game.running:
+        game.step(pygame.event.get())
+        game.draw()
+        game.present()
+        clock.tick(fps)
+        game.frame_done(clock.get_rawtime())
+    game.close()
+    pygame.quit()
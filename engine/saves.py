@@ -0,0 +1,173 @@
+"""
+Versioned binary save files. A save is a small header (magic and format version) followed by a
+zlib-compressed body of record tables, each packed with struct in a single call. SaveWorker
+serializes, compresses and writes them on a background thread, so the game thread only pays for
+capturing the snapshot.
+"""
+import os
+import struct
+import threading
+import zlib
+from itertools import chain
+
+SAVE_HEADER = struct.Struct("<4sH") # Magic, format version; the compressed body follows
+SAVE_COUNT = struct.Struct("<I") # Records in a table, strings in the string table
+SAVE_STRING_LENGTH = struct.Struct("<H")
+SAVE_COMPRESSION_LEVEL = 6
+
+def pack_tables(layouts, tables):
+    """
+    Packs tables (lists of tuples) into bytes. layouts holds one struct layout per table, one
+    code per field and without a byte order; S fields hold strings, which are stored once in a
+    string table and referenced by index.
+    """
+    strings = {}
+    packed_tables = []
+    for layout, rows in zip(layouts, tables):
+        string_fields = [i for i, code in enumerate(layout) if code == "S"]
+        if string_fields:
+            rows = [list(row) for row in rows]
+            for row in rows:
+                for i in string_fields:
+                    row[i] = strings.setdefault(row[i], len(strings))
+        packed_tables.append(SAVE_COUNT.pack(len(rows)))
+        packed_tables.append(struct.pack("<" + layout.replace("S", "H") * len(rows), *chain.from_iterable(rows)))
+
+    packed_strings = [SAVE_COUNT.pack(len(strings))]
+    for string in strings: # Dicts keep insertion order, which is index order
+        encoded = string.encode("utf-8")
+        packed_strings.append(SAVE_STRING_LENGTH.pack(len(encoded)))
+        packed_strings.append(encoded)
+    return b"".join(packed_strings + packed_tables)
+
+def unpack_tables(layouts, data):
+    """
+    Unpacks what pack_tables packed with the same layouts. Returns the tables as lists of tuples.
+    Raises ValueError if data is cut short or garbled.
+    """
+    try:
+        return _unpack_tables(layouts, data)
+    except (struct.error, IndexError, UnicodeDecodeError) as error:
+        raise ValueError(f"damaged save data ({error})") from error
+
+def _unpack_tables(layouts, data):
+    offset = 0
+    (string_count,) = SAVE_COUNT.unpack_from(data, offset)
+    offset += SAVE_COUNT.size
+    strings = []
+    for _ in range(string_count):
+        (length,) = SAVE_STRING_LENGTH.unpack_from(data, offset)
+        offset += SAVE_STRING_LENGTH.size
+        strings.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    tables = []
+    for layout in layouts:
+        (count,) = SAVE_COUNT.unpack_from(data, offset)
+        offset += SAVE_COUNT.size
+        record = struct.Struct("<" + layout.replace("S", "H"))
+        rows = list(record.iter_unpack(data[offset:offset + record.size * count]))
+        offset += record.size * count
+        string_fields = [i for i, code in enumerate(layout) if code == "S"]
+        if string_fields:
+            rows = [tuple(strings[value] if i in string_fields else value for i, value in enumerate(row)) for row in rows]
+        tables.append(rows)
+    return tables
+
+def write_save(path, magic, version, body):
+    """
+    Compresses body and writes it with a header to path. The file is replaced atomically, so a
+    crash while writing keeps the previous save.
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(SAVE_HEADER.pack(magic, version))
+        file.write(zlib.compress(body, SAVE_COMPRESSION_LEVEL))
+    os.replace(temp_path, path)
+
+def read_save(path, magic):
+    """
+    Reads a save written by write_save. Returns (format version, body). Raises ValueError if it
+    is not a save with this magic or is damaged.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < SAVE_HEADER.size:
+        raise ValueError(f"{path} is not a save file")
+    file_magic, version = SAVE_HEADER.unpack_from(data)
+    if file_magic != magic:
+        raise ValueError(f"{path} is not a save file")
+    try:
+        return version, zlib.decompress(data[SAVE_HEADER.size:])
+    except zlib.error as error:
+        raise ValueError(f"{path} is damaged ({error})") from error
+
+class SaveWorker:
+    """
+    Writes snapshots on a background thread. submit() hands over a snapshot, which must not be
+    changed afterwards, and returns at once; serialize(snapshot) turns it into the save body on
+    the thread. If saves to a path come in faster than they are written, only the latest one
+    is written; saves to different paths don't replace each other.
+    """
+    def __init__(self, magic, version, serialize):
+        self.magic = magic
+        self.version = version
+        self.serialize = serialize
+        self.pending = {} # Path -> snapshot waiting to be written
+        self.busy = False
+        self.running = True
+        self.error = None # Exception raised by the last write, reported by the next submit() or flush()
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="SaveWorker", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and self.running:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                path = next(iter(self.pending)) # Oldest path first
+                snapshot = self.pending.pop(path)
+                self.busy = True
+
+            error = None
+            try:
+                write_save(path, self.magic, self.version, self.serialize(snapshot))
+            except Exception as write_error: # Reported on the game thread instead of killing this one
+                error = write_error
+
+            with self.condition:
+                self.error = error or self.error
+                self.busy = False
+                self.condition.notify_all()
+
+    def take_error(self):
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def submit(self, path, snapshot):
+        """
+        Queues snapshot to be written to path, replacing one queued for path but not written yet.
+        Raises the error of an earlier write that failed, after queueing the snapshot all the same.
+        """
+        with self.condition:
+            self.pending[path] = snapshot
+            self.condition.notify_all()
+            self.take_error()
+
+    def flush(self):
+        """Waits until every submitted snapshot is written."""
+        with self.condition:
+            while self.busy or self.pending:
+                self.condition.wait()
+            self.take_error()
+
+    def stop(self):
+        """Writes the queued snapshots, if any, and stops the thread."""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
@@ -0,0 +1,100 @@
+"""
+Memory-mapped sector store for worlds too large to keep as sprites. The world is a square grid
+of sectors centered on the origin. The file starts with a header per sector, followed by a
+fixed slot per sector with room for a fixed number of records of one struct layout, so a
+sector is found by arithmetic and only the pages of the sectors actually touched are read in
+(or written to disk) by the OS.
+"""
+import mmap
+import os
+import struct
+from itertools import chain
+
+SECTOR_HEADER = struct.Struct("<HH") # Records in the sector, flags
+SECTOR_GENERATED = 1 # Flag: the sector's content was generated, an empty sector stays empty
+
+class SectorStore:
+    """
+    side x side sectors of sector_size world units, each holding up to capacity records laid out
+    as layout (struct codes, without a byte order). The file at path is kept between sessions;
+    it is created empty (and sparse) if it is missing or was written with other dimensions.
+    """
+    def __init__(self, path, sector_size, side, capacity, layout):
+        self.path = path
+        self.sector_size = sector_size
+        self.side = side
+        self.half_side = side // 2
+        self.capacity = capacity
+        self.record = struct.Struct("<" + layout)
+        self.layout = layout
+        self.slot_size = capacity * self.record.size # Bytes of records per sector
+        self.slots_start = side * side * SECTOR_HEADER.size # The headers come first, so they share a few pages
+        self.file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        self.map = None
+        self.generated = set() # Sectors flagged SECTOR_GENERATED, so they can be listed without reading every header
+        if os.fstat(self.file.fileno()).st_size == self.slots_start + side * side * self.slot_size:
+            self.map = mmap.mmap(self.file.fileno(), 0)
+            with memoryview(self.map) as view:
+                headers = SECTOR_HEADER.iter_unpack(view[:self.slots_start]) # In all_sectors() order
+                self.generated = {sector for sector, (count, flags) in zip(self.all_sectors(), headers) if flags & SECTOR_GENERATED}
+        else:
+            self.reset()
+
+    def reset(self):
+        """Empties every sector. Truncating the file hands its pages back, the new ones read as zeros."""
+        if self.map is not None:
+            self.map.close()
+        self.file.truncate(0)
+        self.file.truncate(self.slots_start + self.side * self.side * self.slot_size)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        self.generated.clear()
+
+    def all_sectors(self):
+        return ((column, row) for row in range(-self.half_side, self.side - self.half_side)
+                for column in range(-self.half_side, self.side - self.half_side))
+
+    def sector_at(self, x, y):
+        """Returns the (column, row) of the sector containing world position (x, y)."""
+        return (int(x // self.sector_size), int(y // self.sector_size))
+
+    def sector_rect(self, sector):
+        """Returns the world bounds (left, top, right, bottom) of a sector."""
+        left = sector[0] * self.sector_size
+        top = sector[1] * self.sector_size
+        return left, top, left + self.sector_size, top + self.sector_size
+
+    def contains(self, sector):
+        return -self.half_side <= sector[0] < self.side - self.half_side and -self.half_side <= sector[1] < self.side - self.half_side
+
+    def index(self, sector):
+        return (sector[1] + self.half_side) * self.side + sector[0] + self.half_side
+
+    def is_generated(self, sector):
+        return sector in self.generated
+
+    def read(self, sector):
+        """Returns the records of a sector as tuples, unpacked straight from the mapped file."""
+        index = self.index(sector)
+        count, flags = SECTOR_HEADER.unpack_from(self.map, index * SECTOR_HEADER.size)
+        start = self.slots_start + index * self.slot_size
+        with memoryview(self.map) as view:
+            return list(self.record.iter_unpack(view[start:start + count * self.record.size]))
+
+    def write(self, sector, records):
+        """
+        Replaces the records of a sector and marks it generated. Records past the capacity are
+        dropped. Returns how many were stored.
+        """
+        records = records[:self.capacity]
+        index = self.index(sector)
+        SECTOR_HEADER.pack_into(self.map, index * SECTOR_HEADER.size, len(records), SECTOR_GENERATED)
+        self.generated.add(sector)
+        if records:
+            struct.pack_into("<" + self.layout * len(records), self.map, self.slots_start + index * self.slot_size,
+                             *chain.from_iterable(records))
+        return len(records)
+
+    def close(self):
+        self.map.flush()
+        self.map.close()
+        self.file.close()
@@ -0,0 +1,264 @@
+"""
+Tests for the engine's pure-logic parts: the timer wheel, the wrapping collision hash, save
+tables and files, and the sector store. Run with python -m pytest from the repository root.
+"""
+import os
+import zlib
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from engine import TimerWheel, ToroidalHash, raycast_sprites
+from engine import SaveWorker, pack_tables, unpack_tables, read_save, write_save, SectorStore
+
+
+# --- Timers ---
+
+def small_wheel():
+    """A wheel with 4 slots per level and 3 levels, so short delays already cascade through every level."""
+    return TimerWheel(slot_bits=2, levels=3)
+
+DELAYS = [1, 3, 4, 5, 15, 16, 17, 63, 64, 65, 100, 250, 1000, 7]
+
+def schedule_all(wheel, fired, delays=DELAYS):
+    return [wheel.schedule(delay, lambda delay=delay: fired.append((wheel.now, delay))) for delay in delays]
+
+@pytest.mark.parametrize("step", [1, 3, 7, 64, 2000])
+def test_timers_fire_at_their_deadline_in_order_across_levels(step):
+    wheel = small_wheel()
+    fired = []
+    schedule_all(wheel, fired)
+    for now in range(step, 2000 + step, step):
+        wheel.advance(now)
+    assert [delay for _, delay in fired] == sorted(DELAYS)
+    if step == 1: # Advanced tick by tick, each timer fires on its own tick
+        assert all(now == delay for now, delay in fired)
+    assert len(wheel) == 0
+
+def test_timers_scheduled_while_advancing_keep_their_deadline():
+    wheel = small_wheel()
+    fired = []
+    wheel.advance(37) # Not on a rotation boundary of any level
+    schedule_all(wheel, fired)
+    for now in range(38, 1100):
+        wheel.advance(now)
+    assert fired == [(37 + delay, delay) for delay in sorted(DELAYS)]
+
+def test_cancelled_timers_do_not_fire():
+    wheel = small_wheel()
+    fired = []
+    timers = schedule_all(wheel, fired)
+    cancelled = {delay for delay, timer in zip(DELAYS, timers) if delay % 2}
+    for delay, timer in zip(DELAYS, timers):
+        if delay in cancelled:
+            timer.cancel()
+    wheel.advance(2000)
+    assert [delay for _, delay in fired] == sorted(set(DELAYS) - cancelled)
+
+def test_cleared_wheel_fires_nothing_and_keeps_working():
+    wheel = small_wheel()
+    fired = []
+    schedule_all(wheel, fired)
+    wheel.advance(10)
+    wheel.clear()
+    assert len(wheel) == 0
+    wheel.advance(2000)
+    assert [delay for _, delay in fired] == [1, 3, 4, 5, 7]
+    wheel.schedule(5, fired.append, "after clear")
+    wheel.advance(2005)
+    assert fired[-1] == "after clear"
+
+def test_timer_due_now_fires_on_the_next_advance():
+    wheel = small_wheel()
+    wheel.advance(20)
+    fired = []
+    wheel.schedule(0, fired.append, "now")
+    assert fired == []
+    wheel.advance(20)
+    assert fired == ["now"]
+
+
+# --- Collision ---
+
+WIDTH, HEIGHT = 200, 100
+
+def make_sprite(group, center, size):
+    sprite = pygame.sprite.Sprite(group)
+    sprite.rect = pygame.Rect(0, 0, size, size)
+    sprite.rect.center = center
+    return sprite
+
+def build_hash(centers, size=10, wrap=True):
+    group = pygame.sprite.Group()
+    sprites = [make_sprite(group, center, size) for center in centers]
+    toroidal_hash = ToroidalHash(WIDTH, HEIGHT, cell_size=10, wrap=wrap)
+    toroidal_hash.build(group)
+    return toroidal_hash, sprites
+
+# A sprite just inside one edge and a query just inside the opposite one, overlapping only across it
+EDGE_CASES = {
+    "left": ((2, 50), (WIDTH - 3, 50)),
+    "right": ((WIDTH - 2, 50), (3, 50)),
+    "top": ((100, 2), (100, HEIGHT - 3)),
+    "bottom": ((100, HEIGHT - 2), (100, 3)),
+    "corner": ((2, 2), (WIDTH - 3, HEIGHT - 3)),
+}
+
+@pytest.mark.parametrize("edge", EDGE_CASES)
+def test_hash_finds_overlaps_across_each_wrapped_edge(edge):
+    sprite_center, query_center = EDGE_CASES[edge]
+    query = pygame.Rect(0, 0, 10, 10)
+    query.center = query_center
+    toroidal_hash, sprites = build_hash([sprite_center])
+    assert toroidal_hash.query(query) == sprites
+    plain_hash, _ = build_hash([sprite_center], wrap=False)
+    assert plain_hash.query(query) == []
+
+def test_hash_overlap_needs_the_rects_to_touch():
+    toroidal_hash, _ = build_hash([(2, 50)])
+    assert toroidal_hash.query(pygame.Rect(WIDTH - 20, 45, 10, 10)) == []
+
+# Rays aimed at the edge opposite a sprite of size 12 that pokes across it, and where they stop
+RAY_CASES = {
+    "left": ((3, 50), (150, 50), (WIDTH - 1, 50), (WIDTH - 3, 50)),
+    "right": ((WIDTH - 3, 50), (50, 50), (0, 50), (3, 50)),
+    "top": ((100, 3), (100, 60), (100, HEIGHT - 1), (100, HEIGHT - 3)),
+    "bottom": ((100, HEIGHT - 3), (100, 40), (100, 0), (100, 3)),
+}
+
+@pytest.mark.parametrize("edge", RAY_CASES)
+def test_raycast_hits_sprites_across_each_wrapped_edge(edge):
+    sprite_center, start, end, hit_point = RAY_CASES[edge]
+    toroidal_hash, sprites = build_hash([sprite_center], size=12)
+    hit, point = toroidal_hash.raycast(start, end)
+    assert hit is sprites[0]
+    assert point == pytest.approx(hit_point)
+    plain_hash, _ = build_hash([sprite_center], size=12, wrap=False)
+    assert plain_hash.raycast(start, end) == (None, end)
+
+def test_raycast_returns_the_first_sprite_along_the_ray():
+    toroidal_hash, sprites = build_hash([(150, 50), (60, 50), (100, 50)], size=10)
+    hit, point = toroidal_hash.raycast((20, 50), (190, 50))
+    assert hit is sprites[1]
+    assert point == pytest.approx((55, 50))
+    assert (hit, point) == raycast_sprites((20, 50), (190, 50), sprites)
+
+def test_raycast_skips_killed_sprites():
+    toroidal_hash, sprites = build_hash([(60, 50), (100, 50)], size=10)
+    sprites[0].kill()
+    assert toroidal_hash.raycast((20, 50), (190, 50))[0] is sprites[1]
+
+
+# --- Saves ---
+
+LAYOUTS = ("SdS", "hB", "Sq")
+TABLES = [
+    [("station", 1.5, "gold"), ("outpost", -2.25, "gold")],
+    [],
+    [("gold", 2 ** 40), ("tüngsten", -7)],
+]
+
+def test_save_tables_round_trip_through_the_string_table():
+    data = pack_tables(LAYOUTS, TABLES)
+    assert data.count(b"gold") == 1 # Stored once, referenced from both tables
+    assert unpack_tables(LAYOUTS, data) == TABLES
+
+@pytest.mark.parametrize("damage", ["truncated", "garbled"])
+def test_damaged_save_tables_raise_value_error(damage):
+    data = pack_tables(LAYOUTS, TABLES)
+    if damage == "truncated":
+        data = data[:len(data) - 5]
+    else:
+        data = data[:4] + b"\xff" * 8 + data[12:]
+    with pytest.raises(ValueError):
+        unpack_tables(LAYOUTS, data)
+
+def test_save_file_round_trip(tmp_path):
+    path = str(tmp_path / "game.sav")
+    body = pack_tables(LAYOUTS, TABLES)
+    write_save(path, b"TEST", 3, body)
+    assert read_save(path, b"TEST") == (3, body)
+    assert not os.path.exists(path + ".tmp")
+
+def test_damaged_save_file_raises_value_error(tmp_path):
+    path = str(tmp_path / "game.sav")
+    write_save(path, b"TEST", 3, b"body" * 100)
+    with pytest.raises(ValueError):
+        read_save(path, b"OTHR")
+    with open(path, "r+b") as file:
+        file.seek(10)
+        file.write(b"\x00" * 8)
+    with pytest.raises(ValueError):
+        read_save(path, b"TEST")
+
+def test_save_worker_writes_the_latest_snapshot_per_path(tmp_path):
+    paths = [str(tmp_path / "quick.sav"), str(tmp_path / "auto.sav")]
+    worker = SaveWorker(b"TEST", 1, lambda snapshot: pack_tables(LAYOUTS, snapshot))
+    worker.submit(paths[0], TABLES)
+    worker.submit(paths[1], [TABLES[0][:1], [], []])
+    worker.stop()
+    assert unpack_tables(LAYOUTS, read_save(paths[0], b"TEST")[1]) == TABLES
+    assert unpack_tables(LAYOUTS, read_save(paths[1], b"TEST")[1]) == [TABLES[0][:1], [], []]
+
+def test_save_worker_reports_a_failed_write_on_the_next_call(tmp_path):
+    worker = SaveWorker(b"TEST", 1, lambda snapshot: zlib.compress(snapshot))
+    worker.submit(str(tmp_path / "missing" / "game.sav"), b"body")
+    with pytest.raises(OSError):
+        worker.flush()
+    worker.flush() # Reported once
+    worker.stop()
+
+
+# --- Sector store ---
+
+LAYOUT = "ddHB"
+
+def open_store(path, capacity=4, side=8):
+    return SectorStore(str(path), 100, side, capacity, LAYOUT)
+
+def test_sector_store_survives_close_and_reopen(tmp_path):
+    path = tmp_path / "world.sectors"
+    store = open_store(path)
+    store.write((-4, 3), [(-350.5, 320.0, 7, 1), (-310.0, 399.5, 9, 0)])
+    store.write((0, 0), []) # Generated, but empty
+    store.close()
+
+    store = open_store(path)
+    assert store.generated == {(-4, 3), (0, 0)}
+    assert store.read((-4, 3)) == [(-350.5, 320.0, 7, 1), (-310.0, 399.5, 9, 0)]
+    assert store.read((0, 0)) == []
+    assert not store.is_generated((1, 0))
+    store.close()
+
+def test_sector_store_reset_empties_every_sector(tmp_path):
+    path = tmp_path / "world.sectors"
+    store = open_store(path)
+    store.write((2, 2), [(250.0, 250.0, 1, 0)])
+    store.reset()
+    assert store.generated == set()
+    assert store.read((2, 2)) == []
+    store.close()
+    store = open_store(path)
+    assert store.generated == set()
+    store.close()
+
+def test_sector_store_starts_over_with_other_dimensions(tmp_path):
+    path = tmp_path / "world.sectors"
+    store = open_store(path)
+    store.write((1, 1), [(150.0, 150.0, 1, 0)])
+    store.close()
+    store = open_store(path, capacity=8)
+    assert store.generated == set()
+    assert store.read((1, 1)) == []
+    store.close()
+
+def test_sector_store_geometry_and_capacity(tmp_path):
+    store = open_store(tmp_path / "world.sectors")
+    assert store.sector_at(-0.5, 399.9) == (-1, 3)
+    assert store.sector_rect((-1, 3)) == (-100, 300, 0, 400)
+    assert store.contains((-4, 3)) and not store.contains((4, 0)) and not store.contains((0, -5))
+    assert store.write((3, -4), [(float(i), 0.0, i, 0) for i in range(6)]) == 4
+    assert len(store.read((3, -4))) == 4
+    store.close()
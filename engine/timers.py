@@ -0,0 +1,112 @@
+"""
+Hierarchical timer wheel.
+
+Objects register what should happen when (a missile's death, a weapon coming off cooldown) and the
+wheel calls it once its tick comes, so nothing has to poll every object every frame for expiry.
+Time is counted in integer ticks of whatever clock the game drives the wheel with: frames in
+spacinator, pygame.time.get_ticks() milliseconds in space_exp.
+"""
+import math
+
+WHEEL_SLOT_BITS = 8 # Each level of the wheel has 2 ** WHEEL_SLOT_BITS slots
+WHEEL_LEVELS = 4 # Levels of the wheel; timers further out than 2 ** (bits * levels) ticks wait in the last level
+
+class Timer:
+    """A scheduled callback. cancel() keeps it from firing."""
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class TimerWheel:
+    """
+    Level 0 of the wheel holds the timers due within one rotation, one slot per tick. Each higher
+    level holds timers further out, one slot per rotation of the level below, and a slot is
+    cascaded down into the lower levels when that level's rotation comes round. Scheduling and
+    cancelling are O(1), and advancing skips over rotations with no timers in them.
+    """
+    def __init__(self, now=0, slot_bits=WHEEL_SLOT_BITS, levels=WHEEL_LEVELS):
+        self.now = now # Current tick
+        self.slot_bits = slot_bits
+        self.mask = (1 << slot_bits) - 1
+        self.wheels = [[[] for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self.counts = [0] * levels # Timers per level, including cancelled ones not yet dropped
+        self.due = [] # Timers scheduled for a tick that has already been processed
+
+    def __len__(self):
+        return sum(self.counts) + len(self.due)
+
+    def schedule(self, delay, callback, *args):
+        """Calls callback(*args) delay ticks from now, rounded up to a whole tick. Returns the Timer."""
+        timer = Timer(self.now + max(0, math.ceil(delay)), callback, args)
+        self.insert(timer)
+        return timer
+
+    def insert(self, timer):
+        delta = timer.deadline - self.now
+        if delta <= 0:
+            self.due.append(timer) # Its tick was already processed, so it fires on the next advance
+            return
+        for level in range(len(self.wheels)):
+            if delta >> (self.slot_bits * (level + 1)) == 0 or level == len(self.wheels) - 1:
+                self.wheels[level][(timer.deadline >> (self.slot_bits * level)) & self.mask].append(timer)
+                self.counts[level] += 1
+                return
+
+    def clear(self):
+        """Drops every timer."""
+        for level, wheel in enumerate(self.wheels):
+            for slot in wheel:
+                slot.clear()
+            self.counts[level] = 0
+        self.due = []
+
+    def advance(self, now):
+        """Moves the wheel on to tick now, firing every timer due by then in deadline order."""
+        now = int(now)
+        due, self.due = self.due, []
+        self.fire(due)
+        while self.now < now:
+            if not any(self.counts):
+                self.now = now
+                break
+            # Skip the ticks before the next one that can hold a timer: with the lowest levels
+            # empty, that is the start of the next rotation of the lowest level with timers
+            level = next(level for level, count in enumerate(self.counts) if count)
+            if level:
+                span = self.slot_bits * level
+                self.now = min(now, ((self.now >> span) + 1) << span) - 1
+            self.now += 1
+            # Cascade the levels whose rotation starts at this tick, highest first
+            level = 1
+            while level < len(self.wheels) and self.now & ((1 << (self.slot_bits * level)) - 1) == 0:
+                level += 1
+            for level in range(level - 1, 0, -1):
+                slot = self.wheels[level][(self.now >> (self.slot_bits * level)) & self.mask]
+                self.wheels[level][(self.now >> (self.slot_bits * level)) & self.mask] = []
+                self.counts[level] -= len(slot)
+                for timer in slot:
+                    if timer.cancelled:
+                        continue
+                    if timer.deadline <= self.now: # Due this very tick, which is fired below
+                        self.wheels[0][self.now & self.mask].append(timer)
+                        self.counts[0] += 1
+                    else:
+                        self.insert(timer)
+            slot = self.wheels[0][self.now & self.mask]
+            if slot:
+                self.wheels[0][self.now & self.mask] = []
+                self.counts[0] -= len(slot)
+                self.fire(slot)
+
+    def fire(self, timers):
+        for timer in timers:
+            if not timer.cancelled:
+                timer.cancelled = True # Fired, so a later cancel() is harmless
+                timer.callback(*timer.args)
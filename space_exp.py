@@ -1,6 +1,15 @@
 import pygame
 import math
+import os
 import random
+import threading
+import weakref
+from collections import OrderedDict, deque, namedtuple
+
+from engine import TimerWheel, IndexedGroup, TextCache, HudText, HudBar, StampCache, SpriteAtlas
+from engine import Entity, Game, run, turn_towards
+from engine import SaveWorker, pack_tables, unpack_tables, read_save
+from engine import SectorStore
 
 # --- Pygame Initialization ---
 pygame.init()
@@ -8,8 +17,34 @@ pygame.init()
 # --- Screen Dimensions ---
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Star Citizen Lite")
+DISPLAY_SCALED = False # Let SDL scale the SCREEN_WIDTH x SCREEN_HEIGHT frame up to the window in hardware (pygame.SCALED)
+DISPLAY_FULLSCREEN = False # Fullscreen; with DISPLAY_SCALED the frame is scaled to the desktop resolution
+RENDER_SCALE = 1.0 # The world is drawn at this fraction of the screen resolution and scaled up; the UI stays sharp
+WORLD_RENDER_SIZE = (max(1, int(SCREEN_WIDTH * RENDER_SCALE)), max(1, int(SCREEN_HEIGHT * RENDER_SCALE)))
+RENDER_BACKEND = "surface" # "surface": Surface blits and pygame.transform; "texture": SDL2 Renderer, scaled and rotated at copy time
+
+RENDERER = None # SDL2 Renderer of the game window, only with the texture backend
+if RENDER_BACKEND == "texture":
+    try:
+        from pygame._sdl2.video import Renderer, Texture, Window
+    except ImportError:
+        print("pygame._sdl2 is not available, using the surface render backend.")
+        RENDER_BACKEND = "surface"
+
+if RENDER_BACKEND == "texture":
+    # A renderer can't share the display module's window, so that one only stays around (hidden)
+    # to give Surface.convert() its pixel format. The world is drawn straight through RENDERER,
+    # SCREEN becomes a transparent UI layer that is composited on top once per frame.
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    WINDOW = Window("Star Citizen Lite", (SCREEN_WIDTH, SCREEN_HEIGHT), resizable=DISPLAY_SCALED, fullscreen_desktop=DISPLAY_FULLSCREEN)
+    RENDERER = Renderer(WINDOW)
+    RENDERER.logical_size = (SCREEN_WIDTH, SCREEN_HEIGHT) # The renderer does the scaling to the window, like pygame.SCALED
+    SCREEN = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    SCREEN.fill((0, 0, 0, 0))
+else:
+    SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                     (pygame.SCALED if DISPLAY_SCALED else 0) | (pygame.FULLSCREEN if DISPLAY_FULLSCREEN else 0))
+    pygame.display.set_caption("Star Citizen Lite")
 
 # --- Colors ---
 WHITE = (255, 255, 255)
@@ -253,6 +288,16 @@ BUTTON_FONT = pygame.font.Font(None, 30)
 
 # --- UI Constants ---
 BUTTON_PRESS_COOLDOWN = 200 # Milliseconds to prevent double-clicking
+MENU_HIT_ROW_HEIGHT = 40 # Height of the horizontal bands menu buttons are bucketed into for hit testing
+
+# --- Minimap Constants ---
+MINIMAP_SIZE = 120 # Width and height of the minimap in pixels
+MINIMAP_WORLD_SCALE = 25 # World units per minimap pixel
+MINIMAP_WORLD_EXTENT = 7000 # The cached static texture covers extent world units each way from where it was last centered
+MINIMAP_MARGIN = 10 # Distance from the bottom-right corner of the screen
+MINIMAP_BG_COLOR = (5, 5, 20) # Very dark blue
+MINIMAP_BORDER_COLOR = (150, 150, 150) # Gray
+SPATIAL_GRID_CELL_SIZE = 500 # World units per spatial index cell
 
 # --- Engine Constants ---
 ENGINE_TYPES = {
@@ -321,6 +366,743 @@ WEAPON_TYPES = {
 HOMING_MISSILE_LIFETIME = 5000 # milliseconds
 SWARM_ROCKET_LIFETIME = 4000 # milliseconds (slightly shorter for swarm)
 
+# --- Render Cache Constants ---
+OVERLAY_CACHE_MAX_PIXELS = 24000000 # Pixel budget for cached translucent overlays (~96 MB at 32 bits per pixel)
+PROXIMITY_PULSE_STEPS = 3 # Number of pre-rendered radii the proximity ring pulses between
+PROXIMITY_COLOR_LEVELS = 8 # Proximity ratio is quantized into this many color/thickness levels
+TEXT_CACHE_MAX_ENTRIES = 256 # Maximum number of rendered text surfaces kept around
+TEXT_ALPHA_STEP = 16 # Text alpha is quantized to multiples of this so fading labels still hit the cache
+STAMP_CACHE_MAX_ENTRIES = 1024 # Maximum number of pre-scaled (and pre-rotated) sprite stamps kept around
+STATIC_TILE_SIZE = 512 # Screen-space size (pixels) of a cached static world tile
+STATIC_TILE_CACHE_MAX_TILES = 48 # Maximum number of non-empty static tiles kept (~1 MB each)
+RENDER_THREAD_ENABLED = False # Draw the world on a background thread while the next tick simulates
+SPRITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sprites") # PNG sprites shipped with the game
+SPRITE_ATLAS_SIZE = 1024 # Edge length of the atlas page scaled sprites are packed into
+
+# --- Level of Detail Constants ---
+LOD_ZOOM_THRESHOLD = 0.5 # Below this zoom factor (the jump drive view) entities are drawn as impostors
+LOD_MARKER_SIZE = 2 # Edge length in pixels of projectile and drop markers, and the smallest asteroid disc
+LOD_ICON_SIZE = 7 # Edge length in pixels of the unrotated enemy and mining NPC icons
+
+# --- Quality Governor Constants ---
+QUALITY_FRAME_BUDGET_MS = 1000 / FPS # Work time per frame we aim for (the frame rate cap's budget)
+QUALITY_DOWNGRADE_RATIO = 0.9 # Lower quality when the average frame time exceeds this share of the budget
+QUALITY_UPGRADE_RATIO = 0.5 # Raise quality again when the average frame time drops below this share
+QUALITY_SAMPLE_FRAMES = 60 # Number of recent frames averaged before deciding
+QUALITY_CHANGE_COOLDOWN = 2000 # Milliseconds between quality level changes, avoids flip-flopping
+QUALITY_LEVELS = [ # Lowest first; the governor moves one level at a time
+    {"name": "Low", "proximity_pulse": False, "ping_beams": False, "asteroid_health_bars": False,
+     "rotation_step": 15, "overlay_alpha": False, "zoomed_out_detail": False},
+    {"name": "Medium", "proximity_pulse": False, "ping_beams": True, "asteroid_health_bars": True,
+     "rotation_step": 5, "overlay_alpha": True, "zoomed_out_detail": False},
+    {"name": "High", "proximity_pulse": True, "ping_beams": True, "asteroid_health_bars": True,
+     "rotation_step": 0, "overlay_alpha": True, "zoomed_out_detail": True}, # rotation_step 0 = exact angles
+]
+
+# --- Save Game Constants ---
+SAVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "savegame.sav") # Quick save, written by F5 and read by F9
+AUTOSAVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "autosave.sav") # Written by the autosave, read by Shift+F9
+SAVE_MAGIC = b"SPXS" # First bytes of a space_exp save file
+SAVE_VERSION = 2 # Bumped whenever SAVE_TABLES changes; saves of other versions are refused
+AUTOSAVE_INTERVAL = 60000 # Milliseconds between autosaves
+
+# --- World Sector Constants ---
+SECTOR_STORE_ENABLED = False # Keep the general asteroid field in a memory-mapped sector store instead of respawning it around the player
+SECTOR_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "world.sectors") # Kept between sessions; saves carry its generated sectors
+SECTOR_SIZE = 1000 # World units per sector edge
+SECTOR_GRID_SIDE = 256 # Sectors per world edge, so the field spans SECTOR_SIZE * SECTOR_GRID_SIDE units centered on the origin
+SECTOR_CAPACITY = 32 # Asteroid records a sector has room for
+SECTOR_MIN_ASTEROIDS = 4 # Asteroids generated in a sector the first time it comes near the player
+SECTOR_MAX_ASTEROIDS = 10
+SECTOR_LOAD_RADIUS = 1 # Sectors around the player's sector kept as live sprites (1 = a 3x3 block, reaching past WORLD_CULL_DISTANCE)
+SECTOR_ASTEROID_LAYOUT = "ddHHdB" # x, y, size, resources, health, type code (0 = regular, 1 = stealth)
+
+
+# --- Render Caches ---
+
+class OverlayCache:
+    """
+    Caches translucent circle overlays (safezones, mining zones, proximity rings).
+    Overlays are keyed by (radius, color, thickness), where radius is already scaled by
+    the current zoom factor, so a surface is only regenerated when one of these changes.
+    Least recently used overlays are evicted once the pixel budget is exceeded.
+    """
+    def __init__(self, max_pixels=OVERLAY_CACHE_MAX_PIXELS):
+        self.lock = threading.Lock() # Shared by the main and render threads
+        self.max_pixels = max_pixels
+        self.total_pixels = 0
+        self.surfaces = OrderedDict() # {(radius, color, thickness): pygame.Surface}
+
+    def get_circle(self, radius, color, thickness=0):
+        """
+        Returns a cached SRCALPHA surface of size (radius * 2, radius * 2) with the circle drawn into it.
+        thickness=0 draws a filled circle, anything else draws an outline of that width.
+        """
+        with self.lock:
+            key = (radius, color, thickness)
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key) # Mark as most recently used
+                return surface
+
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius, radius), radius, thickness)
+            self.surfaces[key] = surface
+            self.total_pixels += surface.get_width() * surface.get_height()
+
+            # Evict least recently used overlays, but always keep the one just created
+            while self.total_pixels > self.max_pixels and len(self.surfaces) > 1:
+                _, old_surface = self.surfaces.popitem(last=False)
+                self.total_pixels -= old_surface.get_width() * old_surface.get_height()
+            return surface
+
+    def blit_circle(self, screen, center, radius, color, thickness=0):
+        """Blits a cached circle overlay centered on the given screen position."""
+        if radius <= 0:
+            return
+        surface = self.get_circle(radius, color, thickness)
+        screen.blit(surface, surface.get_rect(center=center))
+
+    def clear(self):
+        """Drops all cached overlays."""
+        with self.lock:
+            self.surfaces.clear()
+            self.total_pixels = 0
+
+OVERLAY_CACHE = OverlayCache() # Shared by the GameManager and MiningSafezone draw code
+TEXT_CACHE = TextCache(TEXT_CACHE_MAX_ENTRIES, TEXT_ALPHA_STEP)
+STAMP_CACHE = StampCache(STAMP_CACHE_MAX_ENTRIES)
+SPRITE_ATLAS = SpriteAtlas(SPRITE_DIR, SPRITE_ATLAS_SIZE)
+
+class EffectsLayer:
+    """
+    A single reusable SRCALPHA overlay that translucent effects (ping rings, ping beams,
+    radar markers) are drawn into during a frame. Only the area touched this frame is
+    composited onto the screen and cleared again, so any number of beams costs one bounded blit.
+    """
+    def __init__(self, size):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.dirty_rects = [] # Bounding rects of everything drawn since the last present()
+
+    def line(self, color, start_pos, end_pos, width=1):
+        """Draws a line into the layer, color may include alpha."""
+        self.dirty_rects.append(pygame.draw.line(self.surface, color, start_pos, end_pos, width))
+
+    def circle(self, color, center, radius, width=0):
+        """Draws a circle (or ring if width > 0) into the layer, color may include alpha."""
+        self.dirty_rects.append(pygame.draw.circle(self.surface, color, center, radius, width))
+
+    def present(self, screen):
+        """Blits the dirty area of the layer onto the screen and clears it for the next frame."""
+        if not self.dirty_rects:
+            return
+        dirty_rect = self.dirty_rects[0].unionall(self.dirty_rects[1:]).clip(self.surface.get_rect())
+        if dirty_rect.width > 0 and dirty_rect.height > 0:
+            screen.blit(self.surface, dirty_rect.topleft, dirty_rect)
+            self.surface.fill((0, 0, 0, 0), dirty_rect)
+        self.dirty_rects.clear()
+
+class StaticWorldLayer:
+    """
+    Static world content (safezones, station, outpost, planets, enemy base body) pre-rendered
+    into world-aligned tiles per zoom level. Each frame only the visible tiles are blitted;
+    tiles are re-rendered only after invalidate() is called for the area that changed.
+    """
+    def __init__(self, draw_static, tile_size=STATIC_TILE_SIZE, max_tiles=STATIC_TILE_CACHE_MAX_TILES):
+        self.draw_static = draw_static # Callable(surface, camera_x, camera_y, zoom_factor, world_rect, static_world) -> bool
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.tiles = OrderedDict() # (zoom_factor, tile_x, tile_y) -> Surface, or None for empty tiles
+        self.tile_count = 0 # Number of non-empty tiles held
+
+    def get_tile_world_rect(self, zoom_factor, tile_x, tile_y):
+        """Returns the world-space area covered by a tile at the given zoom level."""
+        world_tile_size = self.tile_size / zoom_factor
+        left = math.floor(tile_x * world_tile_size)
+        top = math.floor(tile_y * world_tile_size)
+        return pygame.Rect(left, top, math.ceil(world_tile_size) + 1, math.ceil(world_tile_size) + 1)
+
+    def get_tile(self, zoom_factor, tile_x, tile_y, static_world):
+        """Returns the rendered tile surface (None if the tile is empty), rendering it on a miss."""
+        key = (zoom_factor, tile_x, tile_y)
+        if key in self.tiles:
+            self.tiles.move_to_end(key)
+            return self.tiles[key]
+
+        world_tile_size = self.tile_size / zoom_factor
+        # Opaque tile on the black background, so overlapping translucent overlays blend as before
+        tile = pygame.Surface((self.tile_size, self.tile_size)).convert()
+        tile.fill(BLACK)
+        drawn = self.draw_static(tile, tile_x * world_tile_size, tile_y * world_tile_size, zoom_factor,
+                                 self.get_tile_world_rect(zoom_factor, tile_x, tile_y), static_world)
+        if not drawn:
+            tile = None # Empty space is by far the most common tile, don't keep a surface for it
+        else:
+            self.tile_count += 1
+        self.tiles[key] = tile
+
+        while self.tile_count > self.max_tiles:
+            _, evicted = self.tiles.popitem(last=False)
+            if evicted is not None:
+                self.tile_count -= 1
+        return tile
+
+    def invalidate(self, world_rect=None):
+        """Drops the cached tiles overlapping world_rect (or every tile) so they are re-rendered."""
+        if world_rect is None:
+            self.tiles.clear()
+            self.tile_count = 0
+            return
+        for key in [key for key in self.tiles if self.get_tile_world_rect(*key).colliderect(world_rect)]:
+            if self.tiles.pop(key) is not None:
+                self.tile_count -= 1
+
+    def draw(self, screen, camera_x, camera_y, zoom_factor, static_world):
+        """Blits the tiles covering the visible part of the world, rendering missing tiles from static_world."""
+        world_tile_size = self.tile_size / zoom_factor
+        screen_width, screen_height = screen.get_size()
+        first_tile_x = math.floor(camera_x / world_tile_size)
+        first_tile_y = math.floor(camera_y / world_tile_size)
+        last_tile_x = math.floor((camera_x + screen_width / zoom_factor) / world_tile_size)
+        last_tile_y = math.floor((camera_y + screen_height / zoom_factor) / world_tile_size)
+
+        for tile_y in range(first_tile_y, last_tile_y + 1):
+            for tile_x in range(first_tile_x, last_tile_x + 1):
+                tile = self.get_tile(zoom_factor, tile_x, tile_y, static_world)
+                if tile is not None:
+                    screen.blit(tile, (int(tile_x * self.tile_size - camera_x * zoom_factor),
+                                       int(tile_y * self.tile_size - camera_y * zoom_factor)))
+
+
+class Minimap:
+    """
+    HUD minimap centered on the player. Static world content and the sprites of a SpatialGrid
+    (e.g. asteroids) come from a low-resolution cached texture; grid cells are re-rendered into
+    it only when their contents change. The texture is centered on the player and re-centered
+    once the view would run past its edge. Moving objects are drawn as points on top each frame.
+    """
+    def __init__(self, draw_static, grid, grid_point_color, size=MINIMAP_SIZE, world_scale=MINIMAP_WORLD_SCALE, world_extent=MINIMAP_WORLD_EXTENT):
+        self.draw_static = draw_static # Callable(surface, camera_x, camera_y, zoom_factor, world_rect) -> bool
+        self.grid = grid
+        self.grid_point_color = grid_point_color # Callable(sprite) -> color, or None to leave the sprite off the map
+        self.size = size
+        self.world_scale = world_scale
+        self.world_extent = world_extent
+        self.world_range = size * world_scale / 2 # World units visible from the center to the edge
+        self.origin_x = 0 # World position of the texture's top-left corner
+        self.origin_y = 0
+        self.static_texture = None # Static world content only
+        self.texture = None # Static texture plus the grid sprites
+        self.rendered_versions = {} # Grid cell -> cell version currently drawn into self.texture
+        self.frame = pygame.Surface((size, size))
+
+    def invalidate(self):
+        """Drops the cached textures so they are re-rendered on the next draw."""
+        self.static_texture = None
+        self.texture = None
+        self.rendered_versions.clear()
+
+    def world_to_texture(self, world_x, world_y):
+        return (int((world_x - self.origin_x) / self.world_scale), int((world_y - self.origin_y) / self.world_scale))
+
+    def covers(self, center_x, center_y):
+        """Checks if the texture covers the whole view around (center_x, center_y)."""
+        texture_extent = self.world_extent * 2
+        return (self.origin_x <= center_x - self.world_range and center_x + self.world_range <= self.origin_x + texture_extent and
+                self.origin_y <= center_y - self.world_range and center_y + self.world_range <= self.origin_y + texture_extent)
+
+    def get_texture(self, center_x, center_y):
+        """
+        Returns the minimap texture for a view around (center_x, center_y), rendering the static
+        world content into it if needed. Once the view leaves the texture it is rendered again,
+        centered on the view; the drawn cells start over with it, so only cells on the texture are tracked.
+        """
+        if self.texture is not None and not self.covers(center_x, center_y):
+            self.invalidate()
+        if self.texture is None:
+            # Snapped to grid cells, so every cell covers the same texture pixels
+            cell_size = self.grid.cell_size
+            self.origin_x = round((center_x - self.world_extent) / cell_size) * cell_size
+            self.origin_y = round((center_y - self.world_extent) / cell_size) * cell_size
+            texture_size = int(self.world_extent * 2 / self.world_scale)
+            self.static_texture = pygame.Surface((texture_size, texture_size)).convert()
+            self.static_texture.fill(MINIMAP_BG_COLOR)
+            world_rect = pygame.Rect(self.origin_x, self.origin_y, self.world_extent * 2, self.world_extent * 2)
+            self.draw_static(self.static_texture, self.origin_x, self.origin_y, 1 / self.world_scale, world_rect)
+            self.texture = self.static_texture.copy()
+        return self.texture
+
+    def render_cell(self, cell):
+        """Redraws one grid cell of the texture: static background first, then the cell's sprites."""
+        left, top = self.world_to_texture(cell[0] * self.grid.cell_size, cell[1] * self.grid.cell_size)
+        right, bottom = self.world_to_texture((cell[0] + 1) * self.grid.cell_size, (cell[1] + 1) * self.grid.cell_size)
+        cell_rect = pygame.Rect(left, top, right - left, bottom - top)
+        self.texture.blit(self.static_texture, cell_rect, cell_rect)
+        self.texture.set_clip(cell_rect) # Dots on the cell border must not bleed into neighbouring cells
+        for sprite in self.grid.cells.get(cell, ()):
+            color = self.grid_point_color(sprite)
+            if color:
+                point_x, point_y = self.world_to_texture(sprite.x, sprite.y)
+                self.texture.fill(color, (point_x - 1, point_y - 1, 2, 2))
+        self.texture.set_clip(None)
+
+    def draw(self, screen, pos, center_x, center_y, points):
+        """
+        Draws the minimap centered on (center_x, center_y) with its top-left corner at pos.
+        points is an iterable of (world_x, world_y, color) drawn as small dots.
+        """
+        texture = self.get_texture(center_x, center_y)
+
+        # Bring the visible grid cells up to date, only cells whose contents changed are redrawn
+        first_x, first_y = self.grid.get_cell(center_x - self.world_range, center_y - self.world_range)
+        last_x, last_y = self.grid.get_cell(center_x + self.world_range, center_y + self.world_range)
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                version = self.grid.cell_versions.get((cell_x, cell_y), 0)
+                if self.rendered_versions.get((cell_x, cell_y), 0) != version:
+                    self.render_cell((cell_x, cell_y))
+                    self.rendered_versions[(cell_x, cell_y)] = version
+
+        self.frame.fill(MINIMAP_BG_COLOR)
+        # One area blit from the texture; SDL clips the area at the texture's edges
+        texture_x, texture_y = self.world_to_texture(center_x - self.world_range, center_y - self.world_range)
+        self.frame.blit(texture, (0, 0), pygame.Rect(texture_x, texture_y, self.size, self.size))
+
+        left = center_x - self.world_range
+        top = center_y - self.world_range
+        for world_x, world_y, color in points:
+            point_x = int((world_x - left) / self.world_scale)
+            point_y = int((world_y - top) / self.world_scale)
+            if 0 <= point_x < self.size and 0 <= point_y < self.size:
+                self.frame.fill(color, (point_x - 1, point_y - 1, 2, 2))
+
+        self.frame.fill(WHITE, (self.size // 2 - 1, self.size // 2 - 1, 3, 3)) # Player marker
+        pygame.draw.rect(self.frame, MINIMAP_BORDER_COLOR, self.frame.get_rect(), 1)
+        screen.blit(self.frame, pos)
+
+
+class QualityGovernor:
+    """
+    Watches recent frame times and steps the render quality down one level when frames run
+    over budget, and back up once there is headroom again. The current level's settings
+    (see QUALITY_LEVELS) are read by the world pass through the render snapshot.
+    """
+    def __init__(self, levels=QUALITY_LEVELS, budget_ms=QUALITY_FRAME_BUDGET_MS, downgrade_ratio=QUALITY_DOWNGRADE_RATIO,
+                 upgrade_ratio=QUALITY_UPGRADE_RATIO, sample_frames=QUALITY_SAMPLE_FRAMES, change_cooldown=QUALITY_CHANGE_COOLDOWN):
+        self.levels = levels
+        self.budget_ms = budget_ms
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.change_cooldown = change_cooldown
+        self.level = len(levels) - 1 # Start at the highest quality
+        self.frame_times = deque(maxlen=sample_frames)
+        self.last_change_time = 0
+
+    @property
+    def settings(self):
+        return self.levels[self.level]
+
+    @property
+    def name(self):
+        return self.settings["name"]
+
+    def is_highest(self):
+        return self.level == len(self.levels) - 1
+
+    def record_frame(self, frame_time_ms, current_time):
+        """Records how long the last frame's work took and adjusts the quality level if needed."""
+        self.frame_times.append(frame_time_ms)
+        if len(self.frame_times) < self.frame_times.maxlen or current_time - self.last_change_time < self.change_cooldown:
+            return
+
+        average_frame_time = sum(self.frame_times) / len(self.frame_times)
+        if average_frame_time > self.budget_ms * self.downgrade_ratio and self.level > 0:
+            self.level -= 1
+        elif average_frame_time < self.budget_ms * self.upgrade_ratio and not self.is_highest():
+            self.level += 1
+        else:
+            return
+        self.last_change_time = current_time
+        self.frame_times.clear() # Judge the new level on its own frames
+        print(f"Render quality set to {self.name} (average frame time {average_frame_time:.1f} ms, budget {self.budget_ms:.1f} ms)")
+
+
+# --- Retained Menus ---
+class MenuButton:
+    """
+    A station menu button. Its normal, hover and active looks are each rendered once on
+    first use and reused afterwards. Labels wider than the button overhang it, as before.
+    """
+    LOOK_COLORS = {"normal": BUTTON_COLOR, "hover": BUTTON_HOVER_COLOR, "active": ACTIVE_BUTTON_COLOR}
+
+    def __init__(self, text, rect, action, is_active=None):
+        self.text = text
+        self.rect = rect # Screen rect used for hit testing
+        self.action = action
+        self.is_active = is_active # Optional callable, True while this button's option is selected
+        self.text_surface = TEXT_CACHE.render(BUTTON_FONT, text, WHITE)
+        self.bounds = rect.union(self.text_surface.get_rect(center=rect.center)) # Area the looks cover
+        self.looks = {} # Look name -> Surface the size of self.bounds
+
+    def get_look(self, look):
+        surface = self.looks.get(look)
+        if surface is None:
+            surface = pygame.Surface(self.bounds.size, pygame.SRCALPHA)
+            button_rect = self.rect.move(-self.bounds.x, -self.bounds.y)
+            pygame.draw.rect(surface, self.LOOK_COLORS[look], button_rect, border_radius=5)
+            pygame.draw.rect(surface, WHITE, button_rect, 2, border_radius=5) # Border
+            surface.blit(self.text_surface, self.text_surface.get_rect(center=button_rect.center))
+            self.looks[look] = surface
+        return surface
+
+class RetainedMenu:
+    """
+    A full-screen station or outpost menu built once. The dimmed backdrop, title and static
+    text are rendered into a background surface. The composed menu (background, button looks,
+    live labels) is only rebuilt when the hovered button, an active flag or a label value
+    changes, so an idle menu costs a single blit per frame.
+    """
+    def __init__(self, title, backdrop_alpha=200, title_y=SCREEN_HEIGHT // 2 - 150):
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.background.fill((0, 0, 0, backdrop_alpha))
+        self.surface = self.background
+        self.buttons = []
+        self.labels = [] # (HudText, callable returning its values, rect anchor name, anchor position)
+        self.widgets = [] # Buttons and labels in the order they were added, which is the order they are drawn in
+        self.hit_rows = {} # Row index (y // MENU_HIT_ROW_HEIGHT) -> buttons overlapping that row
+        self.state = None # Hovered button, active flags and label values the surface was composed for
+        self.add_text(LARGE_FONT, title, WHITE, center=(SCREEN_WIDTH // 2, title_y))
+
+    def add_text(self, font, text, color, **anchor):
+        """Renders static text into the background, positioned by a rect anchor (e.g. center=(x, y))."""
+        text_surface = TEXT_CACHE.render(font, text, color)
+        self.background.blit(text_surface, text_surface.get_rect(**anchor))
+
+    def add_label(self, font, text_format, color, get_values, **anchor):
+        """Adds a live label; get_values returns the tuple of values formatted into it."""
+        ((anchor_name, anchor_pos),) = anchor.items()
+        label = (HudText(font, text_format, color), get_values, anchor_name, anchor_pos)
+        self.labels.append(label)
+        self.widgets.append(label)
+
+    def add_button(self, text, x, y, width, height, action, is_active=None):
+        button = MenuButton(text, pygame.Rect(x, y, width, height), action, is_active)
+        self.buttons.append(button)
+        self.widgets.append(button)
+        for row in range(button.rect.top // MENU_HIT_ROW_HEIGHT, (button.rect.bottom - 1) // MENU_HIT_ROW_HEIGHT + 1):
+            self.hit_rows.setdefault(row, []).append(button)
+
+    def hit_test(self, pos):
+        """Returns the button under the screen position pos, or None."""
+        for button in self.hit_rows.get(pos[1] // MENU_HIT_ROW_HEIGHT, ()):
+            if button.rect.collidepoint(pos):
+                return button
+        return None
+
+    def get_clicked_action(self, pos):
+        """Returns the action name of the button under pos, or None."""
+        button = self.hit_test(pos)
+        return button.action if button else None
+
+    def draw(self, screen, mouse_pos):
+        hovered = self.hit_test(mouse_pos)
+        active_flags = tuple(bool(button.is_active and button.is_active()) for button in self.buttons)
+        label_values = tuple(get_values() for _, get_values, _, _ in self.labels)
+        state = (hovered, active_flags, label_values)
+        if state != self.state:
+            self.state = state
+            self.surface = self.background.copy()
+            active_by_button = dict(zip(self.buttons, active_flags))
+            values_by_label = dict(zip(map(id, self.labels), label_values))
+            for widget in self.widgets:
+                if isinstance(widget, MenuButton):
+                    look = "active" if active_by_button[widget] else "hover" if widget is hovered else "normal"
+                    self.surface.blit(widget.get_look(look), widget.bounds)
+                else:
+                    hud_text, _, anchor_name, anchor_pos = widget
+                    label_surface = hud_text.get_surface(*values_by_label[id(widget)])
+                    self.surface.blit(label_surface, label_surface.get_rect(**{anchor_name: anchor_pos}))
+        screen.blit(self.surface, (0, 0))
+
+
+# --- Render Backends ---
+class SurfaceCanvas:
+    """
+    The draw API of the world pass on a plain Surface (the screen, the reduced resolution world
+    target or a render thread buffer). Sprites are scaled and rotated by pygame.transform into cached stamps.
+    """
+    def __init__(self, surface):
+        self.surface = surface
+
+    def get_size(self):
+        return self.surface.get_size()
+
+    def clear(self):
+        """Clears the canvas to the background color."""
+        self.surface.fill(BLACK)
+
+    def blit(self, image, dest, area=None):
+        self.surface.blit(image, dest, area)
+
+    def blits(self, blit_sequence):
+        self.surface.blits(blit_sequence, doreturn=False)
+
+    def fill(self, color, rect):
+        self.surface.fill(color, rect)
+
+    def line(self, color, start_pos, end_pos, width=1):
+        pygame.draw.line(self.surface, color, start_pos, end_pos, width)
+
+    def circle(self, color, center, radius, width=0):
+        """Draws an opaque circle (or ring if width > 0)."""
+        pygame.draw.circle(self.surface, color, center, radius, width)
+
+    def draw_scaled(self, image, center, size):
+        """Draws image stretched to size, centered on center."""
+        scaled_image = pygame.transform.scale(image, size)
+        self.surface.blit(scaled_image, scaled_image.get_rect(center=center))
+
+    def draw_sprite(self, key, image, center, zoom_factor, angle, rotation_step=0):
+        """
+        Draws image scaled by zoom_factor and rotated by angle, centered on center.
+        key identifies the look for the stamp cache, rotation_step snaps the angle (see get_rotated_stamp).
+        """
+        stamp = GameManager.get_rotated_stamp(key, image, angle, zoom_factor, rotation_step)
+        if stamp:
+            self.surface.blit(stamp, stamp.get_rect(center=center))
+
+class TextureCanvas:
+    """
+    The draw API of the world pass on the SDL2 Renderer, drawing to the window or to a target texture.
+    Each Surface is uploaded once into a texture kept for as long as the Surface lives, so drawn
+    images must not be changed in place. Scaling and rotation happen when a texture is copied.
+    """
+    def __init__(self, renderer, target=None):
+        self.renderer = renderer
+        self.target = target # Texture created with target=True, or None to draw to the window
+        self.textures = weakref.WeakKeyDictionary() # Surface -> Texture
+
+    def get_size(self):
+        if self.target is not None:
+            return (self.target.width, self.target.height)
+        return (SCREEN_WIDTH, SCREEN_HEIGHT) # The renderer's logical size
+
+    def get_texture(self, image):
+        texture = self.textures.get(image)
+        if texture is None:
+            texture = self.textures[image] = Texture.from_surface(self.renderer, image)
+        return texture
+
+    def clear(self):
+        """Makes this canvas the render target and clears it to the background color."""
+        self.renderer.target = self.target
+        self.renderer.draw_color = pygame.Color(BLACK) # The renderer wants RGBA
+        self.renderer.clear()
+
+    def blit(self, image, dest, area=None):
+        if area is not None: # Part of a layer that is redrawn every frame (the effects layer), uploaded each time
+            image = image.subsurface(area)
+            if image.get_width() and image.get_height():
+                Texture.from_surface(self.renderer, image).draw(dstrect=(dest[0], dest[1]))
+        elif image.get_width() and image.get_height(): # Textures can't be empty, and an empty Surface draws nothing anyway
+            self.get_texture(image).draw(dstrect=(dest[0], dest[1]))
+
+    def blits(self, blit_sequence):
+        for image, dest in blit_sequence:
+            self.blit(image, dest)
+
+    def fill(self, color, rect):
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.fill_rect(rect)
+
+    def line(self, color, start_pos, end_pos, width=1):
+        """Draws a line, wider lines as parallel one pixel lines offset the way pygame.draw.line does."""
+        self.renderer.draw_color = pygame.Color(color)
+        steep = abs(end_pos[1] - start_pos[1]) > abs(end_pos[0] - start_pos[0])
+        for offset in range(-((width - 1) // 2), width // 2 + 1):
+            offset_x, offset_y = (offset, 0) if steep else (0, offset)
+            self.renderer.draw_line((start_pos[0] + offset_x, start_pos[1] + offset_y), (end_pos[0] + offset_x, end_pos[1] + offset_y))
+
+    def circle(self, color, center, radius, width=0):
+        """Draws an opaque circle (or ring if width > 0), from the overlay cache since the renderer has no circles."""
+        if radius > 0:
+            self.blit(OVERLAY_CACHE.get_circle(radius, color, width), (center[0] - radius, center[1] - radius))
+
+    def draw_scaled(self, image, center, size):
+        """Draws image stretched to size, centered on center."""
+        draw_rect = pygame.Rect((0, 0), size)
+        draw_rect.center = center
+        self.get_texture(image).draw(dstrect=draw_rect)
+
+    def draw_sprite(self, key, image, center, zoom_factor, angle, rotation_step=0):
+        """
+        Draws image scaled by zoom_factor and rotated by angle, centered on center. The renderer
+        rotates exactly and needs no stamps, so key and rotation_step are not used.
+        """
+        scaled_size = (int(image.get_width() * zoom_factor), int(image.get_height() * zoom_factor))
+        if scaled_size[0] <= 0 or scaled_size[1] <= 0:
+            return
+        draw_rect = pygame.Rect((0, 0), scaled_size)
+        draw_rect.center = center
+        self.get_texture(image).draw(dstrect=draw_rect, angle=-angle) # pygame.transform.rotate turns counterclockwise
+
+    def present(self, ui_layer, ui_texture):
+        """
+        Copies the world target (if any) to the window, composites ui_layer over it through the
+        streaming ui_texture, presents the frame and clears ui_layer for the next one.
+        """
+        self.renderer.target = None
+        if self.target is not None:
+            self.target.draw(dstrect=(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        ui_texture.update(ui_layer)
+        ui_texture.draw()
+        self.renderer.present()
+        ui_layer.fill((0, 0, 0, 0))
+
+# --- Render Snapshots ---
+
+# Immutable per-frame records of what the world pass draws, built by GameManager.make_render_snapshot().
+# Sprite images are shared references; everything else is copied so the simulation can move on.
+StaticWorld = namedtuple("StaticWorld", "space_station trading_outpost enemy_base planets mining_zones") # Records below, None if absent
+StructureRecord = namedtuple("StructureRecord", "x y size image rect") # Space station, trading outpost
+EnemyBaseRecord = namedtuple("EnemyBaseRecord", "x y size image rect health max_health turret_positions missile_launcher_positions")
+PlanetRecord = namedtuple("PlanetRecord", "x y size image rect planet_type_name")
+ZoneRecord = namedtuple("ZoneRecord", "x y radius") # Mining safezone
+SpriteRecord = namedtuple("SpriteRecord", "x y angle original_image kind") # kind identifies the look, for rotated stamps
+AsteroidRecord = namedtuple("AsteroidRecord", "x y size image health max_health color")
+ProjectileRecord = namedtuple("ProjectileRecord", "x y angle color original_image kind") # original_image is None for plain bolts
+DropRecord = namedtuple("DropRecord", "x y size image key") # key identifies the look, for the stamp cache
+RenderSnapshot = namedtuple("RenderSnapshot", [
+    "time", "camera_x", "camera_y", "zoom_factor", "view_zoom", # zoom_factor includes RENDER_SCALE, view_zoom does not
+    "static_world", "static_invalidations",
+    "player", "asteroids", "enemies", "mining_npcs",
+    "player_projectiles", "enemy_projectiles", "ship_parts", "material_drops",
+    "mining_laser", "auto_mine_targets",
+    "outgoing_ping", "incoming_ping_start_time", "revealed_asteroids",
+    "jump_rings_start_time", "quality",
+])
+
+class RenderWorker:
+    """
+    Draws render snapshots on a background thread into two alternating offscreen buffers.
+    swap() hands over the newest snapshot and returns the last finished frame, so the
+    main thread presents frame N - 1 while frame N is drawn and tick N + 1 simulates.
+    """
+    def __init__(self, draw_world, size):
+        self.draw_world = draw_world # Callable(canvas, snapshot)
+        self.buffers = [pygame.Surface(size).convert(), pygame.Surface(size).convert()]
+        self.canvases = [SurfaceCanvas(buffer) for buffer in self.buffers]
+        for canvas in self.canvases:
+            canvas.clear()
+        self.ready_index = 0 # Buffer holding the last finished frame
+        self.pending = None # Snapshot waiting to be drawn
+        self.busy = False
+        self.running = True
+        self.error = None # Exception raised on the render thread, re-raised by swap()
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="RenderWorker", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending is None and self.running:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                snapshot = self.pending
+                self.pending = None
+                self.busy = True
+                back_index = 1 - self.ready_index
+
+            try:
+                back_canvas = self.canvases[back_index]
+                back_canvas.clear()
+                self.draw_world(back_canvas, snapshot)
+            except Exception as error:
+                with self.condition:
+                    self.error = error
+                    self.busy = False
+                    self.running = False
+                    self.condition.notify_all()
+                return
+
+            with self.condition:
+                self.ready_index = back_index
+                self.busy = False
+                self.condition.notify_all()
+
+    def swap(self, snapshot):
+        """
+        Queues snapshot for drawing and returns the most recently finished frame. Only blocks
+        while the previous snapshot is still being drawn.
+        """
+        with self.condition:
+            while (self.busy or self.pending is not None) and self.error is None:
+                self.condition.wait()
+            if self.error is not None:
+                raise self.error
+            frame = self.buffers[self.ready_index]
+            self.pending = snapshot
+            self.condition.notify_all()
+        return frame
+
+    def stop(self):
+        """Stops the render thread after the frame it is drawing."""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
+
+
+# --- Game Timers ---
+
+TIMERS = TimerWheel() # Lifetimes and timed game events, keyed on pygame.time.get_ticks(); advanced by the GameManager
+
+
+# --- Save Games ---
+
+# Table -> record layout, one struct code per field; S fields are strings. Times are saved as
+# ages (milliseconds before the save) and pending timers as the delay left, since
+# pygame.time.get_ticks() starts over in every session. Projectiles, pings and jumps in
+# progress are not saved.
+SAVE_TABLES = (
+    # game_state, previous_game_state, current_energy_core, camera_x, camera_y, auto_mine_charge,
+    # selected_weapon_slot, game_over, enemy spawn age, ping age, jump age, health regen delay
+    ("game", "SSSdddB?qqqq"),
+    # x, y, angle, health, max_health, resources, weapon slots 1 and 2, their shot ages, level,
+    # current_xp, xp_threshold, ship_parts, the five materials, mining tool, recharge and power
+    # multipliers, engine, antenna
+    ("player", "dddddqSSqqqddqqqqqqSddSS"),
+    ("asteroids", "ddHHd?h"), # x, y, size, resources, health, is_stealth, mining zone index (-1 for none)
+    ("enemies", "Sddddq"), # class name, x, y, health, angle, shot age
+    ("planets", "SddH"), # planet type, x, y, size
+    ("mining_zones", "dddHH"), # x, y, radius, max_asteroids, max_npcs
+    ("mining_npcs", "dddH"), # x, y, angle, mining zone index
+    ("ship_parts", "ddH"), # x, y, size
+    ("material_drops", "SddqH"), # material type, x, y, amount, size
+    ("space_station", "ddH"), # x, y, size
+    ("trading_outpost", "dd"), # x, y; no record if there is none
+    ("enemy_base", "ddHdqq"), # x, y, size, health, turret shot age, missile shot age; no record once destroyed
+    ("random_state", "B" + "I" * 625 + "?d"), # random.getstate(): version, Mersenne Twister state, gauss_next
+    ("sectors", "hh"), # column, row of every generated sector of the sector store; none if it is disabled
+    ("sector_asteroids", "hh" + SECTOR_ASTEROID_LAYOUT), # column, row, then the asteroid record stored in that sector
+)
+SAVE_LAYOUTS = tuple(layout for _, layout in SAVE_TABLES)
+SaveSnapshot = namedtuple("SaveSnapshot", [name for name, _ in SAVE_TABLES]) # One list of records per table
+
+def pack_save(snapshot):
+    """Packs a SaveSnapshot into a save body. Runs on the save thread."""
+    return pack_tables(SAVE_LAYOUTS, snapshot)
+
+def saved_game_state(state):
+    """Returns the game state to save for state: a jump in progress is saved as the flight it interrupted."""
+    return "PLAYING" if state.startswith("JUMP_DRIVE") else state
+
+def saved_number(value):
+    """Turns a number saved as a double back into an int if it is whole, so HUD labels keep showing ints."""
+    return int(value) if value.is_integer() else value
+
 
 # --- Game Classes ---
 
@@ -333,9 +1115,12 @@ class Player(pygame.sprite.Sprite):
     """
     def __init__(self):
         super().__init__()
-        self.original_image = pygame.Surface((30, 40), pygame.SRCALPHA)
-        # Draw a simple triangle for the player ship, pointing UP (0 degrees visual angle)
-        pygame.draw.polygon(self.original_image, BLUE, [(15, 0), (0, 40), (30, 40)])
+        # Ship sprite pointing UP (0 degrees visual angle), shared through the sprite atlas
+        self.original_image = SPRITE_ATLAS.get("spaceship", (30, 40))
+        if self.original_image is None:
+            # Draw a simple triangle for the player ship, pointing UP (0 degrees visual angle)
+            self.original_image = pygame.Surface((30, 40), pygame.SRCALPHA)
+            pygame.draw.polygon(self.original_image, BLUE, [(15, 0), (0, 40), (30, 40)])
         self.image = self.original_image
         # Initial rect is just for internal collision tracking, not screen position
         self.rect = self.image.get_rect(center=(0, 0)) # Start at world origin
@@ -599,13 +1384,16 @@ class Asteroid(pygame.sprite.Sprite):
         self.is_revealed = False # Only for stealth asteroids, becomes True when advanced antenna is active
 
         if self.is_stealth:
+            # Stealth asteroids keep their own surface, it is redrawn when they are revealed or hidden
             self.original_color = STEALTH_ASTEROID_COLOR # This is its base hidden color
             self.image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
             pygame.draw.circle(self.image, self.original_color, (size, size), size)
         else:
             self.original_color = GRAY # Regular asteroid color
-            self.image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, self.original_color, (size, size), size)
+            self.image = SPRITE_ATLAS.get("asteroid", (size * 2, size * 2)) # Shared by all asteroids of this size
+            if self.image is None:
+                self.image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(self.image, self.original_color, (size, size), size)
 
         self.rect = self.image.get_rect(center=(x, y)) # Rect uses world coordinates
         self.x = float(x)
@@ -678,9 +1466,11 @@ class Enemy(pygame.sprite.Sprite):
     """
     def __init__(self, x, y):
         super().__init__()
-        self.original_image = pygame.Surface((30, 30), pygame.SRCALPHA)
-        # Draw a simple square for the enemy ship
-        pygame.draw.rect(self.original_image, RED, (0, 0, 30, 30))
+        self.original_image = SPRITE_ATLAS.get("enemy_ship", (30, 30))
+        if self.original_image is None:
+            # Draw a simple square for the enemy ship
+            self.original_image = pygame.Surface((30, 30), pygame.SRCALPHA)
+            pygame.draw.rect(self.original_image, RED, (0, 0, 30, 30))
         self.image = self.original_image
         self.rect = self.image.get_rect(center=(x, y)) # Rect uses world coordinates
 
@@ -827,19 +1617,13 @@ class FastEnemy(Enemy):
         self.current_cooldown = self.base_cooldown
 
 
-class Projectile(pygame.sprite.Sprite):
+class Projectile(Entity):
     """
     Represents a laser projectile fired by player or enemy.
     Coordinates (self.x, self.y) are world coordinates.
     """
     def __init__(self, x, y, angle, speed, color, damage):
-        super().__init__()
-        self.image = pygame.Surface((5, 10), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, color, (0, 0, 5, 10))
-        self.rect = self.image.get_rect(center=(x, y)) # Rect uses world coordinates
-
-        self.x = float(x)
-        self.y = float(y)
+        super().__init__(x, y, STAMP_CACHE.get_rect(color, (5, 10))) # Stamp shared by all projectiles of this color; rect uses world coordinates
         self.angle = angle # This angle is the visual angle (0=up, 90=left, etc.)
         self.speed = speed
         self.color = color
@@ -855,11 +1639,7 @@ class Projectile(pygame.sprite.Sprite):
         Updates the projectile's position in world coordinates.
         Removes projectile if it goes far off the visible screen.
         """
-        self.x += self.vx
-        self.y += self.vy
-        # Update the rect for collision detection (using world coordinates)
-        self.rect.centerx = int(self.x)
-        self.rect.centery = int(self.y)
+        self.move() # Also moves the rect for collision detection (using world coordinates)
 
         # Remove projectile if it goes off screen (with a margin for camera movement)
         # Check if the projectile is outside the camera's view plus a buffer
@@ -880,6 +1660,8 @@ class HomingMissile(Projectile):
     """
     A projectile that homes in on a target enemy or base.
     """
+    lifetime = HOMING_MISSILE_LIFETIME # milliseconds
+
     def __init__(self, x, y, angle, speed, color, target_sprite, damage, turn_rate):
         # Pass a dummy angle to Projectile as its vx/vy will be re-calculated
         super().__init__(x, y, angle, speed, color, damage) 
@@ -910,18 +1692,12 @@ class HomingMissile(Projectile):
             self.vy = self.speed * math.sin(rad_angle_for_movement)
             self.angle = angle # Keep the initial angle
 
-        self.lifetime = HOMING_MISSILE_LIFETIME # milliseconds
-        self.deathtime = pygame.time.get_ticks() + self.lifetime
+        TIMERS.schedule(self.lifetime, self.kill) # The missile self-destructs after its lifetime
 
     def update(self, camera_x, camera_y, current_time, game_manager=None):
         """
         Updates the missile's position, homing towards its target.
         """
-        # Check for lifetime
-        if current_time > self.deathtime:
-            self.kill()
-            return # Stop updating if dead
-
         # If current target is invalid, try to find a new one (only for player missiles)
         if not self.target or not self.target.alive():
             if game_manager and (isinstance(self.target, Enemy) or isinstance(self.target, EnemyBase)): # Only player missiles re-target enemies/base
@@ -938,37 +1714,8 @@ class HomingMissile(Projectile):
 
         # If target is valid and alive, home in
         if self.target and self.target.alive():
-            target_x, target_y = self.target.x, self.target.y
-            
-            dx = target_x - self.x
-            dy = target_y - self.y
-            
-            desired_angle_rad = math.atan2(dy, dx) # Angle from positive x-axis
-
-            current_speed_magnitude = math.hypot(self.vx, self.vy)
-            if current_speed_magnitude == 0:
-                self.vx = self.speed * math.cos(desired_angle_rad)
-                self.vy = self.speed * math.sin(desired_angle_rad)
-                current_speed_magnitude = self.speed
-
-            current_angle_rad = math.atan2(self.vy, self.vx)
-
-            angle_diff_rad = (desired_angle_rad - current_angle_rad + math.pi + 2*math.pi) % (2*math.pi) - math.pi
-
-            max_turn_rad = math.radians(self.turn_rate)
-            turn_amount_rad = max(-max_turn_rad, min(max_turn_rad, angle_diff_rad))
-
-            new_vx = self.vx * math.cos(turn_amount_rad) - self.vy * math.sin(turn_amount_rad)
-            new_vy = self.vx * math.sin(turn_amount_rad) + self.vy * math.cos(turn_amount_rad)
-
-            new_speed_magnitude = math.hypot(new_vx, new_vy)
-            if new_speed_magnitude > 0:
-                self.vx = self.speed * (new_vx / new_speed_magnitude)
-                self.vy = self.speed * (new_vy / new_speed_magnitude)
-            else:
-                self.vx = self.speed * math.cos(desired_angle_rad)
-                self.vy = self.speed * math.sin(desired_angle_rad)
-
+            self.vx, self.vy = turn_towards(self.vx, self.vy, self.target.x - self.x, self.target.y - self.y,
+                                            self.turn_rate, self.speed)
             self.angle = (math.degrees(math.atan2(self.vy, self.vx)) + 90) % 360
 
         else:
@@ -976,8 +1723,7 @@ class HomingMissile(Projectile):
 
         super().update(camera_x, camera_y, current_time, game_manager)
 
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
-        self.rect = self.image.get_rect(center=(self.x, self.y))
+        self.set_image(pygame.transform.rotate(self.original_image, self.angle))
 
 
 class SwarmRocketProjectile(HomingMissile):
@@ -985,6 +1731,8 @@ class SwarmRocketProjectile(HomingMissile):
     A smaller homing missile used in swarm rockets.
     Initializes with a specific angle (for spread) then homes.
     """
+    lifetime = SWARM_ROCKET_LIFETIME # Use a different constant
+
     def __init__(self, x, y, angle, speed, color, target_sprite, damage, turn_rate): # Renamed target_enemy to target_sprite
         super().__init__(x, y, angle, speed, color, target_sprite, damage, turn_rate)
         
@@ -998,9 +1746,6 @@ class SwarmRocketProjectile(HomingMissile):
         self.image = pygame.Surface((6, 12), pygame.SRCALPHA) # Even smaller missile image
         pygame.draw.rect(self.image, self.color, (0, 0, 6, 12), border_radius=1)
         self.original_image = self.image.copy()
-        
-        self.lifetime = SWARM_ROCKET_LIFETIME # Use a different constant
-        self.deathtime = pygame.time.get_ticks() + self.lifetime
 
 
 class SpaceStation(pygame.sprite.Sprite):
@@ -1018,6 +1763,10 @@ class SpaceStation(pygame.sprite.Sprite):
         self.y = float(y)
         self.size = size
 
+    def record(self):
+        """Returns what the world pass draws of the station as a StructureRecord."""
+        return StructureRecord(self.x, self.y, self.size, self.image, self.rect.copy())
+
     def draw(self, screen, camera_x, camera_y):
         """
         Draws the space station on the screen relative to the camera.
@@ -1049,6 +1798,10 @@ class TradingOutpost(pygame.sprite.Sprite):
         self.size = size
         self.color = color
 
+    def record(self):
+        """Returns what the world pass draws of the outpost as a StructureRecord."""
+        return StructureRecord(self.x, self.y, self.size, self.image, self.rect.copy())
+
     def draw(self, screen, camera_x, camera_y):
         """
         Draws the trading outpost on the screen relative to the camera.
@@ -1115,13 +1868,13 @@ class Planet(pygame.sprite.Sprite):
     """
     Represents a planet with gravitational pull.
     """
-    def __init__(self, x, y, planet_type_name):
+    def __init__(self, x, y, planet_type_name, size=None):
         super().__init__()
         self.planet_type_name = planet_type_name
         type_data = PLANET_TYPES[planet_type_name]
         
         self.color = type_data["color"]
-        self.size = random.randint(type_data["min_size"], type_data["max_size"])
+        self.size = size or random.randint(type_data["min_size"], type_data["max_size"]) # Loaded games pass the saved size
         self.gravity_strength = type_data["gravity_strength"]
         self.gravity_radius = type_data["gravity_radius"]
 
@@ -1131,6 +1884,10 @@ class Planet(pygame.sprite.Sprite):
         self.x = float(x)
         self.y = float(y)
 
+    def record(self):
+        """Returns what the world pass draws of the planet as a PlanetRecord."""
+        return PlanetRecord(self.x, self.y, self.size, self.image, self.rect.copy(), self.planet_type_name)
+
     def draw(self, screen, camera_x, camera_y):
         """
         Draws the planet on the screen relative to the camera.
@@ -1153,19 +1910,20 @@ class MiningSafezone:
         self.asteroids_in_zone = pygame.sprite.Group() # Asteroids specifically in this zone
         self.npcs_in_zone = pygame.sprite.Group() # NPCs specifically in this zone
 
-    def draw(self, screen, camera_x, camera_y, zoom_factor):
+    def record(self):
+        """Returns what the world pass draws of the zone as a ZoneRecord."""
+        return ZoneRecord(self.x, self.y, self.radius)
+
+    @staticmethod
+    def draw(zone, screen, camera_x, camera_y, zoom_factor):
         """
-        Draws the mining safezone circle.
+        Draws the circle of zone, a MiningSafezone or its ZoneRecord.
         """
-        screen_x, screen_y = GameManager.world_to_screen_static(self.x, self.y, camera_x, camera_y, zoom_factor)
-        scaled_radius = int(self.radius * zoom_factor)
-        
-        if scaled_radius > 0:
-            safezone_surface = pygame.Surface((scaled_radius * 2, scaled_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(safezone_surface, MINING_ZONE_COLOR, (scaled_radius, scaled_radius), scaled_radius)
-            
-            safezone_rect = safezone_surface.get_rect(center=(screen_x, screen_y))
-            screen.blit(safezone_surface, safezone_rect)
+        screen_x, screen_y = GameManager.world_to_screen_static(zone.x, zone.y, camera_x, camera_y, zoom_factor)
+        scaled_radius = int(zone.radius * zoom_factor)
+
+        # Overlay surface is cached per (radius, color), so it's only rendered once per zoom level
+        OVERLAY_CACHE.blit_circle(screen, (screen_x, screen_y), scaled_radius, MINING_ZONE_COLOR)
 
 class MiningNPC(pygame.sprite.Sprite):
     """
@@ -1327,11 +2085,14 @@ class EnemyBase(pygame.sprite.Sprite):
         # Missile launcher firing logic
         if current_time - self.last_missile_shot_time > ENEMY_BASE_MISSILE_FIRE_RATE:
             self.last_missile_shot_time = current_time
+            launchers_appeared = not self.missile_launcher_positions
             # Define missile launcher positions (moved here from __init__ to ensure it's always defined)
+            # Assigned as a whole so the render thread never sees a half-built list
             launcher_offset = self.size // 2 - 30
-            self.missile_launcher_positions = []
-            self.missile_launcher_positions.append((0, -launcher_offset)) # Top center
-            self.missile_launcher_positions.append((0, launcher_offset))  # Bottom center
+            self.missile_launcher_positions = [(0, -launcher_offset), # Top center
+                                               (0, launcher_offset)]  # Bottom center
+            if launchers_appeared:
+                self.game_manager.invalidate_static_world(self.rect) # Launchers appear on the cached base body
 
             for rel_x, rel_y in self.missile_launcher_positions:
                 launcher_world_x = self.x + rel_x
@@ -1354,52 +2115,83 @@ class EnemyBase(pygame.sprite.Sprite):
         """
         Draws the enemy base and its components.
         """
-        screen_x, screen_y = GameManager.world_to_screen_static(self.x, self.y, camera_x, camera_y, zoom_factor)
-        scaled_size = int(self.size * zoom_factor)
+        self.draw_body(self, screen, camera_x, camera_y, zoom_factor)
+        self.draw_health_bar(self, screen, camera_x, camera_y, zoom_factor)
+
+    def record(self):
+        """Returns what the world pass draws of the base as an EnemyBaseRecord."""
+        return EnemyBaseRecord(self.x, self.y, self.size, self.image, self.rect.copy(), self.health, self.max_health,
+                               tuple(self.turret_positions), tuple(self.missile_launcher_positions))
+
+    @staticmethod
+    def draw_body(base, screen, camera_x, camera_y, zoom_factor):
+        """
+        Draws the body, turrets and missile launchers of base, an EnemyBase or its EnemyBaseRecord
+        (the static part, cached in the static layer).
+        """
+        screen_x, screen_y = GameManager.world_to_screen_static(base.x, base.y, camera_x, camera_y, zoom_factor)
+        scaled_size = int(base.size * zoom_factor)
         
         if scaled_size > 0:
-            scaled_base_image = pygame.transform.scale(self.image, (scaled_size, scaled_size))
+            scaled_base_image = pygame.transform.scale(base.image, (scaled_size, scaled_size))
             draw_rect = scaled_base_image.get_rect(center=(screen_x, screen_y))
             screen.blit(scaled_base_image, draw_rect)
 
             # Draw turrets
             turret_size = int(10 * zoom_factor) or 1
-            for rel_x, rel_y in self.turret_positions:
-                turret_screen_x, turret_screen_y = GameManager.world_to_screen_static(self.x + rel_x, self.y + rel_y, camera_x, camera_y, zoom_factor)
+            for rel_x, rel_y in base.turret_positions:
+                turret_screen_x, turret_screen_y = GameManager.world_to_screen_static(base.x + rel_x, base.y + rel_y, camera_x, camera_y, zoom_factor)
                 pygame.draw.circle(screen, TURRET_COLOR, (int(turret_screen_x), int(turret_screen_y)), turret_size)
                 pygame.draw.circle(screen, WHITE, (int(turret_screen_x), int(turret_screen_y)), turret_size, 1) # Outline
 
             # Draw missile launchers
             launcher_size = int(15 * zoom_factor) or 1
             # Ensure missile_launcher_positions is defined before iterating
-            if hasattr(self, 'missile_launcher_positions'):
-                for rel_x, rel_y in self.missile_launcher_positions:
-                    launcher_screen_x, launcher_screen_y = GameManager.world_to_screen_static(self.x + rel_x, self.y + rel_y, camera_x, camera_y, zoom_factor)
+            if hasattr(base, 'missile_launcher_positions'):
+                for rel_x, rel_y in base.missile_launcher_positions:
+                    launcher_screen_x, launcher_screen_y = GameManager.world_to_screen_static(base.x + rel_x, base.y + rel_y, camera_x, camera_y, zoom_factor)
                     pygame.draw.rect(screen, MISSILE_LAUNCHER_COLOR, (launcher_screen_x - launcher_size // 2, launcher_screen_y - launcher_size // 2, launcher_size, launcher_size), border_radius=int(launcher_size * 0.2))
                     pygame.draw.rect(screen, WHITE, (launcher_screen_x - launcher_size // 2, launcher_screen_y - launcher_size // 2, launcher_size, launcher_size), 1, border_radius=int(launcher_size * 0.2)) # Outline
 
+    @staticmethod
+    def draw_health_bar(base, screen, camera_x, camera_y, zoom_factor):
+        """
+        Draws the health bar of base, an EnemyBase or its EnemyBaseRecord, once it has taken damage.
+        """
+        screen_x, screen_y = GameManager.world_to_screen_static(base.x, base.y, camera_x, camera_y, zoom_factor)
+        scaled_size = int(base.size * zoom_factor)
+
+        if scaled_size > 0:
             # Draw health bar for the base
-            if self.health < self.max_health:
-                bar_width = int(self.size * zoom_factor)
+            if base.health < base.max_health:
+                bar_width = int(base.size * zoom_factor)
                 bar_height = int(10 * zoom_factor)
-                health_percentage = self.health / self.max_health
+                health_percentage = base.health / base.max_health
                 current_health_width = int(bar_width * health_percentage)
 
                 health_bar_bg_rect = pygame.Rect(screen_x - bar_width // 2, screen_y + scaled_size // 2 + int(10 * zoom_factor), bar_width, bar_height)
                 health_bar_rect = pygame.Rect(screen_x - bar_width // 2, screen_y + scaled_size // 2 + int(10 * zoom_factor), current_health_width, bar_height)
 
-                pygame.draw.rect(screen, RED, health_bar_bg_rect)
-                pygame.draw.rect(screen, GREEN, health_bar_rect)
+                screen.fill(RED, health_bar_bg_rect)
+                screen.fill(GREEN, health_bar_rect)
 
 
 # --- Game Manager ---
-class GameManager:
+class GameManager(Game):
     """
     Manages all game objects and game state, including the camera and mining laser.
     """
     def __init__(self):
+        self.running = True # False once the window is closed
+        self.render_worker = None # RenderWorker drawing the world on a background thread, if enabled
+        self.save_worker = None # SaveWorker writing saves on a background thread, started by the first save
+        # General asteroids of the whole world, on disk; only the sectors around the player are sprites
+        self.sector_store = SectorStore(SECTOR_STORE_PATH, SECTOR_SIZE, SECTOR_GRID_SIDE, SECTOR_CAPACITY,
+                                        SECTOR_ASTEROID_LAYOUT) if SECTOR_STORE_ENABLED else None
+        self.loaded_sectors = set() # Sectors whose asteroids are live sprites
+        self.frame_start_time = 0 # pygame.time.get_ticks() at the start of the current frame
         self.player = Player()
-        self.asteroids = pygame.sprite.Group()
+        self.asteroids = IndexedGroup(cell_size=SPATIAL_GRID_CELL_SIZE) # Asteroids don't move, so they are indexed for range queries
         self.enemies = pygame.sprite.Group()
         self.player_projectiles = pygame.sprite.Group()
         self.enemy_projectiles = pygame.sprite.Group()
@@ -1409,6 +2201,22 @@ class GameManager:
         self.mining_zones = [] # List to hold MiningSafezone objects
         self.mining_npcs = pygame.sprite.Group() # Group for all mining NPCs
         self.enemy_base = None # New: Enemy Base
+        self.static_layer = StaticWorldLayer(self.draw_static_world) # Cached tiles of the static world content
+        self.pending_static_invalidations = [] # Handed to the world pass through the next render snapshot
+        self.render_snapshot = None # Immutable snapshot of the last simulated tick, drawn by draw_world
+        # Off-screen world target when RENDER_SCALE draws the world at another resolution than the screen
+        self.world_target = None
+        if RENDERER:
+            texture_target = Texture(RENDERER, WORLD_RENDER_SIZE, target=True) if WORLD_RENDER_SIZE != SCREEN.get_size() else None
+            self.world_canvas = TextureCanvas(RENDERER, texture_target)
+            self.ui_texture = Texture(RENDERER, SCREEN.get_size(), streaming=True) # SCREEN (the UI layer) is uploaded into it each frame
+            self.ui_texture.blend_mode = pygame.BLENDMODE_BLEND
+        else:
+            if WORLD_RENDER_SIZE != SCREEN.get_size():
+                self.world_target = pygame.Surface(WORLD_RENDER_SIZE).convert()
+            self.world_canvas = SurfaceCanvas(self.world_target or SCREEN)
+        self.quality_governor = QualityGovernor() # Lowers effect quality when frames run over budget
+        self.minimap = Minimap(self.draw_static_world, self.asteroids.grid, self.get_asteroid_marker_color) # HUD minimap
 
         self.game_over = False
         self.last_enemy_spawn_time = pygame.time.get_ticks()
@@ -1434,7 +2242,7 @@ class GameManager:
         # Trading Outpost (new)
         self.trading_outpost = None
 
-        self.last_regen_time = pygame.time.get_ticks() # For health regeneration
+        self.start_game_timers() # Health regeneration and autosave
 
         # Game State
         self.game_state = "PLAYING" # "PLAYING", "PAUSED_AT_STATION", "INVENTORY", "ECONOMY_SHOP", "SHIP_UPGRADING", "SHIP_SHOP", "MINING_TOOLS_MENU", "ENERGY_CORE_MENU", "ANTENNA_MENU", "WEAPONS_MENU", "PROPULSION_MENU", "JUMP_DRIVE_SELECT_TARGET", "JUMP_DRIVE_ALIGNING", "JUMP_DRIVE_WARP", "TRADING_OUTPOST_MENU"
@@ -1450,11 +2258,24 @@ class GameManager:
         self.outgoing_ping_world_pos = (0, 0)
         self.incoming_ping_active = False
         self.incoming_ping_start_time = 0
+        self.ping_timers = [] # Timers that end the current ping's phases
         self.ping_t_pressed_last_frame = False # To detect single 'T' press
+        self.effects_layer = EffectsLayer(WORLD_RENDER_SIZE) # Shared overlay for ping/radar effects
+
+        # HUD widgets (re-rendered only when their values change)
+        self.hud_health_text = HudText(FONT, "Health: {}/{}", GREEN)
+        self.hud_xp_text = HudText(FONT, "XP: {}/{} (Level {})", WHITE)
+        self.hud_xp_bar = HudBar(200, 20, BLUE)
+        self.hud_charge_text = HudText(FONT, "Charge: {}%", WHITE)
+        self.hud_charge_bar = HudBar(150, 15, CHARGE_BAR_COLOR)
+        self.hud_cooldown_text = HudText(FONT, "Jump CD: {:.1f}s", WHITE)
+        self.hud_cooldown_bar = HudBar(150, 15, COOLDOWN_BAR_COLOR)
+        self.hud_weapon1_text = HudText(FONT, "Slot 1 (Space): {}", WHITE)
+        self.hud_weapon2_text = HudText(FONT, "Slot 2 (L-Ctrl): {}", WHITE)
+        self.hud_quality_text = HudText(FONT, "Quality: {}", GRAY)
 
-        # Buttons for menus
-        self.buttons = {} # Stores {'button_name': pygame.Rect} for click detection
         self.last_button_press_time = 0 # Track last time any menu button was pressed
+        self.menus = self.build_menus() # game_state -> RetainedMenu, built once and hit-tested by handle_input
 
         # Current Energy Core
         self.current_energy_core = "Standard Core"
@@ -1475,6 +2296,7 @@ class GameManager:
         self.spawn_initial_planets() # Spawn planets at game start
         self.spawn_mining_zones() # Spawn mining zones
         self.spawn_enemy_base() # Spawn enemy base
+        self.render_snapshot = self.make_render_snapshot(pygame.time.get_ticks())
 
     @staticmethod
     def world_to_screen_static(world_x, world_y, camera_x, camera_y, zoom_factor):
@@ -1488,6 +2310,8 @@ class GameManager:
 
     def spawn_initial_asteroids(self):
         """Spawns a set number of asteroids around the player's initial position."""
+        if self.sector_store:
+            return # The sectors around the player are streamed in by the first update
         for _ in range(MAX_ASTEROIDS):
             self.spawn_asteroid()
 
@@ -1512,26 +2336,7 @@ class GameManager:
             attempts = 0
             max_attempts = 5
             while attempts < max_attempts:
-                is_in_safezone = False
-                # Check main safezone
-                dist_to_station = math.hypot(x - self.space_station.x, y - self.space_station.y)
-                if dist_to_station < SAFEZONE_RADIUS:
-                    is_in_safezone = True
-                
-                # Check mining zones
-                for zone in self.mining_zones:
-                    dist_to_zone = math.hypot(x - zone.x, y - zone.y)
-                    if dist_to_zone < zone.radius:
-                        is_in_safezone = True
-                        break
-                
-                # Check enemy base proximity
-                if self.enemy_base:
-                    dist_to_base = math.hypot(x - self.enemy_base.x, y - self.enemy_base.y)
-                    if dist_to_base < ENEMY_BASE_PROXIMITY_RADIUS:
-                        is_in_safezone = True
-
-                if not is_in_safezone:
+                if not self.is_asteroid_free_area(x, y):
                     break # Found a good spot
                 
                 # If in a safezone, try new coordinates
@@ -1557,6 +2362,79 @@ class GameManager:
             in_mining_zone.asteroids_in_zone.add(new_asteroid)
 
 
+    def is_asteroid_free_area(self, x, y):
+        """Checks if (x, y) is in the main safezone, a mining zone or the enemy base's proximity, where general asteroids don't spawn."""
+        if math.hypot(x - self.space_station.x, y - self.space_station.y) < SAFEZONE_RADIUS:
+            return True
+        for zone in self.mining_zones:
+            if math.hypot(x - zone.x, y - zone.y) < zone.radius:
+                return True
+        return bool(self.enemy_base) and math.hypot(x - self.enemy_base.x, y - self.enemy_base.y) < ENEMY_BASE_PROXIMITY_RADIUS
+
+    def sectors_around_player(self):
+        """Returns the sectors of the sector store that are kept as live sprites around the player."""
+        column, row = self.sector_store.sector_at(self.player.x, self.player.y)
+        sectors = ((column + dx, row + dy) for dx in range(-SECTOR_LOAD_RADIUS, SECTOR_LOAD_RADIUS + 1)
+                   for dy in range(-SECTOR_LOAD_RADIUS, SECTOR_LOAD_RADIUS + 1))
+        return {sector for sector in sectors if self.sector_store.contains(sector)}
+
+    def stream_sectors(self):
+        """
+        Keeps the general asteroids of the sectors around the player alive as sprites. Sectors the
+        player moved away from are written back to the sector store (without the asteroids mined
+        out in the meantime) and their sprites dropped; sectors that came into range are read in.
+        """
+        wanted = self.sectors_around_player()
+        if wanted == self.loaded_sectors:
+            return
+        self.unload_sectors(self.loaded_sectors - wanted, wanted)
+        for sector in wanted - self.loaded_sectors:
+            self.load_sector(sector)
+        self.loaded_sectors = wanted
+
+    def unload_sectors(self, sectors, kept_sectors):
+        """
+        Writes the live general asteroids of sectors back to the sector store, then removes every
+        general asteroid outside kept_sectors (e.g. ones restored from a save beyond the loaded sectors).
+        """
+        leaving = {sector: [] for sector in sectors}
+        zone_asteroids = set().union(*(zone.asteroids_in_zone for zone in self.mining_zones))
+        for asteroid in list(self.asteroids):
+            if asteroid in zone_asteroids:
+                continue
+            sector = self.sector_store.sector_at(asteroid.x, asteroid.y)
+            if sector in kept_sectors:
+                continue
+            if sector in leaving:
+                leaving[sector].append((asteroid.x, asteroid.y, asteroid.size, asteroid.resources, asteroid.health,
+                                        1 if asteroid.is_stealth else 0))
+            asteroid.kill()
+        for sector, records in leaving.items():
+            self.sector_store.write(sector, records)
+
+    def load_sector(self, sector):
+        """Adds the asteroids of a sector as sprites, generating the sector's content the first time."""
+        if not self.sector_store.is_generated(sector):
+            self.sector_store.write(sector, self.generate_sector(sector))
+        for x, y, size, resources, health, type_code in self.sector_store.read(sector):
+            asteroid = Asteroid(x, y, size, resources, type_code == 1)
+            asteroid.health = saved_number(health)
+            self.asteroids.add(asteroid)
+
+    def generate_sector(self, sector):
+        """Returns the asteroid records of a newly discovered sector."""
+        left, top, right, bottom = self.sector_store.sector_rect(sector)
+        records = []
+        for _ in range(random.randint(SECTOR_MIN_ASTEROIDS, SECTOR_MAX_ASTEROIDS)):
+            x = random.uniform(left, right)
+            y = random.uniform(top, bottom)
+            if self.is_asteroid_free_area(x, y):
+                continue
+            size = random.randint(ASTEROID_MIN_SIZE, ASTEROID_MAX_SIZE)
+            resources = random.randint(ASTEROID_MIN_RESOURCES, ASTEROID_MAX_RESOURCES)
+            records.append((x, y, size, resources, size * 2, 1 if random.random() < STEALTH_ASTEROID_SPAWN_CHANCE else 0))
+        return records
+
     def spawn_enemy(self):
         """Spawns an enemy at a random location just outside the current screen view,
         ensuring it's outside the safezone, mining zones, and enemy base.
@@ -1738,6 +2616,16 @@ class GameManager:
         screen_y = (world_y - self.camera_y) * zoom_factor
         return screen_x, screen_y
 
+    def invalidate_static_world(self, world_rect=None):
+        """
+        Marks static world content within world_rect (or everywhere) as changed, so the
+        static layer tiles and the minimap texture are re-rendered.
+        The static layer belongs to the world pass, so its invalidation travels with the
+        next render snapshot and is applied in draw order, even on the render thread.
+        """
+        self.pending_static_invalidations.append(world_rect)
+        self.minimap.invalidate()
+
     def is_visible_on_screen(self, obj_x, obj_y, obj_radius):
         """
         Checks if an object is currently visible on the screen, considering camera offset and zoom.
@@ -1795,6 +2683,7 @@ class GameManager:
 
         # Check for button press cooldown
         can_press_button = (current_time - self.last_button_press_time > BUTTON_PRESS_COOLDOWN)
+        clicked_button = self.get_clicked_menu_button(mouse_pos) if mouse_clicked else None # Action of the menu button under the mouse
 
         # Handle 'E' key for space station/outpost interaction
         e_pressed_this_frame = keys[pygame.K_e]
@@ -1870,6 +2759,12 @@ class GameManager:
                 self.outgoing_ping_world_pos = (self.player.x, self.player.y)
                 self.incoming_ping_active = False # Reset incoming ping on new outgoing
                 self.last_ping_time = current_time
+                # The incoming ping starts once the ring (its speed affected by radar_range_multiplier) leaves the screen
+                incoming_delay = 1000 * min(SCREEN_WIDTH, SCREEN_HEIGHT) / 2 / (PING_OUTGOING_SPEED * self.player.radar_range_multiplier)
+                for timer in self.ping_timers:
+                    timer.cancel()
+                self.ping_timers = [TIMERS.schedule(incoming_delay, self.start_incoming_ping),
+                                    TIMERS.schedule(PING_OUTGOING_LIFETIME * 1000, self.end_outgoing_ping)]
                 self.last_button_press_time = current_time
                 print("Ping initiated!")
         self.ping_t_pressed_last_frame = t_pressed_this_frame
@@ -1939,46 +2834,46 @@ class GameManager:
             
         elif self.game_state == "PAUSED_AT_STATION":
             if mouse_clicked and can_press_button: # Left mouse button click for menu navigation
-                if 'resume_button' in self.buttons and self.buttons['resume_button'].collidepoint(mouse_pos):
+                if clicked_button == 'resume_button':
                     self.game_state = "PLAYING"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Resuming game.")
-                elif 'economy_button' in self.buttons and self.buttons['economy_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'economy_button':
                     self.game_state = "ECONOMY_SHOP"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Entering Economy Shop.")
-                elif 'upgrade_button' in self.buttons and self.buttons['upgrade_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'upgrade_button':
                     self.game_state = "SHIP_UPGRADING"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Entering Ship Upgrading.")
-                elif 'shop_button' in self.buttons and self.buttons['shop_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'shop_button':
                     self.game_state = "SHIP_SHOP"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Entering Ship Shop.")
 
         elif self.game_state == "SHIP_UPGRADING":
             if mouse_clicked and can_press_button:
-                if 'mining_tools_button' in self.buttons and self.buttons['mining_tools_button'].collidepoint(mouse_pos):
+                if clicked_button == 'mining_tools_button':
                     self.game_state = "MINING_TOOLS_MENU"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Entering Mining Tools Menu.")
-                elif 'energy_core_button' in self.buttons and self.buttons['energy_core_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'energy_core_button':
                     self.game_state = "ENERGY_CORE_MENU"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Entering Energy Core Menu.")
-                elif 'antenna_radar_button' in self.buttons and self.buttons['antenna_radar_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'antenna_radar_button':
                     self.game_state = "ANTENNA_MENU" # Change state to Antenna Menu
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Entering Antenna/Radar Systems Menu.")
-                elif 'weapons_button' in self.buttons and self.buttons['weapons_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'weapons_button':
                     self.game_state = "WEAPONS_MENU"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Entering Weapons Menu.")
-                elif 'propulsion_button' in self.buttons and self.buttons['propulsion_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'propulsion_button':
                     self.game_state = "PROPULSION_MENU"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Entering Propulsion Menu.")
-                elif 'back_button' in self.buttons and self.buttons['back_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'back_button':
                     self.game_state = "PAUSED_AT_STATION" # Go back to main station menu
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Returning to Space Station main menu.")
@@ -1986,7 +2881,7 @@ class GameManager:
         elif self.game_state == "MINING_TOOLS_MENU":
             if mouse_clicked and can_press_button:
                 # No "Laser" button anymore
-                if 'drill_button' in self.buttons and self.buttons['drill_button'].collidepoint(mouse_pos):
+                if clicked_button == 'drill_button':
                     self.player.current_mining_tool = "Drill"
                     # If switching from AutoMiningLaser, deactivate it
                     if self.auto_mine_active:
@@ -1994,60 +2889,60 @@ class GameManager:
                         self.targeted_asteroids.clear()
                     self.last_button_press_time = current_time # Reset cooldown
                     print(f"Mining tool set to: {self.player.current_mining_tool}")
-                elif 'short_range_laser_button' in self.buttons and self.buttons['short_range_laser_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'short_range_laser_button':
                     self.player.current_mining_tool = "ShortRangeLaser"
                     if self.auto_mine_active:
                         self.auto_mine_active = False
                         self.targeted_asteroids.clear()
                     self.last_button_press_time = current_time # Reset cooldown
                     print(f"Mining tool set to: {self.player.current_mining_tool}")
-                elif 'long_range_laser_button' in self.buttons and self.buttons['long_range_laser_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'long_range_laser_button':
                     self.player.current_mining_tool = "LongRangeLaser"
                     if self.auto_mine_active:
                         self.auto_mine_active = False
                         self.targeted_asteroids.clear()
                     self.last_button_press_time = current_time # Reset cooldown
                     print(f"Mining tool set to: {self.player.current_mining_tool}")
-                elif 'auto_mining_laser_button' in self.buttons and self.buttons['auto_mining_laser_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'auto_mining_laser_button':
                     self.player.current_mining_tool = "AutoMiningLaser"
                     self.last_button_press_time = current_time # Reset cooldown
                     print(f"Mining tool set to: {self.player.current_mining_tool}")
-                elif 'back_button' in self.buttons and self.buttons['back_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'back_button':
                     self.game_state = "SHIP_UPGRADING" # Go back to ship upgrading menu
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Returning to Ship Upgrading menu.")
 
         elif self.game_state == "ENERGY_CORE_MENU":
             if mouse_clicked and can_press_button:
-                if 'standard_core_button' in self.buttons and self.buttons['standard_core_button'].collidepoint(mouse_pos):
+                if clicked_button == 'standard_core_button':
                     self.player.recharge_rate_multiplier = 1.0
                     self.player.power_output_multiplier = 1.0
                     self.current_energy_core = "Standard Core"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Energy Core set to: Standard Core")
-                elif 'advanced_core_button' in self.buttons and self.buttons['advanced_core_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'advanced_core_button':
                     self.player.recharge_rate_multiplier = 1.5 # Example multiplier
                     self.player.power_output_multiplier = 1.2 # Example multiplier
                     self.current_energy_core = "Advanced Core"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Energy Core set to: Advanced Core")
-                elif 'back_button' in self.buttons and self.buttons['back_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'back_button':
                     self.game_state = "SHIP_UPGRADING"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Returning to Ship Upgrading menu.")
 
         elif self.game_state == "ANTENNA_MENU": # New menu state
             if mouse_clicked and can_press_button:
-                if 'basic_antenna_button' in self.buttons and self.buttons['basic_antenna_button'].collidepoint(mouse_pos):
+                if clicked_button == 'basic_antenna_button':
                     self.player.set_antenna("Basic Antenna")
                     self.last_button_press_time = current_time
-                elif 'standard_antenna_button' in self.buttons and self.buttons['standard_antenna_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'standard_antenna_button':
                     self.player.set_antenna("Standard Antenna")
                     self.last_button_press_time = current_time
-                elif 'advanced_antenna_button' in self.buttons and self.buttons['advanced_antenna_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'advanced_antenna_button':
                     self.player.set_antenna("Advanced Antenna")
                     self.last_button_press_time = current_time
-                elif 'back_button' in self.buttons and self.buttons['back_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'back_button':
                     self.game_state = "SHIP_UPGRADING"
                     self.last_button_press_time = current_time
                     print("Returning to Ship Upgrading menu.")
@@ -2055,53 +2950,53 @@ class GameManager:
         elif self.game_state == "WEAPONS_MENU": # New menu state for weapons
             if mouse_clicked and can_press_button:
                 # Slot selection buttons
-                if 'slot1_button' in self.buttons and self.buttons['slot1_button'].collidepoint(mouse_pos):
+                if clicked_button == 'slot1_button':
                     self.selected_weapon_slot = 1
                     self.last_button_press_time = current_time
-                elif 'slot2_button' in self.buttons and self.buttons['slot2_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'slot2_button':
                     self.selected_weapon_slot = 2
                     self.last_button_press_time = current_time
                 
                 # Weapon assignment buttons
-                if 'laser_weapon_button' in self.buttons and self.buttons['laser_weapon_button'].collidepoint(mouse_pos):
+                if clicked_button == 'laser_weapon_button':
                     self.player.set_weapon("Laser", self.selected_weapon_slot)
                     self.last_button_press_time = current_time
-                elif 'laser_turret_buttom' in self.buttons and self.buttons['laser_turret_button'].collidepoint(mouse_pos):
-                    self.player.set_weapon("Homing Missile", self.selected_weapon_slot)
+                elif clicked_button == 'laser_turret_button': # Not in WEAPON_TYPES yet, set_weapon reports it
+                    self.player.set_weapon("Laser Turret", self.selected_weapon_slot)
                     self.last_button_press_time = current_time
-                elif 'mini_gun_turret_button' in self.buttons and self.buttons['min_gun_turret_button'].collidepoint(mouse_pos):
-                    self.player.set_weapon("Homing Missile", self.selected_weapon_slot)
+                elif clicked_button == 'mini_gun_turret_button':
+                    self.player.set_weapon("Minigun Turret", self.selected_weapon_slot)
                     self.last_button_press_time = current_time
-                elif 'homing_missile_button' in self.buttons and self.buttons['homing_missile_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'homing_missile_button':
                     self.player.set_weapon("Homing Missile", self.selected_weapon_slot)
                     self.last_button_press_time = current_time
-                elif 'swarm_rocket_button' in self.buttons and self.buttons['swarm_rocket_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'swarm_rocket_button':
                     self.player.set_weapon("Swarm Rocket", self.selected_weapon_slot)
                     self.last_button_press_time = current_time
-                elif 'none_weapon_button' in self.buttons and self.buttons['none_weapon_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'none_weapon_button':
                     self.player.set_weapon("None", self.selected_weapon_slot)
                     self.last_button_press_time = current_time
 
-                elif 'back_button' in self.buttons and self.buttons['back_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'back_button':
                     self.game_state = "SHIP_UPGRADING"
                     self.last_button_press_time = current_time
                     print("Returning to Ship Upgrading menu.")
 
         elif self.game_state == "PROPULSION_MENU":
             if mouse_clicked and can_press_button:
-                if 'standard_thruster_button' in self.buttons and self.buttons['standard_thruster_button'].collidepoint(mouse_pos):
+                if clicked_button == 'standard_thruster_button':
                     self.player.set_engine("Standard Thruster")
                     self.last_button_press_time = current_time
-                elif 'ion_engine_button' in self.buttons and self.buttons['ion_engine_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'ion_engine_button':
                     self.player.set_engine("Ion Engine")
                     self.last_button_press_time = current_time
-                elif 'space_thruster_button' in self.buttons and self.buttons['space_thruster_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'space_thruster_button':
                     self.player.set_engine("Space Thruster")
                     self.last_button_press_time = current_time
-                elif 'hyper_drive_button' in self.buttons and self.buttons['hyper_drive_button'].collidepoint(mouse_pos): # New button
+                elif clicked_button == 'hyper_drive_button': # New button
                     self.player.set_engine("Hyper Drive")
                     self.last_button_press_time = current_time
-                elif 'back_button' in self.buttons and self.buttons['back_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'back_button':
                     self.game_state = "SHIP_UPGRADING"
                     self.last_button_press_time = current_time
                     print("Returning to Ship Upgrading menu.")
@@ -2121,7 +3016,7 @@ class GameManager:
 
         elif self.game_state == "TRADING_OUTPOST_MENU":
             if mouse_clicked and can_press_button:
-                if 'trade_crystal_button' in self.buttons and self.buttons['trade_crystal_button'].collidepoint(mouse_pos):
+                if clicked_button == 'trade_crystal_button':
                     # Check if player has enough resources
                     required_gold = GAS_GIANT_CRYSTAL_TRADE_COST["Gold"]
                     required_silicon = GAS_GIANT_CRYSTAL_TRADE_COST["Silicon"]
@@ -2139,14 +3034,14 @@ class GameManager:
                     else:
                         print("Insufficient resources for trade!")
                     self.last_button_press_time = current_time
-                elif 'back_button' in self.buttons and self.buttons['back_button'].collidepoint(mouse_pos):
+                elif clicked_button == 'back_button':
                     self.game_state = "PLAYING" # Go back to playing state
                     self.last_button_press_time = current_time
                     print("Returning to game.")
 
         elif self.game_state in ["ECONOMY_SHOP", "SHIP_SHOP"]: # For other placeholder menus
             if mouse_clicked and can_press_button:
-                if 'back_button' in self.buttons and self.buttons['back_button'].collidepoint(mouse_pos):
+                if clicked_button == 'back_button':
                     self.game_state = "PAUSED_AT_STATION"
                     self.last_button_press_time = current_time # Reset cooldown
                     print("Returning to previous menu.")
@@ -2156,6 +3051,7 @@ class GameManager:
         """Updates all game objects and handles collisions."""
         if self.game_over:
             return
+        TIMERS.advance(current_time) # Fires the timers due by now: missile lifetimes, ping phases, health regen
 
         # --- Camera Update (Damped Movement with Zoom) ---
         # Determine the target camera position based on player and zoom level
@@ -2182,6 +3078,7 @@ class GameManager:
                 # If base is destroyed, remove it
                 if self.enemy_base.health <= 0:
                     print("Enemy Base Destroyed!")
+                    self.invalidate_static_world(self.enemy_base.rect) # Base body is part of the static layer
                     self.enemy_base = None # Remove the base
 
             # Update enemies
@@ -2238,18 +3135,21 @@ class GameManager:
                 proj.update(self.camera_x, self.camera_y, current_time, self) # Pass self for homing missiles from base
 
 
-            # Cull asteroids if they are too far from the player (only general asteroids, not in mining zones)
-            for asteroid in list(self.asteroids): # Iterate over a copy to safely remove elements
-                is_in_mining_zone = False
-                for zone in self.mining_zones:
-                    if asteroid in zone.asteroids_in_zone:
-                        is_in_mining_zone = True
-                        break
-                
-                if not is_in_mining_zone: # Only cull general asteroids
-                    dist_to_player = math.hypot(asteroid.x - self.player.x, asteroid.y - self.player.y)
-                    if dist_to_player > WORLD_CULL_DISTANCE:
-                        asteroid.kill()
+            if self.sector_store:
+                self.stream_sectors() # General asteroids far from the player are kept in the sector store
+            else:
+                # Cull asteroids if they are too far from the player (only general asteroids, not in mining zones)
+                for asteroid in list(self.asteroids): # Iterate over a copy to safely remove elements
+                    is_in_mining_zone = False
+                    for zone in self.mining_zones:
+                        if asteroid in zone.asteroids_in_zone:
+                            is_in_mining_zone = True
+                            break
+
+                    if not is_in_mining_zone: # Only cull general asteroids
+                        dist_to_player = math.hypot(asteroid.x - self.player.x, asteroid.y - self.player.y)
+                        if dist_to_player > WORLD_CULL_DISTANCE:
+                            asteroid.kill()
 
             # Cull material drops if they are too far from the player
             for material_drop in list(self.material_drops_group):
@@ -2263,8 +3163,8 @@ class GameManager:
                 while len(zone.asteroids_in_zone) < zone.max_asteroids:
                     self.spawn_asteroid(in_mining_zone=zone)
             
-            # Then spawn general asteroids if needed
-            while len(self.asteroids) < MAX_ASTEROIDS + sum(z.max_asteroids for z in self.mining_zones): # Total asteroids
+            # Then spawn general asteroids if needed (the sector store keeps its own)
+            while not self.sector_store and len(self.asteroids) < MAX_ASTEROIDS + sum(z.max_asteroids for z in self.mining_zones): # Total asteroids
                 self.spawn_asteroid()
 
             # Spawn new enemies if needed
@@ -2327,15 +3227,18 @@ class GameManager:
                 for asteroid in self.asteroids:
                     if asteroid.is_stealth and not asteroid.is_revealed:
                         asteroid.is_revealed = True
-                        # Change image to revealed color
-                        asteroid.image.fill((0,0,0,0)) # Clear existing drawing
+                        self.asteroids.grid.touch(asteroid) # Shows up on the minimap now
+                        # Change image to revealed color. A new surface, since the old one may still be drawn
+                        # by the render thread or be held as a texture by the texture backend
+                        asteroid.image = pygame.Surface((asteroid.size * 2, asteroid.size * 2), pygame.SRCALPHA)
                         pygame.draw.circle(asteroid.image, STEALTH_ASTEROID_REVEAL_COLOR, (asteroid.size, asteroid.size), asteroid.size)
             else: # If advanced antenna is not equipped, ensure stealth asteroids are not revealed
                 for asteroid in self.asteroids:
                     if asteroid.is_stealth and asteroid.is_revealed:
                         asteroid.is_revealed = False
+                        self.asteroids.grid.touch(asteroid)
                         # Revert image to hidden color
-                        asteroid.image.fill((0,0,0,0)) # Clear existing drawing
+                        asteroid.image = pygame.Surface((asteroid.size * 2, asteroid.size * 2), pygame.SRCALPHA)
                         pygame.draw.circle(asteroid.image, asteroid.original_color, (asteroid.size, asteroid.size), asteroid.size)
 
 
@@ -2493,6 +3396,7 @@ class GameManager:
                     self.enemy_base.take_damage(projectile.damage)
                     if self.enemy_base.health <= 0:
                         print("Enemy Base Destroyed!")
+                        self.invalidate_static_world(self.enemy_base.rect) # Base body is part of the static layer
                         self.enemy_base = None # Remove the base
 
             # Enemy Projectiles vs Player
@@ -2518,106 +3422,6 @@ class GameManager:
             if self.player.health <= 0:
                 self.game_over = True
 
-            # --- Ping System Update ---
-            if self.outgoing_ping_active:
-                elapsed_time_ping = (current_time - self.outgoing_ping_start_time) / 1000.0 # in seconds
-                # Ping radius now affected by radar_range_multiplier
-                current_radius = PING_OUTGOING_SPEED * elapsed_time_ping * self.player.radar_range_multiplier
-
-                # Check if the ping has exceeded the screen boundaries
-                if current_radius > SCREEN_WIDTH / 2 or current_radius > SCREEN_HEIGHT / 2:
-                    if not self.incoming_ping_active: # Trigger incoming ping only once
-                        self.incoming_ping_active = True
-                        self.incoming_ping_start_time = current_time
-
-                # Deactivate outgoing ping after its lifetime
-                if elapsed_time_ping > PING_OUTGOING_LIFETIME:
-                    self.outgoing_ping_active = False
-
-            if self.incoming_ping_active:
-                elapsed_time_incoming = (current_time - self.incoming_ping_start_time) / 1000.0
-                alpha = max(0, 255 - int(255 * (elapsed_time_incoming / PING_INCOMING_DURATION)))
-            
-                player_screen_x, player_screen_y = self.world_to_screen(self.player.x, self.player.y)
-                station_screen_x, station_screen_y = self.world_to_screen(self.space_station.x, self.space_station.y)
-
-                dx = station_screen_x - player_screen_x
-                dy = station_screen_y - player_screen_y
-                distance = math.hypot(dx, dy)
-
-                if distance > 0:
-                    dir_x = dx / distance
-                    dir_y = dy / distance
-
-                    beam_end_x = player_screen_x + dir_x * PING_BEAM_LENGTH * zoom_factor
-                    beam_end_y = player_screen_y + dir_y * PING_BEAM_LENGTH * zoom_factor
-
-                    ping_beam_color_with_alpha = (PING_COLOR[0], PING_COLOR[1], PING_COLOR[2], alpha)
-                    
-                    line_surface = pygame.Surface(SCREEN.get_size(), pygame.SRCALPHA)
-                    pygame.draw.line(line_surface, ping_beam_color_with_alpha,
-                                     (player_screen_x, player_screen_y),
-                                     (beam_end_x, beam_end_y), int(3 * zoom_factor) or 1)
-                    SCREEN.blit(line_surface, (0, 0))
-
-                for planet in self.planets:
-                    planet_screen_x, planet_screen_y = self.world_to_screen(planet.x, planet.y)
-
-                    dx_p = planet_screen_x - player_screen_x
-                    dy_p = planet_screen_y - player_screen_y
-                    distance_p = math.hypot(dx_p, dy_p)
-
-                    if distance_p > 0:
-                        dir_x_p = dx_p / distance_p
-                        dir_y_p = dy_p / distance_p
-
-                        beam_end_x_p = player_screen_x + dir_x_p * PING_BEAM_LENGTH * zoom_factor
-                        beam_end_y_p = player_screen_y + dir_y_p * PING_BEAM_LENGTH * zoom_factor
-
-                        planet_ping_color_with_alpha = (YELLOW[0], YELLOW[1], YELLOW[2], alpha)
-
-                        line_surface_p = pygame.Surface(SCREEN.get_size(), pygame.SRCALPHA)
-                        pygame.draw.line(line_surface_p, planet_ping_color_with_alpha,
-                                         (player_screen_x, player_screen_y),
-                                         (beam_end_x_p, beam_end_y_p), int(3 * zoom_factor) or 1)
-                        SCREEN.blit(line_surface_p, (0, 0))
-
-                        pygame.draw.circle(SCREEN, planet_ping_color_with_alpha, (int(planet_screen_x), int(planet_screen_y)), int(5 * zoom_factor) or 1)
-                        
-                        # Scale font size for planet name or use a smaller font
-                        scaled_font_size = max(10, int(FONT.get_height() * zoom_factor))
-                        scaled_font = pygame.font.Font(None, scaled_font_size)
-                        planet_name_text = scaled_font.render(planet.planet_type_name, True, (255,255,255,alpha))
-                        planet_name_rect = planet_name_text.get_rect(center=(planet_screen_x, planet_screen_y - int(20 * zoom_factor)))
-                        SCREEN.blit(planet_name_text, planet_name_rect)
-
-                # Draw ping for stealth asteroids if revealed
-                if ANTENNA_TYPES[self.player.current_antenna_type]["reveals_stealth"]:
-                    for asteroid in self.asteroids:
-                        if asteroid.is_stealth and asteroid.is_revealed:
-                            asteroid_screen_x, asteroid_screen_y = self.world_to_screen(asteroid.x, asteroid.y)
-                            
-                            dx_a = asteroid_screen_x - player_screen_x
-                            dy_a = asteroid_screen_y - player_screen_y
-                            distance_a = math.hypot(dx_a, dy_a)
-
-                            if distance_a > 0:
-                                dir_x_a = dx_a / distance_a
-                                dir_y_a = dy_a / distance_a
-
-                                beam_end_x_a = player_screen_x + dir_x_a * PING_BEAM_LENGTH * zoom_factor
-                                beam_end_y_a = player_screen_y + dir_y_a * PING_BEAM_LENGTH * zoom_factor
-
-                                stealth_asteroid_ping_color_with_alpha = (STEALTH_ASTEROID_REVEAL_COLOR[0], STEALTH_ASTEROID_REVEAL_COLOR[1], STEALTH_ASTEROID_REVEAL_COLOR[2], alpha)
-
-                                line_surface_a = pygame.Surface(SCREEN.get_size(), pygame.SRCALPHA)
-                                pygame.draw.line(line_surface_a, stealth_asteroid_ping_color_with_alpha,
-                                                 (player_screen_x, player_screen_y),
-                                                 (beam_end_x_a, beam_end_y_a), int(3 * zoom_factor) or 1)
-                                SCREEN.blit(line_surface_a, (0, 0))
-
-                                pygame.draw.circle(SCREEN, stealth_asteroid_ping_color_with_alpha, (int(asteroid_screen_x), int(asteroid_screen_y)), int(5 * zoom_factor) or 1)
-
 
         # --- Jump Drive state logic ---
         if self.game_state == "JUMP_DRIVE_ALIGNING":
@@ -2652,12 +3456,28 @@ class GameManager:
                 self.last_jump_time = current_time # Start cooldown
                 print(f"Jump successful to ({self.player.x:.0f}, {self.player.y:.0f})")
 
-        # Health regeneration when in any station menu state
-        if self.game_state in ["PAUSED_AT_STATION", "ECONOMY_SHOP", "SHIP_UPGRADING", "SHIP_SHOP", "MINING_TOOLS_MENU", "ENERGY_CORE_MENU", "ANTENNA_MENU", "WEAPONS_MENU", "PROPULSION_MENU", "TRADING_OUTPOST_MENU"]:
-            if self.player.health < self.player.max_health:
-                if current_time - self.last_regen_time > HEALTH_REGEN_INTERVAL:
-                    self.player.health = min(self.player.max_health, self.player.health + HEALTH_REGEN_INCREMENT)
-                    self.last_regen_time = current_time
+        # Capture what this tick looks like for the world pass
+        self.render_snapshot = self.make_render_snapshot(current_time)
+
+    def start_incoming_ping(self):
+        """Starts the incoming ping once the outgoing ring has left the screen."""
+        if not self.incoming_ping_active: # Trigger incoming ping only once
+            self.incoming_ping_active = True
+            self.incoming_ping_start_time = TIMERS.now
+            self.ping_timers.append(TIMERS.schedule(PING_INCOMING_DURATION * 1000, self.end_incoming_ping))
+
+    def end_outgoing_ping(self):
+        self.outgoing_ping_active = False
+
+    def end_incoming_ping(self):
+        # Incoming beams are drawn by draw_ping_effects; stop them once they have fully faded
+        self.incoming_ping_active = False
+
+    def regenerate_health(self):
+        """Regenerates health while in any station menu state, every HEALTH_REGEN_INTERVAL."""
+        if self.game_state in ["PAUSED_AT_STATION", "ECONOMY_SHOP", "SHIP_UPGRADING", "SHIP_SHOP", "MINING_TOOLS_MENU", "ENERGY_CORE_MENU", "ANTENNA_MENU", "WEAPONS_MENU", "PROPULSION_MENU", "TRADING_OUTPOST_MENU"] and self.player.health < self.player.max_health:
+            self.player.health = min(self.player.max_health, self.player.health + HEALTH_REGEN_INCREMENT)
+        self.regen_timer = TIMERS.schedule(HEALTH_REGEN_INTERVAL, self.regenerate_health)
 
     def find_nearest_enemy(self, max_range=None):
         """
@@ -2702,39 +3522,32 @@ class GameManager:
 
     def draw_ui(self):
         """Draws the player's health, XP, and level on the screen."""
-        health_text = FONT.render(f"Health: {self.player.health}/{self.player.max_health}", True, GREEN)
-        SCREEN.blit(health_text, (10, 10))
+        # HUD widgets only re-render when the values passed to them change
+        self.hud_health_text.draw(SCREEN, (10, 10), self.player.health, self.player.max_health)
 
         # XP Bar and Level
-        xp_bar_width = 200
-        xp_bar_height = 20
         xp_bar_x = 10
         xp_bar_y = 40
         xp_percentage = self.player.current_xp / self.player.xp_threshold
-        current_xp_bar_width = int(xp_bar_width * xp_percentage)
-
-        pygame.draw.rect(SCREEN, GRAY, (xp_bar_x, xp_bar_y, xp_bar_width, xp_bar_height), 2) # XP bar outline
-        pygame.draw.rect(SCREEN, BLUE, (xp_bar_x, xp_bar_y, current_xp_bar_width, xp_bar_height)) # XP bar fill
-
-        xp_text = FONT.render(f"XP: {self.player.current_xp}/{self.player.xp_threshold} (Level {self.player.level})", True, WHITE)
-        SCREEN.blit(xp_text, (xp_bar_x + xp_bar_width + 10, xp_bar_y))
+        self.hud_xp_bar.draw(SCREEN, (xp_bar_x, xp_bar_y), xp_percentage)
+        self.hud_xp_text.draw(SCREEN, (xp_bar_x + self.hud_xp_bar.width + 10, xp_bar_y), self.player.current_xp, self.player.xp_threshold, self.player.level)
 
         # Draw "Press E to enter station/outpost" message if near
         if self.game_state == "PLAYING":
             dist_to_station = math.hypot(self.player.x - self.space_station.x, self.player.y - self.space_station.y)
             if dist_to_station < SPACESTATION_INTERACT_DISTANCE + 50: # Slightly larger trigger area for message
-                enter_text = FONT.render("Press 'E' to enter Space Station", True, WHITE)
+                enter_text = TEXT_CACHE.render(FONT, "Press 'E' to enter Space Station", WHITE)
                 text_rect = enter_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
                 SCREEN.blit(enter_text, text_rect)
             elif self.trading_outpost and math.hypot(self.player.x - self.trading_outpost.x, self.player.y - self.trading_outpost.y) < self.trading_outpost.size + 50:
-                enter_text = FONT.render("Press 'E' to enter Trading Outpost", True, WHITE)
+                enter_text = TEXT_CACHE.render(FONT, "Press 'E' to enter Trading Outpost", WHITE)
                 text_rect = enter_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
                 SCREEN.blit(enter_text, text_rect)
 
 
         # Draw "Press I for Inventory" message
         if self.game_state in ["PLAYING", "PAUSED_AT_STATION", "ECONOMY_SHOP", "SHIP_UPGRADING", "SHIP_SHOP", "MINING_TOOLS_MENU", "ENERGY_CORE_MENU", "ANTENNA_MENU", "WEAPONS_MENU", "PROPULSION_MENU", "TRADING_OUTPOST_MENU"]:
-            inventory_hint_text = FONT.render("Press 'I' for Inventory", True, WHITE)
+            inventory_hint_text = TEXT_CACHE.render(FONT, "Press 'I' for Inventory", WHITE)
             inventory_hint_rect = inventory_hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20))
             SCREEN.blit(inventory_hint_text, inventory_hint_rect)
 
@@ -2742,35 +3555,28 @@ class GameManager:
         if self.game_state == "PLAYING":
             if self.player.current_mining_tool == "AutoMiningLaser":
                 # Auto-Mine Charge Bar
-                charge_bar_width = 150
-                charge_bar_height = 15
-                charge_bar_x = SCREEN_WIDTH - charge_bar_width - 10
+                charge_bar_x = SCREEN_WIDTH - self.hud_charge_bar.width - 10
                 charge_bar_y = 10
                 charge_percentage = self.auto_mine_charge / AUTO_MINE_MAX_CHARGE
-                current_charge_bar_width = int(charge_bar_width * charge_percentage)
-
-                pygame.draw.rect(SCREEN, GRAY, (charge_bar_x, charge_bar_y, charge_bar_width, charge_bar_height), 2) # Charge bar outline
-                pygame.draw.rect(SCREEN, CHARGE_BAR_COLOR, (charge_bar_x, charge_bar_y, current_charge_bar_width, charge_bar_height)) # Charge bar fill
-
-                charge_text = FONT.render(f"Charge: {int(self.auto_mine_charge)}%", True, WHITE)
-                SCREEN.blit(charge_text, (charge_bar_x - 80, charge_bar_y))
+                self.hud_charge_bar.draw(SCREEN, (charge_bar_x, charge_bar_y), charge_percentage)
+                self.hud_charge_text.draw(SCREEN, (charge_bar_x - 80, charge_bar_y), int(self.auto_mine_charge))
 
                 # Auto-Mine Status/Hint
                 if self.auto_mine_active:
-                    auto_mine_status_text = FONT.render("Auto-Mine Active (Press 'F' to Stop)", True, YELLOW)
+                    auto_mine_status_text = TEXT_CACHE.render(FONT, "Auto-Mine Active (Press 'F' to Stop)", YELLOW)
                     auto_mine_status_rect = auto_mine_status_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80))
                     SCREEN.blit(auto_mine_status_text, auto_mine_status_rect)
                 elif self.auto_mine_charge <= 0:
-                    auto_mine_hint_text = FONT.render("Auto-Mine: No Charge (Refilling)", True, ORANGE)
+                    auto_mine_hint_text = TEXT_CACHE.render(FONT, "Auto-Mine: No Charge (Refilling)", ORANGE)
                     auto_mine_hint_rect = auto_mine_hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80))
                     SCREEN.blit(auto_mine_hint_text, auto_mine_hint_rect) # Corrected variable name
                 else:
-                    auto_mine_hint_text = FONT.render("Press 'F' to Auto-Mine", True, YELLOW)
+                    auto_mine_hint_text = TEXT_CACHE.render(FONT, "Press 'F' to Auto-Mine", YELLOW)
                     auto_mine_hint_rect = auto_mine_hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80))
                     SCREEN.blit(auto_mine_hint_text, auto_mine_hint_rect)
             else:
                 # Hint for other mining tools
-                mining_tool_hint_text = FONT.render(f"Hold 'F' to use {self.player.current_mining_tool}", True, YELLOW)
+                mining_tool_hint_text = TEXT_CACHE.render(FONT, f"Hold 'F' to use {self.player.current_mining_tool}", YELLOW)
                 mining_tool_hint_rect = mining_tool_hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80))
                 SCREEN.blit(mining_tool_hint_text, mining_tool_hint_rect)
 
@@ -2780,25 +3586,21 @@ class GameManager:
                 remaining_cooldown = max(0, effective_jump_cooldown - (pygame.time.get_ticks() - self.last_jump_time))
 
                 if remaining_cooldown > 0:
-                    cooldown_bar_width = 150
-                    cooldown_bar_height = 15
-                    cooldown_bar_x = SCREEN_WIDTH - cooldown_bar_width - 10
+                    cooldown_bar_x = SCREEN_WIDTH - self.hud_cooldown_bar.width - 10
                     cooldown_bar_y = 50 # Position below auto-miner charge bar, or higher if auto-miner isn't shown
 
                     cooldown_percentage = 1 - (remaining_cooldown / effective_jump_cooldown)
-                    current_cooldown_bar_width = int(cooldown_bar_width * cooldown_percentage)
-
-                    pygame.draw.rect(SCREEN, GRAY, (cooldown_bar_x, cooldown_bar_y, cooldown_bar_width, cooldown_bar_height), 2) # Cooldown bar outline
-                    pygame.draw.rect(SCREEN, COOLDOWN_BAR_COLOR, (cooldown_bar_x, cooldown_bar_y, current_cooldown_bar_width, cooldown_bar_height)) # Cooldown bar fill
-
-                    cooldown_text = FONT.render(f"Jump CD: {remaining_cooldown / 1000:.1f}s", True, WHITE)
-                    SCREEN.blit(cooldown_text, (cooldown_bar_x - 100, cooldown_bar_y))
+                    self.hud_cooldown_bar.draw(SCREEN, (cooldown_bar_x, cooldown_bar_y), cooldown_percentage)
+                    # Rounded to the displayed precision so the label re-renders at most 10 times a second
+                    self.hud_cooldown_text.draw(SCREEN, (cooldown_bar_x - 100, cooldown_bar_y), round(remaining_cooldown / 1000, 1))
 
             # Weapon Slot 1 and 2 info
-            weapon1_text = FONT.render(f"Slot 1 (Space): {self.player.weapon_slot_1}", True, WHITE)
-            SCREEN.blit(weapon1_text, (10, 70))
-            weapon2_text = FONT.render(f"Slot 2 (L-Ctrl): {self.player.weapon_slot_2}", True, WHITE)
-            SCREEN.blit(weapon2_text, (10, 100))
+            self.hud_weapon1_text.draw(SCREEN, (10, 70), self.player.weapon_slot_1)
+            self.hud_weapon2_text.draw(SCREEN, (10, 100), self.player.weapon_slot_2)
+
+            # Render quality, only shown once the governor has had to lower it
+            if not self.quality_governor.is_highest():
+                self.hud_quality_text.draw(SCREEN, (10, 130), self.quality_governor.name)
 
             # Enemy Base Proximity Warning
             if self.enemy_base:
@@ -2807,7 +3609,10 @@ class GameManager:
                     warning_text = "WARNING: Approaching Enemy Base!"
                     # Scale warning intensity based on proximity
                     proximity_ratio = 1 - (dist_to_base / ENEMY_BASE_PROXIMITY_RADIUS) # 0 when far, 1 when close
-                    
+                    # Quantized like the proximity ring, so the warning text hits the text cache
+                    proximity_level = min(PROXIMITY_COLOR_LEVELS - 1, int(proximity_ratio * PROXIMITY_COLOR_LEVELS))
+                    proximity_ratio = proximity_level / (PROXIMITY_COLOR_LEVELS - 1)
+
                     # Interpolate color from green to yellow to red
                     if proximity_ratio < 0.5:
                         # Green to Yellow
@@ -2822,42 +3627,159 @@ class GameManager:
                     warning_color = (r, g, b)
 
                     warning_font_size = int(MENU_FONT.get_height() * (1 + proximity_ratio * 0.5)) # Grow text
-                    warning_font = pygame.font.Font(None, warning_font_size)
-                    warning_surf = warning_font.render(warning_text, True, warning_color)
+                    warning_font = TEXT_CACHE.get_font(warning_font_size)
+                    warning_surf = TEXT_CACHE.render(warning_font, warning_text, warning_color)
                     warning_rect = warning_surf.get_rect(center=(SCREEN_WIDTH // 2, 50))
                     SCREEN.blit(warning_surf, warning_rect)
 
+            # Minimap
+            self.draw_minimap()
+
+
+    def draw_minimap(self):
+        """
+        Draws the HUD minimap in the bottom-right corner. Static content and asteroids come from
+        the minimap's cached texture (kept in sync through the asteroid index), so the per-frame
+        cost only depends on the number of moving objects, not on the number of asteroids.
+        """
+        points = []
+        for npc in self.mining_npcs:
+            points.append((npc.x, npc.y, NPC_COLOR))
+        for enemy in self.enemies:
+            points.append((enemy.x, enemy.y, RED))
+
+        minimap_pos = (SCREEN_WIDTH - MINIMAP_SIZE - MINIMAP_MARGIN, SCREEN_HEIGHT - MINIMAP_SIZE - MINIMAP_MARGIN)
+        self.minimap.draw(SCREEN, minimap_pos, self.player.x, self.player.y, points)
+
+    @staticmethod
+    def get_asteroid_marker_color(asteroid):
+        """Returns the minimap dot and zoomed-out impostor color of an asteroid, or None while it is hidden."""
+        if not asteroid.is_stealth:
+            return GRAY
+        if asteroid.is_revealed:
+            return STEALTH_ASTEROID_REVEAL_COLOR
+        return None
+
+    def make_render_snapshot(self, current_time):
+        """
+        Captures everything the world pass needs to draw one frame as immutable records, so
+        the frame can be drawn (possibly on the render thread) while the next tick simulates.
+        """
+        view_zoom = JUMP_DRIVE_ZOOM_FACTOR if self.jump_drive_zoom_active else 1.0
+        zoom_factor = view_zoom * RENDER_SCALE # World units to pixels of the world render target
+
+        mining_laser = None
+        if self.mining_laser_active and self.game_state == "PLAYING":
+            if self.player.current_mining_tool == "ShortRangeLaser":
+                mining_laser = (self.mouse_world_x, self.mouse_world_y, SHORT_RANGE_LASER_RANGE)
+            elif self.player.current_mining_tool == "LongRangeLaser":
+                mining_laser = (self.mouse_world_x, self.mouse_world_y, LONG_RANGE_LASER_RANGE)
+
+        auto_mine_targets = ()
+        if self.auto_mine_active and self.game_state == "PLAYING" and self.player.current_mining_tool == "AutoMiningLaser":
+            auto_mine_targets = tuple((asteroid.x, asteroid.y) for asteroid in self.targeted_asteroids)
+
+        revealed_asteroids = ()
+        if self.incoming_ping_active and ANTENNA_TYPES[self.player.current_antenna_type]["reveals_stealth"]:
+            revealed_asteroids = tuple((asteroid.x, asteroid.y) for asteroid in self.asteroids if asteroid.is_stealth and asteroid.is_revealed)
+
+        player_projectiles = []
+        for projectile in self.player_projectiles:
+            if isinstance(projectile, HomingMissile): # Covers both HomingMissile and SwarmRocketProjectile
+                player_projectiles.append(ProjectileRecord(projectile.x, projectile.y, projectile.angle, projectile.color, projectile.original_image, type(projectile).__name__))
+            else:
+                player_projectiles.append(ProjectileRecord(projectile.x, projectile.y, projectile.angle, projectile.color, None, None))
+
+        static_invalidations = tuple(self.pending_static_invalidations)
+        self.pending_static_invalidations.clear()
+
+        return RenderSnapshot(
+            time=current_time,
+            camera_x=self.camera_x,
+            camera_y=self.camera_y,
+            zoom_factor=zoom_factor,
+            view_zoom=view_zoom,
+            static_world=self.get_static_world(),
+            static_invalidations=static_invalidations,
+            player=SpriteRecord(self.player.x, self.player.y, self.player.angle, self.player.original_image, "Player"),
+            asteroids=tuple(AsteroidRecord(asteroid.x, asteroid.y, asteroid.size, asteroid.image, asteroid.health, asteroid.max_health,
+                                           self.get_asteroid_marker_color(asteroid))
+                            for asteroid in self.asteroids if not asteroid.is_stealth or asteroid.is_revealed),
+            enemies=tuple(SpriteRecord(enemy.x, enemy.y, enemy.angle, enemy.original_image, type(enemy).__name__) for enemy in self.enemies),
+            mining_npcs=tuple(SpriteRecord(npc.x, npc.y, npc.angle, npc.original_image, "MiningNPC") for npc in self.mining_npcs),
+            player_projectiles=tuple(player_projectiles),
+            enemy_projectiles=tuple((projectile.x, projectile.y, projectile.color) for projectile in self.enemy_projectiles),
+            ship_parts=tuple(DropRecord(part.x, part.y, part.size, part.image, ("ShipPart", part.size)) for part in self.ship_parts_group),
+            material_drops=tuple(DropRecord(drop.x, drop.y, drop.size, drop.image, ("MaterialDrop", drop.material_type, drop.size)) for drop in self.material_drops_group),
+            mining_laser=mining_laser,
+            auto_mine_targets=auto_mine_targets,
+            outgoing_ping=(self.outgoing_ping_start_time, self.outgoing_ping_world_pos) if self.outgoing_ping_active else None,
+            incoming_ping_start_time=self.incoming_ping_start_time if self.incoming_ping_active else None,
+            revealed_asteroids=revealed_asteroids,
+            jump_rings_start_time=self.jump_rings_start_time if self.jump_rings_active and self.game_state == "JUMP_DRIVE_WARP" else None,
+            quality=self.quality_governor.settings,
+        )
 
     def draw_game_objects(self):
         """Draws all game objects relative to the camera, with zoom."""
-        zoom_factor = JUMP_DRIVE_ZOOM_FACTOR if self.jump_drive_zoom_active else 1.0
+        self.world_canvas.clear() # Clear screen
+        self.draw_world(self.world_canvas, self.render_snapshot)
+        if self.world_target is not None:
+            self.present_world(self.world_target)
+        self.draw_world_overlays()
 
-        # Draw Safezone (around space station)
-        if self.space_station:
-            safezone_screen_x, safezone_screen_y = self.world_to_screen(self.space_station.x, self.space_station.y)
-            scaled_safezone_radius = int(SAFEZONE_RADIUS * zoom_factor)
-            
-            # Create a semi-transparent surface for the safezone circle
-            safezone_surface = pygame.Surface((scaled_safezone_radius * 2, scaled_safezone_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(safezone_surface, SAFEZONE_COLOR, (scaled_safezone_radius, scaled_safezone_radius), scaled_safezone_radius)
-            
-            safezone_rect = safezone_surface.get_rect(center=(safezone_screen_x, safezone_screen_y))
-            SCREEN.blit(safezone_surface, safezone_rect)
+    def present(self):
+        """
+        Shows the finished frame: flips the display, or with the texture backend composites
+        the UI layer (SCREEN) over the world drawn by the renderer and presents that.
+        """
+        if RENDERER:
+            self.world_canvas.present(SCREEN, self.ui_texture)
+        else:
+            pygame.display.flip() # Update the full display Surface to the screen
 
-        # Draw Mining Safezones
-        for zone in self.mining_zones:
-            zone.draw(SCREEN, self.camera_x, self.camera_y, zoom_factor)
+    @staticmethod
+    def present_world(world_frame):
+        """Copies a finished world frame to the screen, scaling it up if it was drawn at a lower resolution."""
+        if world_frame.get_size() == SCREEN.get_size():
+            SCREEN.blit(world_frame, (0, 0))
+        else:
+            pygame.transform.scale(world_frame, SCREEN.get_size(), SCREEN)
+
+    def draw_world(self, canvas, snapshot):
+        """
+        Draws the game world (static layer, entities, lasers, ping and jump effects) for one
+        render snapshot onto a SurfaceCanvas or TextureCanvas. Only reads the snapshot, so it
+        is safe to run on the render thread.
+        """
+        camera_x = snapshot.camera_x
+        camera_y = snapshot.camera_y
+        zoom_factor = snapshot.zoom_factor
+        enemy_base = snapshot.static_world.enemy_base
+        quality = snapshot.quality
+        rotation_step = quality["rotation_step"]
+        # Level of detail: when zoomed out for the jump drive, asteroids become cached discs, ships
+        # become fixed-size unrotated icons and projectiles and drops become tiny markers
+        lod = snapshot.view_zoom < LOD_ZOOM_THRESHOLD
+
+        # Draw static world content (safezones, station, outpost, enemy base body, planets) from cached tiles
+        for world_rect in snapshot.static_invalidations:
+            self.static_layer.invalidate(world_rect)
+        self.static_layer.draw(canvas, camera_x, camera_y, zoom_factor, snapshot.static_world)
 
         # Draw Enemy Base Proximity Ring
-        if self.enemy_base:
-            dist_to_base = math.hypot(self.player.x - self.enemy_base.x, self.player.y - self.enemy_base.y)
+        if enemy_base:
+            dist_to_base = math.hypot(snapshot.player.x - enemy_base.x, snapshot.player.y - enemy_base.y)
             if dist_to_base < ENEMY_BASE_PROXIMITY_RADIUS:
-                proximity_screen_x, proximity_screen_y = self.world_to_screen(self.enemy_base.x, self.enemy_base.y)
+                proximity_screen_x, proximity_screen_y = self.world_to_screen_static(enemy_base.x, enemy_base.y, camera_x, camera_y, zoom_factor)
                 scaled_proximity_radius = int(ENEMY_BASE_PROXIMITY_RADIUS * zoom_factor)
                 
                 # Interpolate color and thickness
                 proximity_ratio = 1 - (dist_to_base / ENEMY_BASE_PROXIMITY_RADIUS)
-                
+                # Quantize the ratio so the ring overlay only changes (and is re-rendered) at a few levels
+                proximity_level = min(PROXIMITY_COLOR_LEVELS - 1, int(proximity_ratio * PROXIMITY_COLOR_LEVELS))
+                proximity_ratio = proximity_level / (PROXIMITY_COLOR_LEVELS - 1)
+
                 # Color interpolation (Green -> Yellow -> Red)
                 if proximity_ratio < 0.5:
                     r = int(PROXIMITY_GREEN[0] + (PROXIMITY_YELLOW[0] - PROXIMITY_GREEN[0]) * (proximity_ratio * 2))
@@ -2875,162 +3797,132 @@ class GameManager:
                 # Thickness interpolation (thinner when far, thicker when close)
                 thickness = max(1, int(5 * proximity_ratio * zoom_factor)) # Min thickness 1
 
-                # Pulsating effect for radius
-                pulse_factor = (math.sin(pygame.time.get_ticks() / 100.0) + 1) / 2 # 0 to 1
-                pulsating_radius = scaled_proximity_radius * (1 + 0.05 * pulse_factor) # Max 5% pulse
-
-                proximity_surface = pygame.Surface((int(pulsating_radius * 2), int(pulsating_radius * 2)), pygame.SRCALPHA)
-                pygame.draw.circle(proximity_surface, proximity_color, (int(pulsating_radius), int(pulsating_radius)), int(pulsating_radius), thickness)
-                
-                proximity_rect = proximity_surface.get_rect(center=(proximity_screen_x, proximity_screen_y))
-                SCREEN.blit(proximity_surface, proximity_rect)
-
-
-        # Draw Space Station
-        screen_x, screen_y = self.world_to_screen(self.space_station.x, self.space_station.y)
-        scaled_size = int(self.space_station.size * zoom_factor)
-        # Re-draw station image scaled
-        if scaled_size > 0: # Avoid drawing if size becomes 0
-            scaled_station_image = pygame.transform.scale(self.space_station.image, (scaled_size, scaled_size))
-            draw_rect = scaled_station_image.get_rect(center=(screen_x, screen_y))
-            SCREEN.blit(scaled_station_image, draw_rect)
-
-        # Draw Trading Outpost (new)
-        if self.trading_outpost:
-            screen_x, screen_y = self.world_to_screen(self.trading_outpost.x, self.trading_outpost.y)
-            scaled_size = int(self.trading_outpost.size * zoom_factor)
-            if scaled_size > 0:
-                scaled_outpost_image = pygame.transform.scale(self.trading_outpost.image, (scaled_size, scaled_size))
-                draw_rect = scaled_outpost_image.get_rect(center=(screen_x, screen_y))
-                SCREEN.blit(scaled_outpost_image, draw_rect)
-
-        # Draw Enemy Base
-        if self.enemy_base:
-            self.enemy_base.draw(SCREEN, self.camera_x, self.camera_y, zoom_factor)
-
-
-        # Draw Asteroids
-        for asteroid in self.asteroids:
-            # Only draw if not stealth or if revealed
-            if not asteroid.is_stealth or asteroid.is_revealed:
-                screen_x, screen_y = self.world_to_screen(asteroid.x, asteroid.y)
-                scaled_size = int(asteroid.size * zoom_factor)
-                if scaled_size > 0:
-                    # Use asteroid.image which is already updated for revealed state
-                    scaled_asteroid_image = pygame.transform.scale(asteroid.image, (scaled_size * 2, scaled_size * 2))
-                    draw_rect = scaled_asteroid_image.get_rect(center=(screen_x, screen_y))
-                    SCREEN.blit(scaled_asteroid_image, draw_rect)
-                    # Draw health bar for asteroid (also scaled)
-                    if asteroid.health < asteroid.max_health:
-                        bar_width = int(asteroid.size * 2 * zoom_factor)
-                        bar_height = int(5 * zoom_factor)
-                        health_percentage = asteroid.health / asteroid.max_health
-                        current_health_width = int(bar_width * health_percentage)
-
-                        health_bar_bg_rect = pygame.Rect(screen_x - scaled_size, screen_y + scaled_size + int(5 * zoom_factor), bar_width, bar_height)
-                        health_bar_rect = pygame.Rect(screen_x - scaled_size, screen_y + scaled_size + int(5 * zoom_factor), current_health_width, bar_height)
-
-                        pygame.draw.rect(SCREEN, RED, health_bar_bg_rect)
-                        pygame.draw.rect(SCREEN, GREEN, health_bar_rect)
-
-
-        # Draw Enemies
-        for enemy in self.enemies:
-            screen_x, screen_y = self.world_to_screen(enemy.x, enemy.y)
-            scaled_width = int(enemy.original_image.get_width() * zoom_factor)
-            scaled_height = int(enemy.original_image.get_height() * zoom_factor)
-            if scaled_width > 0 and scaled_height > 0:
-                scaled_enemy_image = pygame.transform.scale(enemy.original_image, (scaled_width, scaled_height))
-                scaled_rotated_enemy_image = pygame.transform.rotate(scaled_enemy_image, enemy.angle)
-                draw_rect = scaled_rotated_enemy_image.get_rect(center=(screen_x, screen_y))
-                SCREEN.blit(scaled_rotated_enemy_image, draw_rect)
-
-        # Draw Planets
-        for planet in self.planets:
-            screen_x, screen_y = self.world_to_screen(planet.x, planet.y)
-            scaled_size = int(planet.size * zoom_factor)
+                # Pulsating effect for radius, selecting among a few pre-rendered radii
+                pulse_step = 0
+                if quality["proximity_pulse"]:
+                    pulse_factor = (math.sin(snapshot.time / 100.0) + 1) / 2 # 0 to 1
+                    pulse_step = min(PROXIMITY_PULSE_STEPS - 1, int(pulse_factor * PROXIMITY_PULSE_STEPS))
+                pulsating_radius = int(scaled_proximity_radius * (1 + 0.05 * pulse_step / (PROXIMITY_PULSE_STEPS - 1))) # Max 5% pulse
+
+                if quality["overlay_alpha"]:
+                    OVERLAY_CACHE.blit_circle(canvas, (proximity_screen_x, proximity_screen_y), pulsating_radius, proximity_color, thickness)
+                else: # Opaque outline straight onto the canvas, no full-size alpha blit
+                    canvas.circle(proximity_color[:3], (proximity_screen_x, proximity_screen_y), pulsating_radius, thickness)
+
+        # Draw Enemy Base health bar (the base body comes from the static layer)
+        if enemy_base:
+            EnemyBase.draw_health_bar(enemy_base, canvas, camera_x, camera_y, zoom_factor)
+
+
+        # Draw Asteroids (stealth asteroids only make it into the snapshot once revealed)
+        if lod:
+            # Like the turret bolts below, this loop avoids per-asteroid method calls
+            asteroid_impostors = []
+            impostor_stamps = {} # (color, diameter) -> disc stamp, looked up once per frame
+            camera_offset_x = camera_x * zoom_factor
+            camera_offset_y = camera_y * zoom_factor
+            for asteroid in snapshot.asteroids:
+                diameter = int(asteroid.size * 2 * zoom_factor)
+                if diameter < LOD_MARKER_SIZE:
+                    diameter = LOD_MARKER_SIZE
+                stamp = impostor_stamps.get((asteroid.color, diameter))
+                if stamp is None:
+                    stamp = impostor_stamps[(asteroid.color, diameter)] = STAMP_CACHE.get_circle(asteroid.color, diameter)
+                radius = diameter // 2
+                asteroid_impostors.append((stamp, (asteroid.x * zoom_factor - camera_offset_x - radius, asteroid.y * zoom_factor - camera_offset_y - radius)))
+            canvas.blits(asteroid_impostors)
+
+        draw_asteroid_health_bars = quality["asteroid_health_bars"] and (snapshot.view_zoom >= 1 or quality["zoomed_out_detail"])
+        for asteroid in snapshot.asteroids if not lod else ():
+            screen_x, screen_y = self.world_to_screen_static(asteroid.x, asteroid.y, camera_x, camera_y, zoom_factor)
+            scaled_size = int(asteroid.size * zoom_factor)
             if scaled_size > 0:
-                scaled_planet_image = pygame.transform.scale(planet.image, (scaled_size * 2, scaled_size * 2))
-                draw_rect = scaled_planet_image.get_rect(center=(screen_x, screen_y))
-                SCREEN.blit(scaled_planet_image, draw_rect)
-
-        # Draw Mining NPCs
-        for npc in self.mining_npcs:
-            npc.draw(SCREEN, self.camera_x, self.camera_y, zoom_factor)
+                # Use asteroid.image which is already updated for revealed state
+                canvas.draw_scaled(asteroid.image, (screen_x, screen_y), (scaled_size * 2, scaled_size * 2))
+                # Draw health bar for asteroid (also scaled)
+                if draw_asteroid_health_bars and asteroid.health < asteroid.max_health:
+                    bar_width = int(asteroid.size * 2 * zoom_factor)
+                    bar_height = int(5 * zoom_factor)
+                    health_percentage = asteroid.health / asteroid.max_health
+                    current_health_width = int(bar_width * health_percentage)
+
+                    health_bar_bg_rect = pygame.Rect(screen_x - scaled_size, screen_y + scaled_size + int(5 * zoom_factor), bar_width, bar_height)
+                    health_bar_rect = pygame.Rect(screen_x - scaled_size, screen_y + scaled_size + int(5 * zoom_factor), current_health_width, bar_height)
+
+                    canvas.fill(RED, health_bar_bg_rect)
+                    canvas.fill(GREEN, health_bar_rect)
+
+
+        # Draw Enemies and Mining NPCs
+        for sprite in snapshot.enemies + snapshot.mining_npcs:
+            screen_x, screen_y = self.world_to_screen_static(sprite.x, sprite.y, camera_x, camera_y, zoom_factor)
+            if lod:
+                icon = STAMP_CACHE.get_scaled(sprite.kind, sprite.original_image, (LOD_ICON_SIZE, LOD_ICON_SIZE))
+                canvas.blit(icon, (screen_x - LOD_ICON_SIZE // 2, screen_y - LOD_ICON_SIZE // 2))
+                continue
+            canvas.draw_sprite(sprite.kind, sprite.original_image, (screen_x, screen_y), zoom_factor, sprite.angle, rotation_step)
+
+        # Projectiles, ship parts and material drops are drawn from shared stamps and
+        # submitted to the canvas in a single blits() call. Homing missiles and swarm rockets
+        # are scaled and rotated by the canvas, so they are drawn on top of that batch.
+        # Below full quality they are left out entirely while zoomed out for the jump drive.
+        draw_small_objects = snapshot.view_zoom >= 1 or quality["zoomed_out_detail"]
+        blit_sequence = []
+        missiles = [] # (projectile, screen position) of the homing missiles and swarm rockets
+        bolt_size = (LOD_MARKER_SIZE, LOD_MARKER_SIZE) if lod else (int(5 * zoom_factor), int(10 * zoom_factor))
+        bolt_offset_x = camera_x * zoom_factor + bolt_size[0] // 2
+        bolt_offset_y = camera_y * zoom_factor + bolt_size[1] // 2
+        bolt_stamps = {} # Projectile color -> stamp, looked up once per color per frame
 
         # Draw Projectiles (including HomingMissiles and SwarmRockets)
-        for projectile in self.player_projectiles:
-            screen_x, screen_y = self.world_to_screen(projectile.x, projectile.y)
+        for projectile in snapshot.player_projectiles if draw_small_objects else ():
+            screen_x, screen_y = self.world_to_screen_static(projectile.x, projectile.y, camera_x, camera_y, zoom_factor)
             
             # Scale projectile image based on its type
-            if isinstance(projectile, HomingMissile): # Covers both HomingMissile and SwarmRocketProjectile
-                scaled_width = int(projectile.original_image.get_width() * zoom_factor)
-                scaled_height = int(projectile.original_image.get_height() * zoom_factor)
-                if scaled_width > 0 and scaled_height > 0:
-                    scaled_projectile_image = pygame.transform.scale(projectile.original_image, (scaled_width, scaled_height))
-                    scaled_rotated_projectile_image = pygame.transform.rotate(scaled_projectile_image, projectile.angle)
-                    draw_rect = scaled_rotated_projectile_image.get_rect(center=(screen_x, screen_y))
-                    SCREEN.blit(scaled_rotated_projectile_image, draw_rect)
-            else: # Regular Projectile
-                scaled_width = int(5 * zoom_factor)
-                scaled_height = int(10 * zoom_factor)
-                if scaled_width > 0 and scaled_height > 0:
-                    scaled_projectile_image = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
-                    pygame.draw.rect(scaled_projectile_image, projectile.color, (0, 0, scaled_width, scaled_height))
-                    draw_rect = scaled_projectile_image.get_rect(center=(screen_x, screen_y))
-                    SCREEN.blit(scaled_projectile_image, draw_rect)
-
-        for projectile in self.enemy_projectiles:
-            screen_x, screen_y = self.world_to_screen(projectile.x, projectile.y)
-            scaled_width = int(5 * zoom_factor)
-            scaled_height = int(10 * zoom_factor)
-            if scaled_width > 0 and scaled_height > 0:
-                scaled_projectile_image = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
-                pygame.draw.rect(scaled_projectile_image, projectile.color, (0, 0, scaled_width, scaled_height))
-                draw_rect = scaled_projectile_image.get_rect(center=(screen_x, screen_y))
-                SCREEN.blit(scaled_projectile_image, draw_rect)
-
-        # Draw Ship Parts
-        for part in self.ship_parts_group:
-            screen_x, screen_y = self.world_to_screen(part.x, part.y)
-            scaled_size = int(part.size * zoom_factor)
-            if scaled_size > 0:
-                scaled_part_image = pygame.transform.scale(part.image, (scaled_size, scaled_size))
-                draw_rect = scaled_part_image.get_rect(center=(screen_x, screen_y))
-                SCREEN.blit(scaled_part_image, draw_rect)
-
-        # Draw Material Drops
-        for material_drop in self.material_drops_group:
-            screen_x, screen_y = self.world_to_screen(material_drop.x, material_drop.y)
-            scaled_size = int(material_drop.size * zoom_factor)
+            if projectile.original_image is not None and not lod: # Homing missiles and swarm rockets
+                missiles.append((projectile, (screen_x, screen_y)))
+            elif bolt_size[0] > 0 and bolt_size[1] > 0: # Regular Projectile, or any projectile's marker when zoomed out
+                blit_sequence.append((STAMP_CACHE.get_rect(projectile.color, bolt_size), (screen_x - bolt_size[0] // 2, screen_y - bolt_size[1] // 2)))
+
+        if draw_small_objects and bolt_size[0] > 0 and bolt_size[1] > 0:
+            # Turret bolts can number in the hundreds, so this loop avoids per-bolt method calls
+            for projectile_x, projectile_y, projectile_color in snapshot.enemy_projectiles:
+                stamp = bolt_stamps.get(projectile_color)
+                if stamp is None:
+                    stamp = bolt_stamps[projectile_color] = STAMP_CACHE.get_rect(projectile_color, bolt_size)
+                blit_sequence.append((stamp, (projectile_x * zoom_factor - bolt_offset_x, projectile_y * zoom_factor - bolt_offset_y)))
+
+        # Draw Ship Parts and Material Drops
+        drop_markers = {} # Drop key -> marker stamp in the drop's center color, looked up once per frame
+        for drop in snapshot.ship_parts + snapshot.material_drops if draw_small_objects else ():
+            if lod:
+                marker = drop_markers.get(drop.key)
+                if marker is None:
+                    marker_color = drop.image.get_at((drop.image.get_width() // 2, drop.image.get_height() // 2))
+                    marker = drop_markers[drop.key] = STAMP_CACHE.get_rect(tuple(marker_color), (LOD_MARKER_SIZE, LOD_MARKER_SIZE))
+                screen_x, screen_y = self.world_to_screen_static(drop.x, drop.y, camera_x, camera_y, zoom_factor)
+                blit_sequence.append((marker, (screen_x - LOD_MARKER_SIZE // 2, screen_y - LOD_MARKER_SIZE // 2)))
+                continue
+            scaled_size = int(drop.size * zoom_factor)
             if scaled_size > 0:
-                scaled_material_image = pygame.transform.scale(material_drop.image, (scaled_size, scaled_size))
-                draw_rect = scaled_material_image.get_rect(center=(screen_x, screen_y))
-                SCREEN.blit(scaled_material_image, draw_rect)
+                screen_x, screen_y = self.world_to_screen_static(drop.x, drop.y, camera_x, camera_y, zoom_factor)
+                scaled_drop_image = STAMP_CACHE.get_scaled(drop.key, drop.image, (scaled_size, scaled_size))
+                blit_sequence.append((scaled_drop_image, (screen_x - scaled_size // 2, screen_y - scaled_size // 2)))
+
+        canvas.blits(blit_sequence)
+        for projectile, screen_pos in missiles:
+            canvas.draw_sprite((projectile.kind, projectile.color), projectile.original_image, screen_pos, zoom_factor, projectile.angle, rotation_step)
 
         # Draw Player
-        player_screen_x, player_screen_y = self.world_to_screen(self.player.x, self.player.y)
-        scaled_player_width = int(self.player.original_image.get_width() * zoom_factor)
-        scaled_player_height = int(self.player.original_image.get_height() * zoom_factor)
-        if scaled_player_width > 0 and scaled_player_height > 0:
-            scaled_player_image = pygame.transform.scale(self.player.original_image, (scaled_player_width, scaled_player_height))
-            scaled_rotated_player_image = pygame.transform.rotate(scaled_player_image, self.player.angle)
-            draw_rect = scaled_rotated_player_image.get_rect(center=(player_screen_x, player_screen_y))
-            SCREEN.blit(scaled_rotated_player_image, draw_rect)
+        player = snapshot.player
+        player_screen_x, player_screen_y = self.world_to_screen_static(player.x, player.y, camera_x, camera_y, zoom_factor)
+        canvas.draw_sprite(player.kind, player.original_image, (player_screen_x, player_screen_y), zoom_factor, player.angle, rotation_step)
 
         # Draw mining laser if active and playing and tool is ShortRangeLaser or LongRangeLaser
-        if self.mining_laser_active and self.game_state == "PLAYING" and \
-           (self.player.current_mining_tool == "ShortRangeLaser" or \
-            self.player.current_mining_tool == "LongRangeLaser"):
-            
-            player_screen_x, player_screen_y = self.world_to_screen(self.player.x, self.player.y)
-            mouse_screen_x, mouse_screen_y = self.world_to_screen(self.mouse_world_x, self.mouse_world_y)
-
-            mining_range_to_draw = 0
-            if self.player.current_mining_tool == "ShortRangeLaser":
-                mining_range_to_draw = SHORT_RANGE_LASER_RANGE * zoom_factor
-            elif self.player.current_mining_tool == "LongRangeLaser":
-                mining_range_to_draw = LONG_RANGE_LASER_RANGE * zoom_factor
+        if snapshot.mining_laser:
+            mouse_world_x, mouse_world_y, mining_range = snapshot.mining_laser
+            mouse_screen_x, mouse_screen_y = self.world_to_screen_static(mouse_world_x, mouse_world_y, camera_x, camera_y, zoom_factor)
+            mining_range_to_draw = mining_range * zoom_factor
 
             dx = mouse_screen_x - player_screen_x
             dy = mouse_screen_y - player_screen_y
@@ -3044,132 +3936,23 @@ class GameManager:
                 end_x = mouse_screen_x
                 end_y = mouse_screen_y
 
-            pygame.draw.line(SCREEN, MINING_LASER_COLOR,
-                             (player_screen_x, player_screen_y),
-                             (end_x, end_y), int(3 * zoom_factor) or 1)
+            canvas.line(MINING_LASER_COLOR,
+                        (player_screen_x, player_screen_y),
+                        (end_x, end_y), int(3 * zoom_factor) or 1)
 
         # Draw auto-mining laser beams if active
-        if self.auto_mine_active and self.game_state == "PLAYING" and self.player.current_mining_tool == "AutoMiningLaser":
-            player_screen_x, player_screen_y = self.world_to_screen(self.player.x, self.player.y)
-            for asteroid in self.targeted_asteroids:
-                asteroid_screen_x, asteroid_screen_y = self.world_to_screen(asteroid.x, asteroid.y)
-                pygame.draw.line(SCREEN, AUTO_MINE_BEAM_COLOR,
-                                 (player_screen_x, player_screen_y),
-                                 (asteroid_screen_x, asteroid_screen_y), int(2 * zoom_factor) or 1)
+        for asteroid_x, asteroid_y in snapshot.auto_mine_targets:
+            asteroid_screen_x, asteroid_screen_y = self.world_to_screen_static(asteroid_x, asteroid_y, camera_x, camera_y, zoom_factor)
+            canvas.line(AUTO_MINE_BEAM_COLOR,
+                        (player_screen_x, player_screen_y),
+                        (asteroid_screen_x, asteroid_screen_y), int(2 * zoom_factor) or 1)
 
         # --- Draw Ping Effects ---
-        if self.outgoing_ping_active:
-            elapsed_time_ping = (pygame.time.get_ticks() - self.outgoing_ping_start_time) / 1000.0
-            current_radius = PING_OUTGOING_SPEED * elapsed_time_ping * zoom_factor
-            alpha = max(0, 255 - int(255 * (elapsed_time_ping / PING_OUTGOING_LIFETIME))) # Fade out
-
-            ping_surface = pygame.Surface((int(current_radius * 2), int(current_radius * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(ping_surface, (PING_COLOR[0], PING_COLOR[1], PING_COLOR[2], alpha),
-                               (int(current_radius), int(current_radius)), int(current_radius), int(2 * zoom_factor) or 1) # Outline only
-
-            ping_screen_x, ping_screen_y = self.world_to_screen(self.outgoing_ping_world_pos[0], self.outgoing_ping_world_pos[1])
-            ping_rect = ping_surface.get_rect(center=(ping_screen_x, ping_screen_y))
-            SCREEN.blit(ping_surface, ping_rect)
-
-        if self.incoming_ping_active:
-            elapsed_time_incoming = (pygame.time.get_ticks() - self.incoming_ping_start_time) / 1000.0
-            alpha = max(0, 255 - int(255 * (elapsed_time_incoming / PING_INCOMING_DURATION)))
-            
-            player_screen_x, player_screen_y = self.world_to_screen(self.player.x, self.player.y)
-            station_screen_x, station_screen_y = self.world_to_screen(self.space_station.x, self.space_station.y)
-
-            dx = station_screen_x - player_screen_x
-            dy = station_screen_y - player_screen_y
-            distance = math.hypot(dx, dy)
-
-            if distance > 0:
-                dir_x = dx / distance
-                dir_y = dy / distance
-
-                beam_end_x = player_screen_x + dir_x * PING_BEAM_LENGTH * zoom_factor
-                beam_end_y = player_screen_y + dir_y * PING_BEAM_LENGTH * zoom_factor
-
-                ping_beam_color_with_alpha = (PING_COLOR[0], PING_COLOR[1], PING_COLOR[2], alpha)
-                
-                line_surface = pygame.Surface(SCREEN.get_size(), pygame.SRCALPHA)
-                pygame.draw.line(line_surface, ping_beam_color_with_alpha,
-                                 (player_screen_x, player_screen_y),
-                                 (beam_end_x, beam_end_y), int(3 * zoom_factor) or 1)
-                SCREEN.blit(line_surface, (0, 0))
-
-            for planet in self.planets:
-                planet_screen_x, planet_screen_y = self.world_to_screen(planet.x, planet.y)
-
-                dx_p = planet_screen_x - player_screen_x
-                dy_p = planet_screen_y - player_screen_y
-                distance_p = math.hypot(dx_p, dy_p)
-
-                if distance_p > 0:
-                    dir_x_p = dx_p / distance_p
-                    dir_y_p = dy_p / distance_p
-
-                    beam_end_x_p = player_screen_x + dir_x_p * PING_BEAM_LENGTH * zoom_factor
-                    beam_end_y_p = player_screen_y + dir_y_p * PING_BEAM_LENGTH * zoom_factor
-
-                    planet_ping_color_with_alpha = (YELLOW[0], YELLOW[1], YELLOW[2], alpha)
-
-                    line_surface_p = pygame.Surface(SCREEN.get_size(), pygame.SRCALPHA)
-                    pygame.draw.line(line_surface_p, planet_ping_color_with_alpha,
-                                     (player_screen_x, player_screen_y),
-                                     (beam_end_x_p, beam_end_y_p), int(3 * zoom_factor) or 1)
-                    SCREEN.blit(line_surface_p, (0, 0))
-
-                    pygame.draw.circle(SCREEN, planet_ping_color_with_alpha, (int(planet_screen_x), int(planet_screen_y)), int(5 * zoom_factor) or 1)
-                    
-                    # Scale font size for planet name or use a smaller font
-                    scaled_font_size = max(10, int(FONT.get_height() * zoom_factor))
-                    scaled_font = pygame.font.Font(None, scaled_font_size)
-                    planet_name_text = scaled_font.render(planet.planet_type_name, True, (255,255,255,alpha))
-                    planet_name_rect = planet_name_text.get_rect(center=(planet_screen_x, planet_screen_y - int(20 * zoom_factor)))
-                    SCREEN.blit(planet_name_text, planet_name_rect)
-
-                # Draw ping for stealth asteroids if revealed
-                if ANTENNA_TYPES[self.player.current_antenna_type]["reveals_stealth"]:
-                    for asteroid in self.asteroids:
-                        if asteroid.is_stealth and asteroid.is_revealed:
-                            asteroid_screen_x, asteroid_screen_y = self.world_to_screen(asteroid.x, asteroid.y)
-                            
-                            dx_a = asteroid_screen_x - player_screen_x
-                            dy_a = asteroid_screen_y - player_screen_y
-                            distance_a = math.hypot(dx_a, dy_a)
-
-                            if distance_a > 0:
-                                dir_x_a = dx_a / distance_a
-                                dir_y_a = dy_a / distance_a
-
-                                beam_end_x_a = player_screen_x + dir_x_a * PING_BEAM_LENGTH * zoom_factor
-                                beam_end_y_a = player_screen_y + dir_y_a * PING_BEAM_LENGTH * zoom_factor
-
-                                stealth_asteroid_ping_color_with_alpha = (STEALTH_ASTEROID_REVEAL_COLOR[0], STEALTH_ASTEROID_REVEAL_COLOR[1], STEALTH_ASTEROID_REVEAL_COLOR[2], alpha)
-
-                                line_surface_a = pygame.Surface(SCREEN.get_size(), pygame.SRCALPHA)
-                                pygame.draw.line(line_surface_a, stealth_asteroid_ping_color_with_alpha,
-                                                 (player_screen_x, player_screen_y),
-                                                 (beam_end_x_a, beam_end_y_a), int(3 * zoom_factor) or 1)
-                                SCREEN.blit(line_surface_a, (0, 0))
-
-                                pygame.draw.circle(SCREEN, stealth_asteroid_ping_color_with_alpha, (int(asteroid_screen_x), int(asteroid_screen_y)), int(5 * zoom_factor) or 1)
-
-
-        # Draw Jump Drive target selection UI
-        if self.game_state == "JUMP_DRIVE_SELECT_TARGET":
-            # Draw a crosshair at the mouse position
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            crosshair_size = 10
-            pygame.draw.line(SCREEN, GREEN, (mouse_x - crosshair_size, mouse_y), (mouse_x + crosshair_size, mouse_y), 2)
-            pygame.draw.line(SCREEN, GREEN, (mouse_x, mouse_y - crosshair_size), (mouse_x, mouse_y + crosshair_size), 2)
-            target_text = FONT.render("Click to select jump target, Press 'R' to cancel", True, WHITE)
-            text_rect = target_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-            SCREEN.blit(target_text, text_rect)
+        self.draw_ping_effects(canvas, snapshot)
 
         # Draw Jump Drive rings during warp initiation
-        if self.jump_rings_active and self.game_state == "JUMP_DRIVE_WARP":
-            elapsed_time = (pygame.time.get_ticks() - self.jump_rings_start_time) / 1000.0
+        if snapshot.jump_rings_start_time is not None:
+            elapsed_time = (snapshot.time - snapshot.jump_rings_start_time) / 1000.0
             
             # Calculate ring expansion radius
             current_radius = JUMP_DRIVE_RING_SPEED * elapsed_time
@@ -3177,62 +3960,58 @@ class GameManager:
 
             if current_radius < JUMP_DRIVE_MAX_RING_RADIUS:
                 # Calculate the rear of the ship
-                # Angle for movement is (270 - self.player.angle) % 360
-                # Angle for rear is (270 - self.player.angle + 180) % 360 (opposite direction)
-                rear_angle_rad = math.radians((270 - self.player.angle + 180) % 360)
+                # Angle for movement is (270 - player.angle) % 360
+                # Angle for rear is (270 - player.angle + 180) % 360 (opposite direction)
+                rear_angle_rad = math.radians((270 - player.angle + 180) % 360)
                 
                 # Initial offset from center of ship to its rear
-                offset_x = (self.player.original_image.get_height() / 2) * math.cos(rear_angle_rad)
-                offset_y = (self.player.original_image.get_height() / 2) * math.sin(rear_angle_rad)
+                offset_x = (player.original_image.get_height() / 2) * math.cos(rear_angle_rad)
+                offset_y = (player.original_image.get_height() / 2) * math.sin(rear_angle_rad)
 
                 # Movement vector for rings (opposite to ship's forward direction)
-                # Ship's forward direction is (270 - self.player.angle) % 360
-                # So, ring movement direction is (270 - self.player.angle + 180) % 360
-                ring_move_rad = math.radians((270 - self.player.angle + 180) % 360)
+                # Ship's forward direction is (270 - player.angle) % 360
+                # So, ring movement direction is (270 - player.angle + 180) % 360
+                ring_move_rad = math.radians((270 - player.angle + 180) % 360)
                 ring_move_x = JUMP_DRIVE_RING_TRAIL_SPEED * elapsed_time * math.cos(ring_move_rad)
                 ring_move_y = JUMP_DRIVE_RING_TRAIL_SPEED * elapsed_time * math.sin(ring_move_rad)
 
                 # Ring origin in world coordinates
-                ring_world_x = self.player.x + offset_x + ring_move_x
-                ring_world_y = self.player.y + offset_y + ring_move_y
+                ring_world_x = player.x + offset_x + ring_move_x
+                ring_world_y = player.y + offset_y + ring_move_y
 
                 # Convert to screen coordinates
-                ring_screen_x, ring_screen_y = self.world_to_screen(ring_world_x, ring_world_y)
+                ring_screen_x, ring_screen_y = self.world_to_screen_static(ring_world_x, ring_world_y, camera_x, camera_y, zoom_factor)
 
-                # Draw the ring
-                ring_surface = pygame.Surface((int(current_radius * 2), int(current_radius * 2)), pygame.SRCALPHA)
-                pygame.draw.circle(ring_surface, (BLUE[0], BLUE[1], BLUE[2], alpha),
-                                   (int(current_radius), int(current_radius)), int(current_radius), int(5 * zoom_factor) or 1) # Thicker rings
+                # Draw the ring (nothing yet on the first warp frame, when the radius is still 0)
+                OVERLAY_CACHE.blit_circle(canvas, (ring_screen_x, ring_screen_y), int(current_radius),
+                                          (BLUE[0], BLUE[1], BLUE[2], alpha), int(5 * zoom_factor) or 1) # Thicker rings
 
-                ring_rect = ring_surface.get_rect(center=(ring_screen_x, ring_screen_y))
-                SCREEN.blit(ring_surface, ring_rect)
+    def draw_world_overlays(self):
+        """
+        Draws the screen-space parts of the game view that depend on live input and menu state
+        (jump targeting, jump text, station menus, inventory). Always runs on the main thread.
+        """
+        # Draw Jump Drive target selection UI
+        if self.game_state == "JUMP_DRIVE_SELECT_TARGET":
+            # Draw a crosshair at the mouse position
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+            crosshair_size = 10
+            pygame.draw.line(SCREEN, GREEN, (mouse_x - crosshair_size, mouse_y), (mouse_x + crosshair_size, mouse_y), 2)
+            pygame.draw.line(SCREEN, GREEN, (mouse_x, mouse_y - crosshair_size), (mouse_x, mouse_y + crosshair_size), 2)
+            target_text = TEXT_CACHE.render(FONT, "Click to select jump target, Press 'R' to cancel", WHITE)
+            text_rect = target_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
+            SCREEN.blit(target_text, text_rect)
 
-            jump_text = LARGE_FONT.render("JUMP INITIATING...", True, YELLOW)
+        if self.jump_rings_active and self.game_state == "JUMP_DRIVE_WARP":
+            jump_text = TEXT_CACHE.render(LARGE_FONT, "JUMP INITIATING...", YELLOW)
             jump_rect = jump_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             SCREEN.blit(jump_text, jump_rect)
 
 
-        # Draw station menus based on game state
-        if self.game_state == "PAUSED_AT_STATION":
-            self.draw_station_main_menu()
-        elif self.game_state == "ECONOMY_SHOP":
-            self.draw_economy_shop_menu()
-        elif self.game_state == "SHIP_UPGRADING":
-            self.draw_ship_upgrading_menu()
-        elif self.game_state == "SHIP_SHOP":
-            self.draw_ship_shop_menu()
-        elif self.game_state == "MINING_TOOLS_MENU":
-            self.draw_mining_tools_menu()
-        elif self.game_state == "ENERGY_CORE_MENU":
-            self.draw_energy_core_menu()
-        elif self.game_state == "ANTENNA_MENU":
-            self.draw_antenna_menu()
-        elif self.game_state == "WEAPONS_MENU":
-            self.draw_weapons_menu()
-        elif self.game_state == "PROPULSION_MENU":
-            self.draw_propulsion_menu()
-        elif self.game_state == "TRADING_OUTPOST_MENU": # New menu
-            self.draw_trading_outpost_menu()
+        # Draw the station or outpost menu for the current game state
+        menu = self.menus.get(self.game_state)
+        if menu:
+            menu.draw(SCREEN, pygame.mouse.get_pos())
 
 
         # Draw inventory screen if active (always on top)
@@ -3240,362 +4019,408 @@ class GameManager:
             self.draw_inventory_screen()
 
 
-    def draw_button(self, text, x, y, width, height, action=None, is_active=False):
-        """Helper function to draw a button and return its rect."""
-        mouse_pos = pygame.mouse.get_pos()
-        button_rect = pygame.Rect(x, y, width, height)
-        
-        current_color = BUTTON_COLOR
-        if is_active:
-            current_color = ACTIVE_BUTTON_COLOR
-        elif button_rect.collidepoint(mouse_pos):
-            current_color = BUTTON_HOVER_COLOR
-
-        pygame.draw.rect(SCREEN, current_color, button_rect, border_radius=5)
-        pygame.draw.rect(SCREEN, WHITE, button_rect, 2, border_radius=5) # Border
-
-        text_surf = BUTTON_FONT.render(text, True, WHITE)
-        text_rect = text_surf.get_rect(center=button_rect.center)
-        SCREEN.blit(text_surf, text_rect)
-        
-        # Store the button rect for click detection
-        if action:
-            self.buttons[action] = button_rect
-        return button_rect
+    def get_static_world(self):
+        """
+        Returns the current static world content as an immutable StaticWorld record. It holds
+        copies of what is drawn, not the live objects, since the enemy base's health keeps changing.
+        """
+        return StaticWorld(self.space_station.record() if self.space_station else None,
+                           self.trading_outpost.record() if self.trading_outpost else None,
+                           self.enemy_base.record() if self.enemy_base else None,
+                           tuple(planet.record() for planet in self.planets),
+                           tuple(zone.record() for zone in self.mining_zones))
 
-    def draw_station_main_menu(self):
-        """Draws the main space station menu with navigation buttons."""
-        # Darken background
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 180)) # Black with 180 alpha (out of 255)
-        SCREEN.blit(s, (0, 0))
+    def draw_static_world(self, surface, camera_x, camera_y, zoom_factor, world_rect, static_world=None):
+        """
+        Draws the static world content that overlaps world_rect onto surface, relative to the
+        given camera. Used by the static layer to render its tiles; returns True if anything was drawn.
+        static_world defaults to the current content; the render thread passes its snapshot's.
+        """
+        if static_world is None:
+            static_world = self.get_static_world()
+        drawn = False
 
-        # Menu title
-        title_text = LARGE_FONT.render("SPACE STATION", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-        SCREEN.blit(title_text, title_rect)
+        # Draw Safezone (around space station)
+        if static_world.space_station:
+            safezone_rect = pygame.Rect(0, 0, SAFEZONE_RADIUS * 2, SAFEZONE_RADIUS * 2)
+            safezone_rect.center = (static_world.space_station.x, static_world.space_station.y)
+            if safezone_rect.colliderect(world_rect):
+                safezone_screen_x, safezone_screen_y = self.world_to_screen_static(static_world.space_station.x, static_world.space_station.y, camera_x, camera_y, zoom_factor)
+                scaled_safezone_radius = int(SAFEZONE_RADIUS * zoom_factor)
+                OVERLAY_CACHE.blit_circle(surface, (safezone_screen_x, safezone_screen_y), scaled_safezone_radius, SAFEZONE_COLOR)
+                drawn = True
+
+        # Draw Mining Safezones
+        for zone in static_world.mining_zones:
+            zone_rect = pygame.Rect(0, 0, zone.radius * 2, zone.radius * 2)
+            zone_rect.center = (zone.x, zone.y)
+            if zone_rect.colliderect(world_rect):
+                MiningSafezone.draw(zone, surface, camera_x, camera_y, zoom_factor)
+                drawn = True
+
+        # Draw Space Station and Trading Outpost
+        for structure in (static_world.space_station, static_world.trading_outpost):
+            if structure and structure.rect.colliderect(world_rect):
+                screen_x, screen_y = self.world_to_screen_static(structure.x, structure.y, camera_x, camera_y, zoom_factor)
+                scaled_size = int(structure.size * zoom_factor)
+                if scaled_size > 0: # Avoid drawing if size becomes 0
+                    scaled_image = pygame.transform.scale(structure.image, (scaled_size, scaled_size))
+                    surface.blit(scaled_image, scaled_image.get_rect(center=(screen_x, screen_y)))
+                    drawn = True
+
+        # Draw Enemy Base body
+        if static_world.enemy_base and static_world.enemy_base.rect.colliderect(world_rect):
+            EnemyBase.draw_body(static_world.enemy_base, surface, camera_x, camera_y, zoom_factor)
+            drawn = True
+
+        # Draw Planets
+        for planet in static_world.planets:
+            if planet.rect.colliderect(world_rect):
+                screen_x, screen_y = self.world_to_screen_static(planet.x, planet.y, camera_x, camera_y, zoom_factor)
+                scaled_size = int(planet.size * zoom_factor)
+                if scaled_size > 0:
+                    scaled_planet_image = pygame.transform.scale(planet.image, (scaled_size * 2, scaled_size * 2))
+                    surface.blit(scaled_planet_image, scaled_planet_image.get_rect(center=(screen_x, screen_y)))
+                    drawn = True
+
+        return drawn
+
+    @staticmethod
+    def get_rotated_stamp(key, original_image, angle, zoom_factor, rotation_step):
+        """
+        Returns original_image scaled by zoom_factor and rotated by angle, or None if it scales away.
+        With a rotation_step the angle snaps to it and the rotated stamp itself is cached.
+        """
+        scaled_size = (int(original_image.get_width() * zoom_factor), int(original_image.get_height() * zoom_factor))
+        if scaled_size[0] <= 0 or scaled_size[1] <= 0:
+            return None
+        if rotation_step:
+            snapped_angle = round(angle / rotation_step) * rotation_step % 360
+            return STAMP_CACHE.get_rotated(key, original_image, scaled_size, snapped_angle)
+        return pygame.transform.rotate(STAMP_CACHE.get_scaled(key, original_image, scaled_size), angle)
+
+    def draw_ping_beam(self, player_screen_pos, target_screen_pos, color, zoom_factor, draw_beam=True):
+        """
+        Draws a short directional ping beam from the player towards a target into the effects layer.
+        Returns False if the target sits exactly on the player (no direction to point in).
+        With draw_beam False only that check is made, for quality levels without ping beams.
+        """
+        dx = target_screen_pos[0] - player_screen_pos[0]
+        dy = target_screen_pos[1] - player_screen_pos[1]
+        distance = math.hypot(dx, dy)
+        if distance <= 0:
+            return False
+        if not draw_beam:
+            return True
+
+        beam_end_x = player_screen_pos[0] + dx / distance * PING_BEAM_LENGTH * zoom_factor
+        beam_end_y = player_screen_pos[1] + dy / distance * PING_BEAM_LENGTH * zoom_factor
+        self.effects_layer.line(color, player_screen_pos, (beam_end_x, beam_end_y), int(3 * zoom_factor) or 1)
+        return True
+
+    def draw_ping_effects(self, canvas, snapshot):
+        """
+        Draws the outgoing ping ring and the incoming ping beams and markers into the shared
+        effects layer, then composites the layer onto the canvas with a single blit.
+        """
+        camera_x = snapshot.camera_x
+        camera_y = snapshot.camera_y
+        zoom_factor = snapshot.zoom_factor
+        draw_beams = snapshot.quality["ping_beams"] # Markers and labels are kept either way
+        planet_labels = [] # Labels are blitted straight to the canvas after the layer
+
+        if snapshot.outgoing_ping:
+            outgoing_ping_start_time, outgoing_ping_world_pos = snapshot.outgoing_ping
+            elapsed_time_ping = (snapshot.time - outgoing_ping_start_time) / 1000.0
+            current_radius = int(PING_OUTGOING_SPEED * elapsed_time_ping * zoom_factor)
+            alpha = max(0, 255 - int(255 * (elapsed_time_ping / PING_OUTGOING_LIFETIME))) # Fade out
+
+            if current_radius > 0:
+                ping_screen_x, ping_screen_y = self.world_to_screen_static(outgoing_ping_world_pos[0], outgoing_ping_world_pos[1], camera_x, camera_y, zoom_factor)
+                self.effects_layer.circle((PING_COLOR[0], PING_COLOR[1], PING_COLOR[2], alpha),
+                                          (int(ping_screen_x), int(ping_screen_y)), current_radius, int(2 * zoom_factor) or 1) # Outline only
+
+        if snapshot.incoming_ping_start_time is not None:
+            elapsed_time_incoming = (snapshot.time - snapshot.incoming_ping_start_time) / 1000.0
+            alpha = max(0, 255 - int(255 * (elapsed_time_incoming / PING_INCOMING_DURATION)))
+            marker_radius = int(5 * zoom_factor) or 1
+            space_station = snapshot.static_world.space_station
+
+            player_screen_pos = self.world_to_screen_static(snapshot.player.x, snapshot.player.y, camera_x, camera_y, zoom_factor)
+            station_screen_pos = self.world_to_screen_static(space_station.x, space_station.y, camera_x, camera_y, zoom_factor)
+            self.draw_ping_beam(player_screen_pos, station_screen_pos, (PING_COLOR[0], PING_COLOR[1], PING_COLOR[2], alpha), zoom_factor, draw_beams)
+
+            planet_ping_color_with_alpha = (YELLOW[0], YELLOW[1], YELLOW[2], alpha)
+            # Scale font size for planet name or use a smaller font
+            scaled_font_size = max(10, int(FONT.get_height() * zoom_factor))
+            scaled_font = TEXT_CACHE.get_font(scaled_font_size)
+            for planet in snapshot.static_world.planets:
+                planet_screen_x, planet_screen_y = self.world_to_screen_static(planet.x, planet.y, camera_x, camera_y, zoom_factor)
+                if self.draw_ping_beam(player_screen_pos, (planet_screen_x, planet_screen_y), planet_ping_color_with_alpha, zoom_factor, draw_beams):
+                    self.effects_layer.circle(planet_ping_color_with_alpha, (int(planet_screen_x), int(planet_screen_y)), marker_radius)
+
+                    planet_name_text = TEXT_CACHE.render(scaled_font, planet.planet_type_name, WHITE, alpha)
+                    planet_name_rect = planet_name_text.get_rect(center=(planet_screen_x, planet_screen_y - int(20 * zoom_factor)))
+                    planet_labels.append((planet_name_text, planet_name_rect))
+
+            # Draw ping for stealth asteroids if revealed (only captured when the antenna reveals them)
+            stealth_asteroid_ping_color_with_alpha = (STEALTH_ASTEROID_REVEAL_COLOR[0], STEALTH_ASTEROID_REVEAL_COLOR[1], STEALTH_ASTEROID_REVEAL_COLOR[2], alpha)
+            for asteroid_x, asteroid_y in snapshot.revealed_asteroids:
+                asteroid_screen_x, asteroid_screen_y = self.world_to_screen_static(asteroid_x, asteroid_y, camera_x, camera_y, zoom_factor)
+                if self.draw_ping_beam(player_screen_pos, (asteroid_screen_x, asteroid_screen_y), stealth_asteroid_ping_color_with_alpha, zoom_factor, draw_beams):
+                    self.effects_layer.circle(stealth_asteroid_ping_color_with_alpha, (int(asteroid_screen_x), int(asteroid_screen_y)), marker_radius)
+
+        self.effects_layer.present(canvas)
+        for label_surface, label_rect in planet_labels:
+            canvas.blit(label_surface, label_rect)
+
+    def build_menus(self):
+        """Builds the retained station and outpost menus, keyed by the game state that shows them."""
+        return {
+            "PAUSED_AT_STATION": self.build_station_main_menu(),
+            "ECONOMY_SHOP": self.build_economy_shop_menu(),
+            "SHIP_UPGRADING": self.build_ship_upgrading_menu(),
+            "SHIP_SHOP": self.build_ship_shop_menu(),
+            "MINING_TOOLS_MENU": self.build_mining_tools_menu(),
+            "ENERGY_CORE_MENU": self.build_energy_core_menu(),
+            "ANTENNA_MENU": self.build_antenna_menu(),
+            "WEAPONS_MENU": self.build_weapons_menu(),
+            "PROPULSION_MENU": self.build_propulsion_menu(),
+            "TRADING_OUTPOST_MENU": self.build_trading_outpost_menu(),
+        }
+
+    def get_clicked_menu_button(self, mouse_pos):
+        """Returns the action name of the current menu's button under mouse_pos, or None."""
+        menu = self.menus.get(self.game_state)
+        return menu.get_clicked_action(mouse_pos) if menu else None
+
+    def build_station_main_menu(self):
+        """Builds the main space station menu with navigation buttons."""
+        menu = RetainedMenu("SPACE STATION", backdrop_alpha=180)
 
         button_width = 250
         button_height = 50
         button_spacing = 20
         start_y = SCREEN_HEIGHT // 2 - 80
 
-        # Clear previous button rects
-        self.buttons.clear()
-
         # Economy Trading Shop Button
-        self.draw_button("Economy Trading Shop", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'economy_button')
+        menu.add_button("Economy Trading Shop", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'economy_button')
         
         # Ship Upgrading Button
-        self.draw_button("Ship Upgrading", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'upgrade_button')
+        menu.add_button("Ship Upgrading", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'upgrade_button')
 
         # Ship Shop Button
-        self.draw_button("Ship Shop", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'shop_button')
+        menu.add_button("Ship Shop", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'shop_button')
 
         # Resume Exploration Button
-        self.draw_button("Resume Exploration", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing) + 30, button_width, button_height, 'resume_button')
-
-
-    def draw_economy_shop_menu(self):
-        """Draws the placeholder menu for the Economy Trading Shop."""
-        # Darken background
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200)) # Black with higher alpha
-        SCREEN.blit(s, (0, 0))
+        menu.add_button("Resume Exploration", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing) + 30, button_width, button_height, 'resume_button')
+        return menu
 
-        # Menu title
-        title_text = LARGE_FONT.render("ECONOMY TRADING SHOP", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-        SCREEN.blit(title_text, title_rect)
+    def build_economy_shop_menu(self):
+        """Builds the placeholder menu for the Economy Trading Shop."""
+        menu = RetainedMenu("ECONOMY TRADING SHOP")
 
         # Placeholder content
-        placeholder_text = MENU_FONT.render("Trade materials and resources here!", True, GRAY)
-        placeholder_rect = placeholder_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        SCREEN.blit(placeholder_text, placeholder_rect)
+        menu.add_text(MENU_FONT, "Trade materials and resources here!", GRAY, center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
-        # Clear previous button rects
-        self.buttons.clear()
         # Back Button
-        self.draw_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        menu.add_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        return menu
 
-    def draw_ship_upgrading_menu(self):
-        """Draws the placeholder menu for Ship Upgrading."""
-        # Darken background
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200)) # Black with higher alpha
-        SCREEN.blit(s, (0, 0))
-
-        # Menu title
-        title_text = LARGE_FONT.render("SHIP UPGRADING", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-        SCREEN.blit(title_text, title_rect)
+    def build_ship_upgrading_menu(self):
+        """Builds the menu for Ship Upgrading."""
+        menu = RetainedMenu("SHIP UPGRADING")
 
         button_width = 250
         button_height = 50
         button_spacing = 20
         start_y = SCREEN_HEIGHT // 2 - 100 # Adjusted start_y to fit more buttons
 
-        # Clear previous button rects
-        self.buttons.clear()
-
         # Resource Collection (Mining Tools) Button
-        self.draw_button("Resource Collection", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'mining_tools_button')
+        menu.add_button("Resource Collection", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'mining_tools_button')
 
         # Energy Core Button
-        self.draw_button("Energy Core", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'energy_core_button')
+        menu.add_button("Energy Core", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'energy_core_button')
         
         # Antennas/Radar Systems Button
-        self.draw_button("Antennas/Radar Systems", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'antenna_radar_button')
+        menu.add_button("Antennas/Radar Systems", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'antenna_radar_button')
 
         # Weapons Button
-        self.draw_button("Weapons", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing), button_width, button_height, 'weapons_button')
+        menu.add_button("Weapons", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing), button_width, button_height, 'weapons_button')
 
         # Propulsion Button
-        self.draw_button("Propulsion", (SCREEN_WIDTH - button_width) // 2, start_y + 4 * (button_height + button_spacing), button_width, button_height, 'propulsion_button')
+        menu.add_button("Propulsion", (SCREEN_WIDTH - button_width) // 2, start_y + 4 * (button_height + button_spacing), button_width, button_height, 'propulsion_button')
 
         # Back Button
-        self.draw_button("Back", (SCREEN_WIDTH - button_width) // 2, start_y + 5 * (button_height + button_spacing) + 30, button_width, button_height, 'back_button')
-
-
-    def draw_mining_tools_menu(self):
-        """Draws the menu for selecting mining tools."""
-        # Darken background
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200)) # Black with higher alpha
-        SCREEN.blit(s, (0, 0))
+        menu.add_button("Back", (SCREEN_WIDTH - button_width) // 2, start_y + 5 * (button_height + button_spacing) + 30, button_width, button_height, 'back_button')
+        return menu
 
-        # Menu title
-        title_text = LARGE_FONT.render("MINING TOOLS", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-        SCREEN.blit(title_text, title_rect)
+    def build_mining_tools_menu(self):
+        """Builds the menu for selecting mining tools."""
+        menu = RetainedMenu("MINING TOOLS")
 
         button_width = 200
         button_height = 50
         button_spacing = 20
         start_y = SCREEN_HEIGHT // 2 - 80 # Adjusted start_y to fit new button
 
-        # Clear previous button rects
-        self.buttons.clear()
-
         # Drill Tool Button (now default)
-        self.draw_button("Drill", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'drill_button', is_active=(self.player.current_mining_tool == "Drill"))
+        menu.add_button("Drill", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'drill_button', is_active=lambda: self.player.current_mining_tool == "Drill")
 
         # Short Range Laser Tool Button
-        self.draw_button("Short Range Laser", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'short_range_laser_button', is_active=(self.player.current_mining_tool == "ShortRangeLaser"))
+        menu.add_button("Short Range Laser", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'short_range_laser_button', is_active=lambda: self.player.current_mining_tool == "ShortRangeLaser")
 
         # Long Range Laser Tool Button
-        self.draw_button("Long Range Laser", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'long_range_laser_button', is_active=(self.player.current_mining_tool == "LongRangeLaser"))
+        menu.add_button("Long Range Laser", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'long_range_laser_button', is_active=lambda: self.player.current_mining_tool == "LongRangeLaser")
 
         # Auto-Mining Laser Tool Button
-        self.draw_button("Auto-Mining Laser", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing), button_width, button_height, 'auto_mining_laser_button', is_active=(self.player.current_mining_tool == "AutoMiningLaser"))
+        menu.add_button("Auto-Mining Laser", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing), button_width, button_height, 'auto_mining_laser_button', is_active=lambda: self.player.current_mining_tool == "AutoMiningLaser")
 
 
         # Current Tool Display
-        current_tool_text = FONT.render(f"Current Tool: {self.player.current_mining_tool}", True, WHITE)
-        current_tool_rect = current_tool_text.get_rect(center=(SCREEN_WIDTH // 2, start_y + 4 * (button_height + button_spacing) + 20))
-        SCREEN.blit(current_tool_text, current_tool_rect)
+        menu.add_label(FONT, "Current Tool: {}", WHITE, lambda: (self.player.current_mining_tool,), center=(SCREEN_WIDTH // 2, start_y + 4 * (button_height + button_spacing) + 20))
 
         # Back Button
-        self.draw_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        menu.add_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        return menu
 
-    def draw_energy_core_menu(self):
-        """Draws the menu for selecting energy cores."""
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200))
-        SCREEN.blit(s, (0, 0))
-
-        title_text = LARGE_FONT.render("ENERGY CORE", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-        SCREEN.blit(title_text, title_rect)
+    def build_energy_core_menu(self):
+        """Builds the menu for selecting energy cores."""
+        menu = RetainedMenu("ENERGY CORE")
 
         button_width = 250
         button_height = 50
         button_spacing = 20
         start_y = SCREEN_HEIGHT // 2 - 80
 
-        self.buttons.clear()
-
         # Standard Core
-        self.draw_button("Standard Core (Recharge: 1x, Power: 1x)", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'standard_core_button', is_active=(self.current_energy_core == "Standard Core"))
+        menu.add_button("Standard Core (Recharge: 1x, Power: 1x)", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'standard_core_button', is_active=lambda: self.current_energy_core == "Standard Core")
 
         # Advanced Core
-        self.draw_button("Advanced Core (Recharge: 1.5x, Power: 1.2x)", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'advanced_core_button', is_active=(self.current_energy_core == "Advanced Core"))
+        menu.add_button("Advanced Core (Recharge: 1.5x, Power: 1.2x)", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'advanced_core_button', is_active=lambda: self.current_energy_core == "Advanced Core")
 
-        current_core_text = FONT.render(f"Current Core: {self.current_energy_core}", True, WHITE)
-        current_core_rect = current_core_text.get_rect(center=(SCREEN_WIDTH // 2, start_y + 2 * (button_height + button_spacing) + 20))
-        SCREEN.blit(current_core_text, current_core_rect)
+        menu.add_label(FONT, "Current Core: {}", WHITE, lambda: (self.current_energy_core,), center=(SCREEN_WIDTH // 2, start_y + 2 * (button_height + button_spacing) + 20))
 
-        self.draw_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        menu.add_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        return menu
 
-    def draw_antenna_menu(self):
-        """Draws the menu for selecting antennas."""
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200))
-        SCREEN.blit(s, (0, 0))
-
-        title_text = LARGE_FONT.render("ANTENNAS / RADAR SYSTEMS", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-        SCREEN.blit(title_text, title_rect)
+    def build_antenna_menu(self):
+        """Builds the menu for selecting antennas."""
+        menu = RetainedMenu("ANTENNAS / RADAR SYSTEMS")
 
         button_width = 250
         button_height = 50
         button_spacing = 20
         start_y = SCREEN_HEIGHT // 2 - 80
 
-        self.buttons.clear()
-
         # Basic Antenna
-        self.draw_button("Basic Antenna (Range: 1x)", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'basic_antenna_button', is_active=(self.player.current_antenna_type == "Basic Antenna"))
+        menu.add_button("Basic Antenna (Range: 1x)", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'basic_antenna_button', is_active=lambda: self.player.current_antenna_type == "Basic Antenna")
 
         # Standard Antenna
-        self.draw_button("Standard Antenna (Range: 1.5x)", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'standard_antenna_button', is_active=(self.player.current_antenna_type == "Standard Antenna"))
+        menu.add_button("Standard Antenna (Range: 1.5x)", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'standard_antenna_button', is_active=lambda: self.player.current_antenna_type == "Standard Antenna")
 
         # Advanced Antenna
-        self.draw_button("Advanced Antenna (Range: 2.5x, Reveals Stealth Asteroids)", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'advanced_antenna_button', is_active=(self.player.current_antenna_type == "Advanced Antenna"))
+        menu.add_button("Advanced Antenna (Range: 2.5x, Reveals Stealth Asteroids)", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'advanced_antenna_button', is_active=lambda: self.player.current_antenna_type == "Advanced Antenna")
 
-        current_antenna_text = FONT.render(f"Current Antenna: {self.player.current_antenna_type}", True, WHITE)
-        current_antenna_rect = current_antenna_text.get_rect(center=(SCREEN_WIDTH // 2, start_y + 3 * (button_height + button_spacing) + 20))
-        SCREEN.blit(current_antenna_text, current_antenna_rect)
+        menu.add_label(FONT, "Current Antenna: {}", WHITE, lambda: (self.player.current_antenna_type,), center=(SCREEN_WIDTH // 2, start_y + 3 * (button_height + button_spacing) + 20))
 
-        self.draw_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        menu.add_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        return menu
 
-    def draw_weapons_menu(self):
-        """Draws the menu for selecting weapons."""
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200))
-        SCREEN.blit(s, (0, 0))
-
-        title_text = LARGE_FONT.render("WEAPONS", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 200))
-        SCREEN.blit(title_text, title_rect)
+    def build_weapons_menu(self):
+        """Builds the menu for selecting weapons."""
+        menu = RetainedMenu("WEAPONS", title_y=SCREEN_HEIGHT // 2 - 200)
 
         button_width = 200
         button_height = 40
         button_spacing = 15
         start_y = SCREEN_HEIGHT // 2 - 120 # Adjusted for more buttons
 
-        self.buttons.clear()
-
         # Weapon Slot Selection
         slot_button_width = 100
         slot_button_x_offset = 100
-        self.draw_button("Slot 1", SCREEN_WIDTH // 2 - slot_button_x_offset - slot_button_width // 2, start_y - 60, slot_button_width, button_height, 'slot1_button', is_active=(self.selected_weapon_slot == 1))
-        self.draw_button("Slot 2", SCREEN_WIDTH // 2 + slot_button_x_offset - slot_button_width // 2, start_y - 60, slot_button_width, button_height, 'slot2_button', is_active=(self.selected_weapon_slot == 2))
+        menu.add_button("Slot 1", SCREEN_WIDTH // 2 - slot_button_x_offset - slot_button_width // 2, start_y - 60, slot_button_width, button_height, 'slot1_button', is_active=lambda: self.selected_weapon_slot == 1)
+        menu.add_button("Slot 2", SCREEN_WIDTH // 2 + slot_button_x_offset - slot_button_width // 2, start_y - 60, slot_button_width, button_height, 'slot2_button', is_active=lambda: self.selected_weapon_slot == 2)
 
         # Weapon Type Buttons
-        self.draw_button("Laser", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'laser_weapon_button')
-        self.draw_button("Laser Turret", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'laser_turret_button')
-        self.draw_button("Minigun Turret", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'mini_gun_turret_button')
-        self.draw_button("Homing Missile", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing), button_width, button_height, 'homing_missile_button')
-        self.draw_button("Swarm Rocket", (SCREEN_WIDTH - button_width) // 2, start_y + 4 * (button_height + button_spacing), button_width, button_height, 'swarm_rocket_button')
-        self.draw_button("None (Empty Slot)", (SCREEN_WIDTH - button_width) // 2, start_y + 5 * (button_height + button_spacing), button_width, button_height, 'none_weapon_button')
+        menu.add_button("Laser", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'laser_weapon_button')
+        menu.add_button("Laser Turret", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'laser_turret_button')
+        menu.add_button("Minigun Turret", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'mini_gun_turret_button')
+        menu.add_button("Homing Missile", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing), button_width, button_height, 'homing_missile_button')
+        menu.add_button("Swarm Rocket", (SCREEN_WIDTH - button_width) // 2, start_y + 4 * (button_height + button_spacing), button_width, button_height, 'swarm_rocket_button')
+        menu.add_button("None (Empty Slot)", (SCREEN_WIDTH - button_width) // 2, start_y + 5 * (button_height + button_spacing), button_width, button_height, 'none_weapon_button')
 
 
         # Current Equipped Weapons Display
-        current_weapon1_text = FONT.render(f"Slot 1: {self.player.weapon_slot_1}", True, WHITE)
-        current_weapon1_rect = current_weapon1_text.get_rect(center=(SCREEN_WIDTH // 2, start_y + 4 * (button_height + button_spacing) + 80))
-        SCREEN.blit(current_weapon1_text, current_weapon1_rect)
-
-        current_weapon2_text = FONT.render(f"Slot 2: {self.player.weapon_slot_2}", True, WHITE)
-        current_weapon2_rect = current_weapon2_text.get_rect(center=(SCREEN_WIDTH // 2, start_y + 4 * (button_height + button_spacing) + 110))
-        SCREEN.blit(current_weapon2_text, current_weapon2_rect)
+        menu.add_label(FONT, "Slot 1: {}", WHITE, lambda: (self.player.weapon_slot_1,), center=(SCREEN_WIDTH // 2, start_y + 4 * (button_height + button_spacing) + 80))
+        menu.add_label(FONT, "Slot 2: {}", WHITE, lambda: (self.player.weapon_slot_2,), center=(SCREEN_WIDTH // 2, start_y + 4 * (button_height + button_spacing) + 110))
 
 
-        self.draw_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 50, 150, 50, 'back_button')
+        menu.add_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 50, 150, 50, 'back_button')
+        return menu
 
 
-    def draw_propulsion_menu(self):
-        """Draws the menu for selecting propulsion systems."""
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200))
-        SCREEN.blit(s, (0, 0))
-
-        title_text = LARGE_FONT.render("PROPULSION", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-        SCREEN.blit(title_text, title_rect)
+    def build_propulsion_menu(self):
+        """Builds the menu for selecting propulsion systems."""
+        menu = RetainedMenu("PROPULSION")
 
         button_width = 250
         button_height = 50
         button_spacing = 20
         start_y = SCREEN_HEIGHT // 2 - 80
 
-        self.buttons.clear()
-
         # Standard Thruster Button
-        self.draw_button("Standard Thruster", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'standard_thruster_button', is_active=(self.player.current_engine_type == "Standard Thruster"))
+        menu.add_button("Standard Thruster", (SCREEN_WIDTH - button_width) // 2, start_y, button_width, button_height, 'standard_thruster_button', is_active=lambda: self.player.current_engine_type == "Standard Thruster")
 
         # Ion Engine Button
-        self.draw_button("Ion Engine (High Top Speed, Low Accel, Weak Gravity)", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'ion_engine_button', is_active=(self.player.current_engine_type == "Ion Engine"))
+        menu.add_button("Ion Engine (High Top Speed, Low Accel, Weak Gravity)", (SCREEN_WIDTH - button_width) // 2, start_y + button_height + button_spacing, button_width, button_height, 'ion_engine_button', is_active=lambda: self.player.current_engine_type == "Ion Engine")
 
         # Space Thruster Button
-        self.draw_button("Space Thruster (Fast Accel, Lower Top Speed, Strong Gravity)", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'space_thruster_button', is_active=(self.player.current_engine_type == "Space Thruster"))
+        menu.add_button("Space Thruster (Fast Accel, Lower Top Speed, Strong Gravity)", (SCREEN_WIDTH - button_width) // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, 'space_thruster_button', is_active=lambda: self.player.current_engine_type == "Space Thruster")
 
         # Hyper Drive Button (New)
-        self.draw_button("Hyper Drive (Very Fast, Jump Ability)", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing), button_width, button_height, 'hyper_drive_button', is_active=(self.player.current_engine_type == "Hyper Drive"))
+        menu.add_button("Hyper Drive (Very Fast, Jump Ability)", (SCREEN_WIDTH - button_width) // 2, start_y + 3 * (button_height + button_spacing), button_width, button_height, 'hyper_drive_button', is_active=lambda: self.player.current_engine_type == "Hyper Drive")
 
-        current_engine_text = FONT.render(f"Current Engine: {self.player.current_engine_type}", True, WHITE)
-        current_engine_rect = current_engine_text.get_rect(center=(SCREEN_WIDTH // 2, start_y + 4 * (button_height + button_spacing) + 20))
-        SCREEN.blit(current_engine_text, current_engine_rect)
+        menu.add_label(FONT, "Current Engine: {}", WHITE, lambda: (self.player.current_engine_type,), center=(SCREEN_WIDTH // 2, start_y + 4 * (button_height + button_spacing) + 20))
 
-        self.draw_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        menu.add_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        return menu
 
 
-    def draw_ship_shop_menu(self):
-        """Draws the placeholder menu for the Ship Shop."""
-        # Darken background
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200)) # Black with higher alpha
-        SCREEN.blit(s, (0, 0))
-
-        # Menu title
-        title_text = LARGE_FONT.render("SHIP SHOP", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-        SCREEN.blit(title_text, title_rect)
+    def build_ship_shop_menu(self):
+        """Builds the placeholder menu for the Ship Shop."""
+        menu = RetainedMenu("SHIP SHOP")
 
         # Placeholder content
-        placeholder_text = MENU_FONT.render("Buy new ships or customize your current one!", True, GRAY)
-        placeholder_rect = placeholder_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        SCREEN.blit(placeholder_text, placeholder_rect)
+        menu.add_text(MENU_FONT, "Buy new ships or customize your current one!", GRAY, center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
-        # Clear previous button rects
-        self.buttons.clear()
         # Back Button
-        self.draw_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        menu.add_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        return menu
 
-    def draw_trading_outpost_menu(self):
-        """Draws the menu for the Trading Outpost."""
-        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200))
-        SCREEN.blit(s, (0, 0))
-
-        title_text = LARGE_FONT.render("TRADING OUTPOST", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-        SCREEN.blit(title_text, title_rect)
+    def build_trading_outpost_menu(self):
+        """Builds the menu for the Trading Outpost."""
+        menu = RetainedMenu("TRADING OUTPOST")
 
         text_start_x = SCREEN_WIDTH // 2 - 150
         text_start_y = SCREEN_HEIGHT // 2 - 80
         line_height = 30
 
         # Display current resources
-        current_gold_text = FONT.render(f"Your Gold: {self.player.gold_ore}", True, GOLD_COLOR)
-        SCREEN.blit(current_gold_text, (text_start_x, text_start_y))
-        current_silicon_text = FONT.render(f"Your Silicon: {self.player.silicon_ore}", True, SILICON_COLOR)
-        SCREEN.blit(current_silicon_text, (text_start_x, text_start_y + line_height))
-        current_ship_parts_text = FONT.render(f"Your Ship Parts: {self.player.ship_parts}", True, SHIP_PART_COLOR)
-        SCREEN.blit(current_ship_parts_text, (text_start_x, text_start_y + 2 * line_height))
-        current_crystal_text = FONT.render(f"Your Gas Giant Crystals: {self.player.gas_giant_crystal}", True, GAS_GIANT_CRYSTAL_COLOR)
-        SCREEN.blit(current_crystal_text, (text_start_x, text_start_y + 3 * line_height))
+        menu.add_label(FONT, "Your Gold: {}", GOLD_COLOR, lambda: (self.player.gold_ore,), topleft=(text_start_x, text_start_y))
+        menu.add_label(FONT, "Your Silicon: {}", SILICON_COLOR, lambda: (self.player.silicon_ore,), topleft=(text_start_x, text_start_y + line_height))
+        menu.add_label(FONT, "Your Ship Parts: {}", SHIP_PART_COLOR, lambda: (self.player.ship_parts,), topleft=(text_start_x, text_start_y + 2 * line_height))
+        menu.add_label(FONT, "Your Gas Giant Crystals: {}", GAS_GIANT_CRYSTAL_COLOR, lambda: (self.player.gas_giant_crystal,), topleft=(text_start_x, text_start_y + 3 * line_height))
 
         # Display trade offer
-        trade_offer_text = MENU_FONT.render(f"Trade {GAS_GIANT_CRYSTAL_TRADE_COST['Gold']} Gold, {GAS_GIANT_CRYSTAL_TRADE_COST['Silicon']} Silicon, {GAS_GIANT_CRYSTAL_TRADE_COST['Ship Parts']} Ship Parts for {GAS_GIANT_CRYSTAL_TRADE_AMOUNT} Gas Giant Crystal", True, YELLOW)
-        trade_offer_rect = trade_offer_text.get_rect(center=(SCREEN_WIDTH // 2, text_start_y + 5 * line_height))
-        SCREEN.blit(trade_offer_text, trade_offer_rect)
+        menu.add_text(MENU_FONT, f"Trade {GAS_GIANT_CRYSTAL_TRADE_COST['Gold']} Gold, {GAS_GIANT_CRYSTAL_TRADE_COST['Silicon']} Silicon, {GAS_GIANT_CRYSTAL_TRADE_COST['Ship Parts']} Ship Parts for {GAS_GIANT_CRYSTAL_TRADE_AMOUNT} Gas Giant Crystal", YELLOW,
+                      center=(SCREEN_WIDTH // 2, text_start_y + 5 * line_height))
 
-        self.buttons.clear()
         # Trade Button
-        self.draw_button("Trade for Crystal", (SCREEN_WIDTH - 200) // 2, text_start_y + 6 * line_height + 20, 200, 50, 'trade_crystal_button')
+        menu.add_button("Trade for Crystal", (SCREEN_WIDTH - 200) // 2, text_start_y + 6 * line_height + 20, 200, 50, 'trade_crystal_button')
         # Back Button
-        self.draw_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        menu.add_button("Back", (SCREEN_WIDTH - 150) // 2, SCREEN_HEIGHT - 100, 150, 50, 'back_button')
+        return menu
 
 
     def draw_inventory_screen(self):
@@ -3615,7 +4440,7 @@ class GameManager:
         pygame.draw.rect(SCREEN, BLACK, inventory_rect) # Fill
 
         # Inventory title
-        title_text = LARGE_FONT.render("INVENTORY", True, WHITE)
+        title_text = TEXT_CACHE.render(LARGE_FONT, "INVENTORY", WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, inventory_box_y + 30))
         SCREEN.blit(title_text, title_rect)
 
@@ -3625,78 +4450,62 @@ class GameManager:
         line_height = 30
 
         # Ship Parts
-        ship_parts_text = INVENTORY_FONT.render(f"Ship Parts: {self.player.ship_parts}", True, SHIP_PART_COLOR)
+        ship_parts_text = TEXT_CACHE.render(INVENTORY_FONT, f"Ship Parts: {self.player.ship_parts}", SHIP_PART_COLOR)
         SCREEN.blit(ship_parts_text, (text_start_x, text_start_y))
 
         # Materials
-        carbon_text = INVENTORY_FONT.render(f"Carbon: {self.player.carbon_ore}", True, CARBON_COLOR)
+        carbon_text = TEXT_CACHE.render(INVENTORY_FONT, f"Carbon: {self.player.carbon_ore}", CARBON_COLOR)
         SCREEN.blit(carbon_text, (text_start_x, text_start_y + line_height))
-        silicon_text = INVENTORY_FONT.render(f"Silicon: {self.player.silicon_ore}", True, SILICON_COLOR)
+        silicon_text = TEXT_CACHE.render(INVENTORY_FONT, f"Silicon: {self.player.silicon_ore}", SILICON_COLOR)
         SCREEN.blit(silicon_text, (text_start_x, text_start_y + 2 * line_height))
-        gold_text = INVENTORY_FONT.render(f"Gold: {self.player.gold_ore}", True, GOLD_COLOR)
+        gold_text = TEXT_CACHE.render(INVENTORY_FONT, f"Gold: {self.player.gold_ore}", GOLD_COLOR)
         SCREEN.blit(gold_text, (text_start_x, text_start_y + 3 * line_height))
         
         # New Resources
-        rocky_ore_text = INVENTORY_FONT.render(f"Rocky Ore: {self.player.rocky_ore}", True, ROCKY_ORE_COLOR)
+        rocky_ore_text = TEXT_CACHE.render(INVENTORY_FONT, f"Rocky Ore: {self.player.rocky_ore}", ROCKY_ORE_COLOR)
         SCREEN.blit(rocky_ore_text, (text_start_x, text_start_y + 4 * line_height))
-        gas_giant_crystal_text = INVENTORY_FONT.render(f"Gas Giant Crystal: {self.player.gas_giant_crystal}", True, GAS_GIANT_CRYSTAL_COLOR)
+        gas_giant_crystal_text = TEXT_CACHE.render(INVENTORY_FONT, f"Gas Giant Crystal: {self.player.gas_giant_crystal}", GAS_GIANT_CRYSTAL_COLOR)
         SCREEN.blit(gas_giant_crystal_text, (text_start_x, text_start_y + 5 * line_height))
 
 
         # Hint to close
-        close_text = FONT.render("Press 'I' to Close Inventory", True, WHITE)
+        close_text = TEXT_CACHE.render(FONT, "Press 'I' to Close Inventory", WHITE)
         close_rect = close_text.get_rect(center=(SCREEN_WIDTH // 2, inventory_box_y + inventory_box_height - 30))
         SCREEN.blit(close_text, close_rect)
 
 
     def display_game_over(self):
         """Displays the game over message."""
-        game_over_text = LARGE_FONT.render("GAME OVER", True, RED)
+        game_over_text = TEXT_CACHE.render(LARGE_FONT, "GAME OVER", RED)
         text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         SCREEN.blit(game_over_text, text_rect)
 
         # Display final XP and Level instead of score
-        final_xp_text = FONT.render(f"Final XP: {self.player.current_xp} (Level {self.player.level})", True, WHITE)
+        final_xp_text = TEXT_CACHE.render(FONT, f"Final XP: {self.player.current_xp} (Level {self.player.level})", WHITE)
         xp_rect = final_xp_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
-        SCREEN.blit(xp_text, xp_rect)
+        SCREEN.blit(final_xp_text, xp_rect)
 
-        restart_text = FONT.render("Press R to Restart", True, WHITE)
+        restart_text = TEXT_CACHE.render(FONT, "Press R to Restart", WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
         SCREEN.blit(restart_text, restart_rect)
 
     def reset_game(self):
         """Rsesets the game to its initial state."""
         self.player = Player() # Player starts at world origin again
-        self.asteroids.empty()
-        self.enemies.empty()
-        self.player_projectiles.empty()
-        self.enemy_projectiles.empty()
-        self.ship_parts_group.empty() # Clear ship parts
-        self.material_drops_group.empty() # Clear material drops
-        self.planets.empty() # Clear planets
-        self.mining_zones.clear() # Clear mining zones
-        self.mining_npcs.empty() # Clear mining NPCs
-        self.enemy_base = None # Reset enemy base
+        self.clear_world()
 
         self.game_over = False
         self.last_enemy_spawn_time = pygame.time.get_ticks()
         # Reset camera to center on new player position
         self.camera_x = self.player.x - SCREEN_WIDTH // 2
         self.camera_y = self.player.y - SCREEN_HEIGHT // 2
-        self.mining_laser_active = False # Reset mining laser state
-        self.auto_mine_active = False # Reset auto-mine active state
-        self.targeted_asteroids.clear() # Clear targeted asteroids
         self.auto_mine_charge = AUTO_MINE_MAX_CHARGE # Reset auto-mine charge
         self.game_state = "PLAYING" # Reset game state
         self.previous_game_state = "PLAYING" # Reset previous game state
-        self.e_pressed_last_frame = False # Reset key state for 'E'
-        self.i_pressed_last_frame = False # Reset key state for 'I'
-        self.f_pressed_last_frame = False # Reset key state for 'F'
-        # Reset ping variables
         self.last_ping_time = 0
-        self.outgoing_ping_active = False
-        self.incoming_ping_active = False
-        self.ping_t_pressed_last_frame = False
+        self.reset_transient_state()
+        TIMERS.clear() # Drops the old game's missile lifetimes and ping phases
+        self.start_game_timers()
         self.spawn_space_station() # Re-spawn station for new game
         self.trading_outpost = None # Reset trading outpost
         self.spawn_initial_asteroids()
@@ -3716,10 +4525,39 @@ class GameManager:
         self.player.weapon_slot_2 = "None"
         self.player.last_shot_time_slot1 = 0
         self.player.last_shot_time_slot2 = 0
+        self.last_jump_time = 0
 
+    def clear_world(self):
+        """Removes every entity and zone from the world, before a new or loaded one is spawned."""
+        self.asteroids.empty()
+        self.enemies.empty()
+        self.player_projectiles.empty()
+        self.enemy_projectiles.empty()
+        self.ship_parts_group.empty() # Clear ship parts
+        self.material_drops_group.empty() # Clear material drops
+        self.planets.empty() # Clear planets
+        self.mining_zones.clear() # Clear mining zones
+        self.mining_npcs.empty() # Clear mining NPCs
+        self.enemy_base = None # Reset enemy base
+        if self.sector_store:
+            self.sector_store.reset()
+            self.loaded_sectors = set()
+        self.invalidate_static_world() # Everything static is re-spawned
 
+    def reset_transient_state(self):
+        """Stops everything that is only in progress for a moment (lasers, pings, jumps, key presses), for a new or loaded game."""
+        self.mining_laser_active = False # Reset mining laser state
+        self.auto_mine_active = False # Reset auto-mine active state
+        self.targeted_asteroids.clear() # Clear targeted asteroids
+        self.e_pressed_last_frame = False # Reset key state for 'E'
+        self.i_pressed_last_frame = False # Reset key state for 'I'
+        self.f_pressed_last_frame = False # Reset key state for 'F'
+        # Reset ping variables
+        self.outgoing_ping_active = False
+        self.incoming_ping_active = False
+        self.ping_timers = []
+        self.ping_t_pressed_last_frame = False
         # Reset Jump Drive attributes
-        self.last_jump_time = 0
         self.jump_target_world_pos = None
         self.jump_initiation_start_time = 0
         self.jump_rings_active = False
@@ -3727,65 +4565,258 @@ class GameManager:
         self.jump_drive_zoom_active = False
         self.r_pressed_last_frame = False
 
+    def start_game_timers(self, regen_delay=HEALTH_REGEN_INTERVAL):
+        """Schedules the repeating game timers: health regeneration and the autosave."""
+        self.regen_timer = TIMERS.schedule(regen_delay, self.regenerate_health)
+        TIMERS.schedule(AUTOSAVE_INTERVAL, self.autosave)
 
-# --- Main Game Loop ---
-def game_loop():
-    """
-    The main loop of the game.
-    Handles events, updates game state, and draws everything.
-    """
-    clock = pygame.time.Clock()
-    game_manager = GameManager()
-    running = True
+    def autosave(self):
+        """Saves the game every AUTOSAVE_INTERVAL, unless it is over, apart from the quick save."""
+        if not self.game_over:
+            self.save_game(AUTOSAVE_PATH)
+        TIMERS.schedule(AUTOSAVE_INTERVAL, self.autosave)
 
-    while running:
+    def save_game(self, path=SAVE_PATH):
+        """
+        Saves the game to path. Only the snapshot is captured here; it is packed, compressed and
+        written on the save thread, so saving doesn't hold up the frame.
+        """
+        if self.save_worker is None:
+            self.save_worker = SaveWorker(SAVE_MAGIC, SAVE_VERSION, pack_save)
+        print(f"Saving the game to {path}")
+        try:
+            self.save_worker.submit(path, self.capture_save(pygame.time.get_ticks()))
+        except OSError as error: # An earlier save failed to write; this one is queued all the same
+            print(f"An earlier save failed: {error}")
+
+    def load_game(self, path=SAVE_PATH):
+        """Replaces the game with the one saved at path. Returns False, keeping the current game, if it can't be loaded."""
+        if self.save_worker is not None:
+            try:
+                self.save_worker.flush() # Don't read a save that is still being written
+            except OSError as error:
+                print(f"An earlier save failed: {error}")
+        try:
+            version, body = read_save(path, SAVE_MAGIC)
+            if version != SAVE_VERSION:
+                print(f"Could not load {path}: it has save format version {version}, this game reads version {SAVE_VERSION}.")
+                return False
+            snapshot = SaveSnapshot(*unpack_tables(SAVE_LAYOUTS, body))
+        except (OSError, ValueError) as error:
+            print(f"Could not load {path}: {error}")
+            return False
+        self.restore_save(snapshot, pygame.time.get_ticks())
+        print(f"Game loaded from {path}")
+        return True
+
+    def capture_save(self, current_time):
+        """
+        Captures the state to save as a SaveSnapshot of plain records. The records share nothing
+        with the live game, so the save thread can pack them while the game goes on.
+        """
+        player = self.player
+        zone_indices = {zone: index for index, zone in enumerate(self.mining_zones)}
+        asteroid_zones = {asteroid: zone_indices[zone] for zone in self.mining_zones for asteroid in zone.asteroids_in_zone}
+        random_version, random_state, gauss_next = random.getstate()
+        return SaveSnapshot(
+            game=[(saved_game_state(self.game_state), saved_game_state(self.previous_game_state), self.current_energy_core, self.camera_x, self.camera_y,
+                   self.auto_mine_charge, self.selected_weapon_slot, self.game_over,
+                   current_time - self.last_enemy_spawn_time, current_time - self.last_ping_time,
+                   current_time - self.last_jump_time, max(0, self.regen_timer.deadline - TIMERS.now))],
+            player=[(player.x, player.y, player.angle, player.health, player.max_health, player.resources,
+                     player.weapon_slot_1, player.weapon_slot_2, current_time - player.last_shot_time_slot1,
+                     current_time - player.last_shot_time_slot2, player.level, player.current_xp, player.xp_threshold,
+                     player.ship_parts, player.carbon_ore, player.silicon_ore, player.gold_ore, player.rocky_ore,
+                     player.gas_giant_crystal, player.current_mining_tool, player.recharge_rate_multiplier,
+                     player.power_output_multiplier, player.current_engine_type, player.current_antenna_type)],
+            asteroids=[(asteroid.x, asteroid.y, asteroid.size, asteroid.resources, asteroid.health, asteroid.is_stealth,
+                        asteroid_zones.get(asteroid, -1)) for asteroid in self.asteroids],
+            enemies=[(type(enemy).__name__, enemy.x, enemy.y, enemy.health, enemy.angle, current_time - enemy.last_shot_time)
+                     for enemy in self.enemies],
+            planets=[(planet.planet_type_name, planet.x, planet.y, planet.size) for planet in self.planets],
+            mining_zones=[(zone.x, zone.y, zone.radius, zone.max_asteroids, zone.max_npcs) for zone in self.mining_zones],
+            mining_npcs=[(npc.x, npc.y, npc.angle, zone_indices[npc.zone_id]) for npc in self.mining_npcs],
+            ship_parts=[(part.x, part.y, part.size) for part in self.ship_parts_group],
+            material_drops=[(drop.material_type, drop.x, drop.y, drop.amount, drop.size) for drop in self.material_drops_group],
+            space_station=[(self.space_station.x, self.space_station.y, self.space_station.size)],
+            trading_outpost=[(self.trading_outpost.x, self.trading_outpost.y)] if self.trading_outpost else [],
+            enemy_base=[(self.enemy_base.x, self.enemy_base.y, self.enemy_base.size, self.enemy_base.health,
+                         current_time - self.enemy_base.last_turret_shot_time,
+                         current_time - self.enemy_base.last_missile_shot_time)] if self.enemy_base else [],
+            random_state=[(random_version, *random_state, gauss_next is not None, gauss_next or 0.0)],
+            sectors=sorted(self.sector_store.generated) if self.sector_store else [],
+            # The asteroids of the loaded sectors are live and saved with the others
+            sector_asteroids=[(*sector, *record) for sector in self.sector_store.generated - self.loaded_sectors
+                              for record in self.sector_store.read(sector)] if self.sector_store else [],
+        )
+
+    def restore_save(self, snapshot, current_time):
+        """Replaces the game with a SaveSnapshot, as load_game read it."""
+        self.clear_world()
+        self.reset_transient_state()
+        TIMERS.clear() # Drops the current game's missile lifetimes and ping phases
+
+        (game_state, self.previous_game_state, self.current_energy_core, self.camera_x, self.camera_y,
+         self.auto_mine_charge, self.selected_weapon_slot, self.game_over, enemy_spawn_age, ping_age,
+         jump_age, regen_delay) = snapshot.game[0]
+        # Jumps aren't restored, as reset_transient_state() dropped their target; a menu opened
+        # during a jump returns to the flight
+        self.game_state = saved_game_state(game_state)
+        self.previous_game_state = saved_game_state(self.previous_game_state)
+        self.last_enemy_spawn_time = current_time - enemy_spawn_age
+        self.last_ping_time = current_time - ping_age
+        self.last_jump_time = current_time - jump_age
+        self.start_game_timers(regen_delay)
+
+        player = self.player = Player()
+        (player.x, player.y, player.angle, health, max_health, player.resources, weapon_slot_1, weapon_slot_2,
+         shot_age_1, shot_age_2, player.level, current_xp, xp_threshold, player.ship_parts, player.carbon_ore,
+         player.silicon_ore, player.gold_ore, player.rocky_ore, player.gas_giant_crystal, player.current_mining_tool,
+         player.recharge_rate_multiplier, player.power_output_multiplier, engine_type, antenna_type) = snapshot.player[0]
+        player.health = saved_number(health)
+        player.max_health = saved_number(max_health)
+        player.current_xp = saved_number(current_xp)
+        player.xp_threshold = saved_number(xp_threshold)
+        player.set_weapon(weapon_slot_1, 1)
+        player.set_weapon(weapon_slot_2, 2)
+        player.last_shot_time_slot1 = current_time - shot_age_1
+        player.last_shot_time_slot2 = current_time - shot_age_2
+        player.set_engine(engine_type)
+        player.set_antenna(antenna_type)
+        player.rect.center = (int(player.x), int(player.y))
+
+        for x, y, radius, max_asteroids, max_npcs in snapshot.mining_zones:
+            self.mining_zones.append(MiningSafezone(x, y, radius, max_asteroids, max_npcs))
+        if self.sector_store:
+            sector_records = {sector: [] for sector in snapshot.sectors}
+            for column, row, *record in snapshot.sector_asteroids:
+                sector_records[(column, row)].append(record)
+            for sector, records in sector_records.items():
+                self.sector_store.write(sector, records)
+            # The live asteroids come from the asteroids table, so the sectors around the player
+            # start out empty instead of being generated (the save may predate the sector store)
+            self.loaded_sectors = self.sectors_around_player()
+            for sector in self.loaded_sectors:
+                self.sector_store.write(sector, [])
+        for x, y, size, resources, health, is_stealth, zone_index in snapshot.asteroids:
+            asteroid = Asteroid(x, y, size, resources, is_stealth)
+            asteroid.health = saved_number(health)
+            self.asteroids.add(asteroid)
+            if zone_index >= 0:
+                self.mining_zones[zone_index].asteroids_in_zone.add(asteroid)
+        for x, y, angle, zone_index in snapshot.mining_npcs:
+            npc = MiningNPC(x, y, self.mining_zones[zone_index])
+            npc.angle = angle
+            self.mining_npcs.add(npc)
+            self.mining_zones[zone_index].npcs_in_zone.add(npc)
+        enemy_classes = {enemy_class.__name__: enemy_class for enemy_class in (Enemy, EliteEnemy, FastEnemy)}
+        for class_name, x, y, health, angle, shot_age in snapshot.enemies:
+            enemy = enemy_classes[class_name](x, y)
+            enemy.health = saved_number(health)
+            enemy.angle = angle
+            enemy.last_shot_time = current_time - shot_age
+            self.enemies.add(enemy)
+        for planet_type_name, x, y, size in snapshot.planets:
+            self.planets.add(Planet(x, y, planet_type_name, size))
+        for x, y, size in snapshot.ship_parts:
+            self.ship_parts_group.add(ShipPart(x, y, size))
+        for material_type, x, y, amount, size in snapshot.material_drops:
+            self.material_drops_group.add(MaterialDrop(x, y, material_type, amount, size))
+        x, y, size = snapshot.space_station[0]
+        self.space_station = SpaceStation(x, y, size)
+        self.trading_outpost = None
+        for x, y in snapshot.trading_outpost:
+            outpost_data = OUTPOST_TYPES["Trading Outpost"]
+            self.trading_outpost = TradingOutpost(x, y, outpost_data["size"], outpost_data["color"])
+        for x, y, size, health, turret_shot_age, missile_shot_age in snapshot.enemy_base:
+            self.enemy_base = EnemyBase(x, y, size, self)
+            self.enemy_base.health = saved_number(health)
+            self.enemy_base.last_turret_shot_time = current_time - turret_shot_age
+            self.enemy_base.last_missile_shot_time = current_time - missile_shot_age
+
+        random_version, *random_state, has_gauss_next, gauss_next = snapshot.random_state[0]
+        random.setstate((random_version, tuple(random_state), gauss_next if has_gauss_next else None))
+        self.render_snapshot = self.make_render_snapshot(current_time)
+
+    def step(self, events):
+        """Applies a frame's events and input, then advances the game to the current time."""
         current_time = pygame.time.get_ticks() # Get current time in milliseconds
+        self.frame_start_time = current_time
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
+        for event in events:
+            if event.type == pygame.QUIT or event.type == pygame.WINDOWCLOSE: # The texture backend keeps a second, hidden window
+                self.running = False
             if event.type == pygame.KEYDOWN:
-                if game_manager.game_over and event.key == pygame.K_r:
-                    game_manager.reset_game()
+                if self.game_over and event.key == pygame.K_r:
+                    self.reset_game()
+                if event.key == pygame.K_F5: # Quick save
+                    self.save_game()
+                if event.key == pygame.K_F9: # Quick load, or the autosave with Shift
+                    self.load_game(AUTOSAVE_PATH if event.mod & pygame.KMOD_SHIFT else SAVE_PATH)
                 # Pass all keydown events to handle_input for 'E', 'I', 'F', 'T', Space, LCTRL key logic
-                game_manager.handle_input(pygame.key.get_pressed(), current_time)
+                self.handle_input(pygame.key.get_pressed(), current_time)
             if event.type == pygame.KEYUP:
                 # Pass all keyup events to handle_input for 'E', 'I', 'F', 'T', Space, LCTRL key logic
-                game_manager.handle_input(pygame.key.get_pressed(), current_time)
+                self.handle_input(pygame.key.get_pressed(), current_time)
             # Mouse motion is needed for laser aiming even if not clicked
             if event.type == pygame.MOUSEMOTION:
-                game_manager.mouse_world_x = event.pos[0] + game_manager.camera_x
-                game_manager.mouse_world_y = event.pos[1] + game_manager.camera_y
+                self.mouse_world_x = event.pos[0] + self.camera_x
+                self.mouse_world_y = event.pos[1] + self.camera_y
             if event.type == pygame.MOUSEBUTTONDOWN:
                 # Pass mouse click events to handle_input for menu button logic
-                game_manager.handle_input(pygame.key.get_pressed(), current_time)
-
+                self.handle_input(pygame.key.get_pressed(), current_time)
 
         keys = pygame.key.get_pressed()
         # Always call handle_input to update player movement and check for spacebar/mouse
         # Note: Mouse clicks are handled by MOUSEBUTTONDOWN event, not continuously by keys.
         # This ensures that the `can_press_button` check is only applied once per click.
         # Player update now takes game_state and target_angle for jump alignment
-        game_manager.player.update(keys, current_time, game_manager.game_state) 
+        self.player.update(keys, current_time, self.game_state)
 
         # Update game state
-        if not game_manager.game_over:
-            game_manager.update_game_state(current_time)
-
-        # Drawing
-        SCREEN.fill(BLACK) # Clear screen
+        if not self.game_over:
+            self.update_game_state(current_time)
+
+    def draw(self):
+        """Draws the frame: the world (or the render thread's last finished one), the UI and the game over screen."""
+        if self.render_worker:
+            # Present the previous tick's finished world frame while this tick's snapshot is drawn
+            self.present_world(self.render_worker.swap(self.render_snapshot))
+            self.draw_world_overlays()
+        else:
+            self.draw_game_objects()
+        self.draw_ui()
 
-        game_manager.draw_game_objects()
-        game_manager.draw_ui()
+        if self.game_over:
+            self.display_game_over()
 
-        if game_manager.game_over:
-            game_manager.display_game_over()
+    def frame_done(self, work_ms):
+        self.quality_governor.record_frame(work_ms, self.frame_start_time) # Frame work time, excluding the cap's wait
 
-        pygame.display.flip() # Update the full display Surface to the screen
+    def close(self):
+        if self.render_worker:
+            self.render_worker.stop()
+        if self.save_worker:
+            self.save_worker.stop() # Finishes writing a save still in flight
+        if self.sector_store:
+            self.unload_sectors(self.loaded_sectors, set()) # So the next session finds the sectors as they were left
+            self.sector_store.close()
 
-        clock.tick(FPS) # Control frame rate
 
-    pygame.quit()
+# --- Main Game Loop ---
+def game_loop():
+    """
+    The main loop of the game.
+    Handles events, updates game state, and draws everything.
+    """
+    game_manager = GameManager()
+    # Optionally draw the world on a background thread, one snapshot behind the simulation.
+    # An SDL renderer may only be used from the thread that created it, so not with the texture backend.
+    if RENDER_THREAD_ENABLED and RENDERER:
+        print("The render thread is not used with the texture render backend.")
+    elif RENDER_THREAD_ENABLED:
+        game_manager.render_worker = RenderWorker(game_manager.draw_world, WORLD_RENDER_SIZE)
+    run(game_manager, FPS)
 
 if __name__ == "__main__":
-    game_loop()
\ No newline at end of file
+    game_loop()
@@ -1,14 +1,19 @@
 import pygame
-import time
 import random
 import math
+import os
+import time
+import argparse
 
-# Initialize Pygame
-pygame.init()
+from engine import TimerWheel, TargetIndex, CollisionLayers, TextCache, HudText, SpriteAtlas
+from engine import Entity, Game, distance, run, turn_towards
 
 # --- Constants ---
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
+SCREEN_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+DISPLAY_SCALED = False # Let SDL scale the 800x600 frame up to the window in hardware (pygame.SCALED)
+DISPLAY_FULLSCREEN = False # Fullscreen; with DISPLAY_SCALED the frame is scaled to the desktop resolution
 FPS = 60
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -33,8 +38,29 @@ MAX_ASTEROID_SPEED = 2
 MAX_ENEMY_SPEED = 2
 MAX_MISSILE_VELOCITY = 2
 MAX_PLASMA_BOLT_VELOCITY = 8 # Plasma bolts are fast
+MISSILE_TURN_RATE = 3 # Degrees a homing missile can turn per tick
+EXPLOSION_STAGES = { # size_category -> (radius, color) of each animation stage, expanding then shrinking
+    'small': [(5, YELLOW), (10, ORANGE), (15, RED), (12, ORANGE), (8, YELLOW)],
+    'medium': [(10, YELLOW), (20, ORANGE), (30, RED), (25, ORANGE), (15, YELLOW)],
+    'large': [(20, YELLOW), (35, ORANGE), (50, RED), (40, ORANGE), (25, YELLOW)],
+}
+EXPLOSION_ANIMATION_SPEED = 4 # Ticks each explosion stage is shown for
 LASER_COLOR = (255, 0, 0)
 LASER_WIDTH = 3
+TARGET_INDEX_CELL_SIZE = 100 # Grid cell edge length of the nearest-target index
+SPATIAL_HASH_CELL_SIZE = 50 # Cell edge length of the collision broadphase; must divide the screen width and height
+COLLISION_MATRIX = { # Collision layer -> the layers its sprites can hit, resolved in this order
+    "player": ("asteroids", "resources", "enemies"),
+    "enemy_missiles": ("player", "asteroids"),
+    "player_missiles": ("asteroids",),
+    "plasma_bolts": ("asteroids",),
+}
+WRAPPING_LAYERS = ("asteroids",) # Collision layers whose sprites wrap around the screen edges
+TEXT_CACHE_MAX_ENTRIES = 128 # Rendered text surfaces kept for reuse by the UI
+SPRITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sprites") # PNG sprites shipped with the game
+FRAGMENT_POOL_SIZE = 256 # Destroyed asteroids and collected resources kept for reuse by the fragmentation engine
+RESOURCE_SIZE = (10, 10)
+SPRITE_ATLAS_SIZE = 512 # Edge length of the atlas page scaled sprites are packed into
 
 # Define your weapon types with their properties and costs
 WEAPON_TYPES = {
@@ -44,11 +70,33 @@ WEAPON_TYPES = {
 }
 PLAYER_WEAPON_TYPE_INIT = "Missile Launcher" # Default starting weapon
 
+# Wave mode: escalating waves, for play and for measuring how much load the game sustains
+WAVE_DURATION = 30 # Seconds per wave
+WAVE_CURVES = { # Quantity -> (value in wave 1, growth per wave); wave n has value * growth ** (n - 1)
+    "asteroids": (5, 1.6), # Asteroids kept alive
+    "enemies": (2, 1.5), # Enemies kept alive
+    "missile_rate": (1.0, 1.2), # Multiplies how often enemies shoot
+}
+CAPACITY_FRAMES_PER_WAVE = 120 # Frames measured per wave by measure_capacity
+CAPACITY_MAX_WAVES = 30
+
 # --- Helper Functions ---
 
-def calculate_distance(pos1, pos2):
-    """Calculates the Euclidean distance between two points."""
-    return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+def seconds_to_ticks(seconds):
+    """Converts a duration in seconds to game ticks, the unit of the game's timer wheel."""
+    return round(seconds * FPS)
+
+def wave_value(curves, name, wave):
+    """Returns the value of a wave mode quantity in a wave."""
+    start, growth = curves[name]
+    return start * growth ** (wave - 1)
+
+def wrap_offsets(rect):
+    """Returns the (dx, dy) offsets at which a rect crossing the screen edges shows up again on the wrapping playfield."""
+    if SCREEN_RECT.contains(rect):
+        return []
+    return [(dx, dy) for dx in (-SCREEN_WIDTH, 0, SCREEN_WIDTH) for dy in (-SCREEN_HEIGHT, 0, SCREEN_HEIGHT)
+            if (dx or dy) and SCREEN_RECT.colliderect(rect.move(dx, dy))]
 
 def generate_random_position(width_range, height_range):
     """Generates a random position within specified ranges."""
@@ -63,60 +111,39 @@ def limit_position(position, max_width, max_height):
     y = max(0, min(y, max_height))
     return x, y
 
-def split_asteroid(original_asteroid):
-    """Splits an asteroid into smaller asteroids or resources upon destruction."""
-    new_items = []
-    original_center_x = original_asteroid.rect.centerx
-    original_center_y = original_asteroid.rect.centery
-
-    if original_asteroid.size_index < len(ASTEROID_SIZES) - 1:
-        # Split into smaller asteroids if not the smallest size
-        for _ in range(2):
-            new_size_index = original_asteroid.size_index + 1
-            
-            # Add slight offset to prevent instant re-collision
-            # Push them away from the center of the original asteroid
-            angle = random.uniform(0, 2 * math.pi)
-            displacement_distance = ASTEROID_SIZES[new_size_index][0] + 5 # Based on new asteroid size + a bit
-
-            disp_x = math.cos(angle) * displacement_distance
-            disp_y = math.sin(angle) * displacement_distance
-            
-            # Inherit some velocity from parent, with some randomness
-            parent_speed_x = getattr(original_asteroid, 'speed_x', 0)
-            parent_speed_y = getattr(original_asteroid, 'speed_y', 0)
-
-            new_speed_x = parent_speed_x * 0.5 + random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED) / (new_size_index + 1.5)
-            new_speed_y = parent_speed_y * 0.5 + random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED) / (new_size_index + 1.5)
-
-            new_asteroid_obj = Asteroid(
-                original_center_x + disp_x,
-                original_center_y + disp_y,
-                new_size_index,
-                new_speed_x,
-                new_speed_y
-            )
-            new_items.append(new_asteroid_obj)
-    else:
-        # Split into resources if it's the smallest size
-        for _ in range(random.randint(1, 3)):
-            resource = Resource(original_center_x, original_center_y,
-                               random.randint(0, len(RESOURCE_COLORS) - 1))
-            new_items.append(resource)
-    return new_items
+def asteroid_image(size_index):
+    """Returns the image shared by all asteroids of a size."""
+    key = ("asteroid", size_index)
+    if key not in fragment_images:
+        size = ASTEROID_SIZES[size_index]
+        image = sprite_atlas.get("asteroid", size)
+        if image is None: # Fall back to the built-in shape
+            image = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.ellipse(image, ASTEROID_COLORS[size_index], (0, 0, size[0], size[1]))
+        fragment_images[key] = image
+    return fragment_images[key]
+
+def resource_image(resource_type):
+    """Returns the image shared by all resources of a type."""
+    key = ("resource", resource_type)
+    if key not in fragment_images:
+        image = pygame.Surface(RESOURCE_SIZE)
+        image.fill(RESOURCE_COLORS[resource_type])
+        fragment_images[key] = image
+    return fragment_images[key]
 
 def generate_asteroid_position(player_position, screen_width, screen_height):
     """Generates an asteroid position far enough from the player."""
     while True:
         x = random.randrange(screen_width)
         y = random.randrange(screen_height)
-        if calculate_distance((x, y), player_position) > 150: # Ensure asteroids don't spawn too close
+        if distance((x, y), player_position) > 150: # Ensure asteroids don't spawn too close
             return x, y
 
 def draw_button(surface, rect, color, text, text_color, font_obj):
     """Helper function to draw a button with text."""
     pygame.draw.rect(surface, color, rect, border_radius=5)
-    text_surface = font_obj.render(text, True, text_color)
+    text_surface = text_cache.render(font_obj, text, text_color)
     text_rect = text_surface.get_rect(center=rect.center)
     surface.blit(text_surface, text_rect)
 
@@ -124,30 +151,30 @@ def draw_button(surface, rect, color, text, text_color, font_obj):
 
 class Spaceship(pygame.sprite.Sprite):
     """Player controlled spaceship."""
-    def __init__(self, x, y):
+    def __init__(self, x, y, effects, timers):
         super().__init__()
-        self.image = pygame.Surface(PLAYER_SIZE, pygame.SRCALPHA)
-        pygame.draw.polygon(self.image, PLAYER_COLOR, [(0, PLAYER_SIZE[1]), (PLAYER_SIZE[0] / 2, 0), (PLAYER_SIZE[0], PLAYER_SIZE[1])])
+        self.image = sprite_atlas.get("spaceship", PLAYER_SIZE)
+        if self.image is None: # Fall back to the built-in shape
+            self.image = pygame.Surface(PLAYER_SIZE, pygame.SRCALPHA)
+            pygame.draw.polygon(self.image, PLAYER_COLOR, [(0, PLAYER_SIZE[1]), (PLAYER_SIZE[0] / 2, 0), (PLAYER_SIZE[0], PLAYER_SIZE[1])])
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.speed_x = 0
         self.speed_y = 0
         self.health = 100
         self.score = 0
-        self.weapon = Weapon(PLAYER_WEAPON_TYPE_INIT) # Initialize with default weapon
+        self.weapon = Weapon(PLAYER_WEAPON_TYPE_INIT, effects, timers) # Initialize with default weapon
         self.firing_weapon = False # True when Shift is pressed (for discrete shots)
         self.shooting_laser = False # True when Left Mouse is pressed (for continuous laser)
-        self.active_laser = None # Reference to the active Laser sprite
+        self.active_laser = None # The active Laser beam, while the Laser Cannon fires
 
-    def update(self):
+    def update(self, now):
         """Updates spaceship position and limits it to screen."""
         self.rect.x += self.speed_x
         self.rect.y += self.speed_y
         self.rect.x = max(0, min(self.rect.x, SCREEN_WIDTH - self.rect.width))
         self.rect.y = max(0, min(self.rect.y, SCREEN_HEIGHT - self.rect.height))
 
-        self.weapon.update() # Update weapon's internal cooldown
-
     def accelerate(self, direction):
         """Changes spaceship's speed based on direction."""
         if direction == "up": self.speed_y = -MAX_PLAYER_SPEED
@@ -161,27 +188,27 @@ class Asteroid(pygame.sprite.Sprite):
     """Asteroid objects that the player mines or avoids."""
     def __init__(self, x, y, size_index, speed_x, speed_y):
         super().__init__()
+        self.reset(x, y, size_index, speed_x, speed_y)
+
+    def reset(self, x, y, size_index, speed_x, speed_y):
+        """(Re)initializes the asteroid, so a pooled one can be reused."""
         self.size_index = size_index
         self.size = ASTEROID_SIZES[size_index]
-        self.image = pygame.Surface(self.size, pygame.SRCALPHA)
-        pygame.draw.ellipse(self.image, ASTEROID_COLORS[size_index], (0, 0, self.size[0], self.size[1]))
+        self.image = asteroid_image(size_index) # Shared by all asteroids of this size
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.speed_x = speed_x
         self.speed_y = speed_y
         self.health = self.size[0] * 2 # Health based on size
 
-    def update(self):
+    def update(self, now):
         """Updates asteroid position with a slight drag and wraps around screen edges."""
         self.speed_x -= self.speed_x * 0.01 # Apply slight drag
         self.speed_y -= self.speed_y * 0.01
         self.rect.x += self.speed_x
         self.rect.y += self.speed_y
-        # Wrap around screen edges
-        if self.rect.left > SCREEN_WIDTH: self.rect.right = 0
-        if self.rect.right < 0: self.rect.left = SCREEN_WIDTH
-        if self.rect.top > SCREEN_HEIGHT: self.rect.bottom = 0
-        if self.rect.bottom < 0: self.rect.top = SCREEN_HEIGHT
+        # Wrap around screen edges; the playfield is a torus, so the center always stays on screen
+        self.rect.center = (self.rect.centerx % SCREEN_WIDTH, self.rect.centery % SCREEN_HEIGHT)
 
     def damage(self, amount):
         """Applies damage to the asteroid. Returns True if destroyed."""
@@ -192,27 +219,27 @@ class Resource(pygame.sprite.Sprite):
     """Resources dropped by destroyed asteroids."""
     def __init__(self, x, y, resource_type):
         super().__init__()
+        self.reset(x, y, resource_type)
+
+    def reset(self, x, y, resource_type):
+        """(Re)initializes the resource, so a pooled one can be reused."""
         self.resource_type = resource_type
         self.color = RESOURCE_COLORS[resource_type]
-        self.image = pygame.Surface((10, 10))
-        self.image.fill(self.color)
+        self.image = resource_image(resource_type) # Shared by all resources of this type
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.value = (resource_type + 1) * 10 # Value based on type
         self.lifetime = 600 # Lifetime in frames (10 seconds at 60 FPS)
-
-    def update(self):
-        """Decrements lifetime and kills the resource if expired."""
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.kill()
+        self.expiry = None # Timer that removes the resource once its lifetime is over
 
 class Enemy(pygame.sprite.Sprite):
     """Enemy spaceship that moves randomly and shoots missiles."""
     def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.Surface(ENEMY_SIZE, pygame.SRCALPHA)
-        pygame.draw.polygon(self.image, ENEMY_COLOR, [(0, 0), (ENEMY_SIZE[0], ENEMY_SIZE[1]/2), (0, ENEMY_SIZE[1])])
+        self.image = sprite_atlas.get("enemy_ship", ENEMY_SIZE, -90) # Turned to point right like the built-in shape
+        if self.image is None:
+            self.image = pygame.Surface(ENEMY_SIZE, pygame.SRCALPHA)
+            pygame.draw.polygon(self.image, ENEMY_COLOR, [(0, 0), (ENEMY_SIZE[0], ENEMY_SIZE[1]/2), (0, ENEMY_SIZE[1])])
         self.original_image = self.image # Store original for rotation
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
@@ -220,10 +247,10 @@ class Enemy(pygame.sprite.Sprite):
         self.speed_y = random.uniform(-MAX_ENEMY_SPEED, MAX_ENEMY_SPEED)
         self.health = 50
         self.target_player = None # Will be set to the player instance
-        self.next_shot = time.time() + random.randint(0, 2) # Initial random delay
-        self.shoot_delay = 5 # Time between shots
+        self.first_shot_delay = random.randint(0, 2) # Initial random delay, in seconds
+        self.shoot_delay = 5 # Seconds between shots
 
-    def update(self):
+    def update(self, now):
         """Updates enemy position, changes direction randomly, and rotates image."""
         self.rect.x += self.speed_x
         self.rect.y += self.speed_y
@@ -242,29 +269,26 @@ class Enemy(pygame.sprite.Sprite):
         if self.rect.left < 0 or self.rect.right > SCREEN_WIDTH: self.speed_x *= -1
         if self.rect.top < 0 or self.rect.bottom > SCREEN_HEIGHT: self.speed_y *= -1
         
-    def shoot_missile(self):
-        """Fires a missile if target is available and cooldown is ready."""
-        if time.time() >= self.next_shot and self.target_player:
-            missile = Missile(self.rect.centerx, self.rect.centery, self.target_player, MISSILE_COLOR)
-            self.next_shot = time.time() + self.shoot_delay
-            return missile
+    def shoot_missile(self, timers, effects):
+        """Fires a missile if a target is available. The game calls it when the enemy's shot is due."""
+        if self.target_player:
+            return Missile(self.rect.centerx, self.rect.centery, self.target_player, MISSILE_COLOR, timers, effects)
         return None
 
-class Missile(pygame.sprite.Sprite):
-    """Homing missile projectile."""
-    def __init__(self, x, y, target, color):
-        super().__init__()
-        self.image = pygame.Surface(MISSILE_SIZE, pygame.SRCALPHA)
-        pygame.draw.polygon(self.image, color, [(0, MISSILE_SIZE[1]/2), (MISSILE_SIZE[0], 0), (MISSILE_SIZE[0], MISSILE_SIZE[1])])
-        self.original_image = self.image
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
+class Missile(Entity):
+    """Homing missile projectile. Its explosion is added to effects (an ExplosionEffects) when it expires."""
+    def __init__(self, x, y, target, color, timers, effects):
+        image = pygame.Surface(MISSILE_SIZE, pygame.SRCALPHA)
+        pygame.draw.polygon(image, color, [(0, MISSILE_SIZE[1]/2), (MISSILE_SIZE[0], 0), (MISSILE_SIZE[0], MISSILE_SIZE[1])])
+        super().__init__(x, y, image)
+        self.original_image = image
         self.target = target
         self.damage = 20
         self.speed = MAX_MISSILE_VELOCITY
         self.angle = 0
         self.life_time = 5 # seconds
-        self.deathtime = time.time() + self.life_time
+        self.effects = effects
+        timers.schedule(seconds_to_ticks(self.life_time), self.expire)
         
         # Initial velocity towards target
         dx = target.rect.centerx - x
@@ -273,87 +297,51 @@ class Missile(pygame.sprite.Sprite):
         if dist > 0:
             self.vx = self.speed * (dx / dist)
             self.vy = self.speed * (dy / dist)
-        else:
-            self.vx = 0
-            self.vy = 0
 
-    def update(self):
-        """Updates missile position, tracks target, and self-destructs after lifetime."""
-        if self.target and self.deathtime > time.time():
+    def update(self, now):
+        """Updates missile position and tracks target."""
+        if self.target:
             # Predict target position based on its speed
             target_pos = self.target.rect.center
             target_speed = [getattr(self.target, 'speed_x', 0), getattr(self.target, 'speed_y', 0)] # Get speed if available
-            distance = math.dist(self.rect.center, target_pos)
+            target_distance = distance((self.x, self.y), target_pos)
             
             pred_target_pos = target_pos
-            if distance > 0:
-                time_intercept = distance / self.speed
+            if target_distance > 0:
+                time_intercept = target_distance / self.speed
                 pred_target_pos = [
                     target_pos[0] + target_speed[0] * time_intercept,
                     target_pos[1] + target_speed[1] * time_intercept
                 ]
 
-            # Calculate desired direction
-            dx = pred_target_pos[0] - self.rect.centerx
-            dy = pred_target_pos[1] - self.rect.centery
-            dist_to_pred = math.hypot(dx, dy)
-            if dist_to_pred > 0:
-                desired_dir = [dx / dist_to_pred, dy / dist_to_pred]
-            else:
-                desired_dir = [0, 0]
-
-            # Current direction from velocity
-            current_speed = math.hypot(self.vx, self.vy)
-            current_dir = [self.vx / current_speed, self.vy / current_speed] if current_speed > 0 else [0, 0]
-
-            # Adjust direction with turning limit for smooth homing
-            if current_speed > 0 and dist_to_pred > 0:
-                dot_product = current_dir[0] * desired_dir[0] + current_dir[1] * desired_dir[1]
-                cross_product = current_dir[0] * desired_dir[1] - current_dir[1] * desired_dir[0]
-                angle_diff = math.atan2(cross_product, dot_product)
-                max_turn = math.radians(3)  # 3 degrees per frame for smooth turning
-                turn_angle = max(-max_turn, min(max_turn, angle_diff))
-                
-                # Rotate velocity vector
-                cos_theta = math.cos(turn_angle)
-                sin_theta = math.sin(turn_angle)
-                new_vx = self.vx * cos_theta - self.vy * sin_theta
-                new_vy = self.vx * sin_theta + self.vy * cos_theta
-                self.vx = new_vx
-                self.vy = new_vy
-                
-                # Normalize and scale to maintain constant speed
-                current_speed = math.hypot(self.vx, self.vy)
-                if current_speed > 0:
-                    self.vx = self.speed * (self.vx / current_speed)
-                    self.vy = self.speed * (self.vy / current_speed)
-
-            # Update position
-            self.rect.x += self.vx
-            self.rect.y += self.vy
+            # Turn towards the predicted position, at most MISSILE_TURN_RATE degrees per tick for smooth homing
+            self.vx, self.vy = turn_towards(self.vx, self.vy, pred_target_pos[0] - self.x, pred_target_pos[1] - self.y,
+                                            MISSILE_TURN_RATE, self.speed)
+            self.move()
 
             # Update visual rotation
             self.angle = math.degrees(math.atan2(self.vy, self.vx)) # Angle based on current velocity
-            self.image = pygame.transform.rotate(self.original_image, -self.angle)
-            self.rect = self.image.get_rect(center=self.rect.center)
+            self.set_image(pygame.transform.rotate(self.original_image, -self.angle))
         else:
-            # If target is gone or lifetime expired, create explosion and kill self
-            expl = Explosion(self.rect.center, 'small')
-            all_sprites.add(expl)
+            self.expire() # Target is gone
+
+    def expire(self):
+        """Explodes the missile, unless it already hit something."""
+        if self.alive():
+            self.effects.add(self.rect.center, 'small')
             self.kill()
 
-class PlasmaBolt(pygame.sprite.Sprite):
-    """Straight-moving, high-damage plasma projectile."""
-    def __init__(self, x, y, target_pos):
-        super().__init__()
-        self.image = pygame.Surface(PLASMA_BOLT_SIZE, pygame.SRCALPHA)
-        pygame.draw.circle(self.image, PLASMA_BOLT_COLOR, (PLASMA_BOLT_SIZE[0]//2, PLASMA_BOLT_SIZE[1]//2), PLASMA_BOLT_SIZE[0]//2)
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
+class PlasmaBolt(Entity):
+    """Straight-moving, high-damage plasma projectile. Its explosion is added to effects (an ExplosionEffects) when it expires."""
+    def __init__(self, x, y, target_pos, timers, effects):
+        image = pygame.Surface(PLASMA_BOLT_SIZE, pygame.SRCALPHA)
+        pygame.draw.circle(image, PLASMA_BOLT_COLOR, (PLASMA_BOLT_SIZE[0]//2, PLASMA_BOLT_SIZE[1]//2), PLASMA_BOLT_SIZE[0]//2)
+        super().__init__(x, y, image)
         self.damage = 50 # High damage
         self.speed = MAX_PLASMA_BOLT_VELOCITY
         self.life_time = 3 # seconds
-        self.deathtime = time.time() + self.life_time
+        self.effects = effects
+        timers.schedule(seconds_to_ticks(self.life_time), self.expire)
 
         # Calculate initial velocity towards target_pos (straight line)
         dx = target_pos[0] - x
@@ -362,46 +350,41 @@ class PlasmaBolt(pygame.sprite.Sprite):
         if dist > 0:
             self.vx = self.speed * (dx / dist)
             self.vy = self.speed * (dy / dist)
-        else:
-            self.vx = 0
-            self.vy = 0
 
-    def update(self):
-        """Updates plasma bolt position and self-destructs after lifetime or off screen."""
-        self.rect.x += self.vx
-        self.rect.y += self.vy
-
-        # Kill if off screen or lifetime expired
-        if not screen.get_rect().colliderect(self.rect) or time.time() > self.deathtime:
-            expl = Explosion(self.rect.center, 'small')
-            all_sprites.add(expl)
+    def update(self, now):
+        """Updates plasma bolt position and self-destructs off screen."""
+        self.move()
+
+        if not SCREEN_RECT.colliderect(self.rect):
+            self.expire()
+
+    def expire(self):
+        """Explodes the plasma bolt, unless it already hit something."""
+        if self.alive():
+            self.effects.add(self.rect.center, 'small')
             self.kill()
 
-class Laser(pygame.sprite.Sprite):
-    """Visual representation of the player's laser beam."""
+class Laser():
+    """The player's laser beam, a segment from the ship to where it hits (or the mouse)."""
     def __init__(self, start_pos, end_pos):
-        super().__init__()
-        # Create a surface large enough for the whole screen to draw the line on
-        self.image = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(topleft=(0, 0))
         self.update_beam(start_pos, end_pos)
 
     def update_beam(self, start_pos, end_pos):
         """Updates the laser beam's start and end points."""
-        self.image.fill((0, 0, 0, 0))  # Clear previous beam
-        pygame.draw.line(self.image, LASER_COLOR, start_pos, end_pos, LASER_WIDTH)
-    
-    def update(self):
-        """Update method for sprite group compatibility. Beam is updated externally."""
-        pass # The beam's position is updated directly by the player in the main loop
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+
+    def draw(self, surface):
+        pygame.draw.line(surface, LASER_COLOR, self.start_pos, self.end_pos, LASER_WIDTH)
 
 class Weapon():
     """Manages the player's current weapon and its firing logic."""
-    def __init__(self, type_name):
+    def __init__(self, type_name, effects, timers):
         self.set_weapon_type(type_name) # Set initial weapon type
+        self.effects = effects # Where the explosions of fired projectiles go
+        self.timers = timers # Schedules the end of the cooldown and the projectiles' lifetimes
         self.missiles = pygame.sprite.Group() # Group for player's missiles
         self.plasma_bolts = pygame.sprite.Group() # Group for player's plasma bolts
-        self.next_fire = time.time() # Cooldown timer
         self.ready = True # Is weapon ready to fire?
 
     def set_weapon_type(self, type_name):
@@ -421,211 +404,305 @@ class Weapon():
         
         self.ready = True # Reset readiness when changing weapon
 
-    def update(self):
-        """Updates weapon's internal cooldown."""
-        if time.time() > self.next_fire:
-            self.ready = True
+    def reload(self):
+        """Ends the cooldown."""
+        self.ready = True
 
     def fire(self, x, y, target = None, target_pos = None):
         """Fires a projectile based on the current weapon type."""
         if self.ready:
             if self.type == "MissileLauncher" and target:
-                missile = Missile(x, y, target, (255, 0, 0)) # Player missiles are red
-                self.next_fire = time.time() + self.shoot_delay
+                missile = Missile(x, y, target, (255, 0, 0), self.timers, self.effects) # Player missiles are red
                 self.ready = False
+                self.timers.schedule(seconds_to_ticks(self.shoot_delay), self.reload)
                 self.missiles.add(missile)
                 return missile
             elif self.type == "PlasmaBlaster" and target_pos:
-                plasma_bolt = PlasmaBolt(x, y, target_pos)
-                self.next_fire = time.time() + self.shoot_delay
+                plasma_bolt = PlasmaBolt(x, y, target_pos, self.timers, self.effects)
                 self.ready = False
+                self.timers.schedule(seconds_to_ticks(self.shoot_delay), self.reload)
                 self.plasma_bolts.add(plasma_bolt)
                 return plasma_bolt
         return None # Return None if not ready or no valid target/weapon type
 
-class Explosion(pygame.sprite.Sprite):
-    """Visual explosion effect."""
-    def __init__(self, center, size_category='medium'): # e.g., 'small', 'medium', 'large'
-        super().__init__()
-        self.center = center
-        self.animation_speed = 4  # Lower is faster animation (frames per stage)
-        self.frame_count = 0
-        
-        # Define radii and colors for different explosion sizes
-        if size_category == 'small':
-            self.radii = [5, 10, 15, 12, 8] # Expand then shrink
-            self.colors = [YELLOW, ORANGE, RED, ORANGE, YELLOW]
-        elif size_category == 'large':
-            self.radii = [20, 35, 50, 40, 25]
-            self.colors = [YELLOW, ORANGE, RED, ORANGE, YELLOW]
-        else: # medium
-            self.radii = [10, 20, 30, 25, 15]
-            self.colors = [YELLOW, ORANGE, RED, ORANGE, YELLOW]
-
-        self.current_stage = 0
-        self.max_stages = len(self.radii)
-        
-        # Ensure surface is large enough for the biggest radius
-        max_r = max(self.radii)
-        self.image = pygame.Surface((max_r * 2, max_r * 2), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=self.center)
-        self._draw_frame() # Draw initial frame
-
-    def _draw_frame(self):
-        """Draws the current stage of the explosion animation."""
-        self.image.fill((0, 0, 0, 0)) # Clear surface with transparent black
-        radius = self.radii[self.current_stage]
-        color = self.colors[self.current_stage]
-        # Draw circle in the center of the explosion's own surface
-        pygame.draw.circle(self.image, color, (self.image.get_width() // 2, self.image.get_height() // 2), radius)
+class ExplosionFrames():
+    """Pre-renders the animation frames of each explosion size_category once; all explosions share them."""
+    def __init__(self, stages=EXPLOSION_STAGES):
+        self.stages = stages
+        self.frames = {} # size_category -> list of frame surfaces, rendered on first use
+
+    def get(self, size_category):
+        frames = self.frames.get(size_category)
+        if frames is None:
+            stages = self.stages.get(size_category, self.stages['medium']) # Unknown categories look medium
+            max_r = max(radius for radius, color in stages) # Every frame is large enough for the biggest radius
+            frames = []
+            for radius, color in stages:
+                frame = pygame.Surface((max_r * 2, max_r * 2), pygame.SRCALPHA).convert_alpha()
+                frame.fill((0, 0, 0, 0))
+                pygame.draw.circle(frame, color, (max_r, max_r), radius)
+                frames.append(frame)
+            self.frames[size_category] = frames
+        return frames
+
+class ExplosionEffects():
+    """
+    All running explosions of a game, kept as (topleft, start tick, frames) records instead of
+    sprites. update() ages them by one tick and drops the finished ones, draw() blits the
+    current frame of each in one blits() call.
+    """
+    def __init__(self, animation_speed=EXPLOSION_ANIMATION_SPEED):
+        self.animation_speed = animation_speed
+        self.tick = 0
+        self.records = []
+
+    def add(self, center, size_category='medium'): # e.g., 'small', 'medium', 'large'
+        """Starts an explosion centered on center."""
+        frames = explosion_frames.get(size_category)
+        half_size = frames[0].get_width() // 2
+        self.records.append(((center[0] - half_size, center[1] - half_size), self.tick, frames))
 
     def update(self):
-        """Updates the explosion animation frame."""
-        self.frame_count += 1
-        if self.frame_count >= self.animation_speed:
-            self.frame_count = 0
-            self.current_stage += 1
-            if self.current_stage >= self.max_stages:
-                self.kill()  # Animation finished, remove sprite
+        """Advances every explosion by one tick, removing those whose animation has finished."""
+        self.tick += 1
+        if self.records:
+            tick = self.tick
+            speed = self.animation_speed
+            self.records = [record for record in self.records if (tick - record[1]) // speed < len(record[2])]
+
+    def draw(self, surface):
+        tick = self.tick
+        speed = self.animation_speed
+        surface.blits([(frames[(tick - start_tick) // speed], topleft) for topleft, start_tick, frames in self.records], doreturn=False)
+
+    def __len__(self):
+        return len(self.records)
+
+class FragmentEngine():
+    """
+    Splits the asteroids destroyed during a tick in one batch. Asteroids that aren't the smallest
+    size split into two smaller ones, which inherit half the parent's velocity plus some randomness
+    and are pushed apart so they don't collide again at once. The smallest ones drop 1-3 resources.
+    Children are taken from pools of destroyed asteroids and collected resources when there are any.
+    Resources expire through timers on the game's timer wheel.
+    """
+    def __init__(self, timers, pool_size=FRAGMENT_POOL_SIZE):
+        self.timers = timers
+        self.pool_size = pool_size
+        self.destroyed = [] # Asteroids destroyed this tick, split by flush()
+        self.asteroid_pool = []
+        self.resource_pool = []
+
+    def destroy(self, asteroid):
+        """Kills a destroyed asteroid; it is split on the next flush()."""
+        asteroid.kill()
+        self.destroyed.append(asteroid)
+
+    def recycle(self, sprite):
+        """Takes back a killed asteroid or resource for reuse."""
+        if isinstance(sprite, Asteroid):
+            pool = self.asteroid_pool
+        else:
+            pool = self.resource_pool
+            if sprite.expiry:
+                sprite.expiry.cancel() # Would otherwise expire its next life early
+                sprite.expiry = None
+        if len(pool) < self.pool_size:
+            pool.append(sprite)
+
+    def new_asteroid(self, x, y, size_index, speed_x, speed_y):
+        if self.asteroid_pool:
+            asteroid = self.asteroid_pool.pop()
+            asteroid.reset(x, y, size_index, speed_x, speed_y)
+            return asteroid
+        return Asteroid(x, y, size_index, speed_x, speed_y)
+
+    def new_resource(self, x, y, resource_type):
+        if self.resource_pool:
+            resource = self.resource_pool.pop()
+            resource.reset(x, y, resource_type)
+            return resource
+        return Resource(x, y, resource_type)
+
+    def expire_resource(self, resource):
+        resource.kill()
+        self.recycle(resource)
+
+    def flush(self, all_sprites, asteroids, resources):
+        """Splits the asteroids destroyed since the last flush and adds all their children to the groups at once."""
+        if not self.destroyed:
+            return
+        new_asteroids = []
+        new_resources = []
+        for parent in self.destroyed:
+            center_x, center_y = parent.rect.center
+            if parent.size_index < len(ASTEROID_SIZES) - 1:
+                # Split into smaller asteroids if not the smallest size
+                size_index = parent.size_index + 1
+                displacement_distance = ASTEROID_SIZES[size_index][0] + 5 # Based on new asteroid size + a bit
+                for _ in range(2):
+                    # Push them away from the center of the original asteroid
+                    angle = random.uniform(0, 2 * math.pi)
+                    speed_x = parent.speed_x * 0.5 + random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED) / (size_index + 1.5)
+                    speed_y = parent.speed_y * 0.5 + random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED) / (size_index + 1.5)
+                    new_asteroids.append(self.new_asteroid(center_x + math.cos(angle) * displacement_distance,
+                                                           center_y + math.sin(angle) * displacement_distance,
+                                                           size_index, speed_x, speed_y))
             else:
-                self._draw_frame() # Draw next frame
-
-# --- Game Setup ---
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Space Mining Game")
-clock = pygame.time.Clock()
-
-# Fonts for UI
-font = pygame.font.Font(None, 36)
-menu_font = pygame.font.Font(None, 48) # Larger font for menu titles
-small_font = pygame.font.Font(None, 24) # Smaller font for descriptions
-
-# Sprite Groups
-all_sprites = pygame.sprite.Group()
-asteroids = pygame.sprite.Group()
-resources = pygame.sprite.Group()
-enemies = pygame.sprite.Group()
-missiles = pygame.sprite.Group() # Enemy and player missiles
-plasma_bolts = pygame.sprite.Group() # Player's plasma bolts
-explosions = pygame.sprite.Group() # Group for explosion animations
-
-# Player initialization
-player = Spaceship(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-all_sprites.add(player)
-
-# Global variable to store weapon button rectangles for click detection in pause menu
-weapon_buttons_rects = {}
-
-def spawn_initial_entities():
-    """Spawns initial asteroids and enemies, clearing existing ones."""
-    # Clear existing dynamic sprites before spawning new ones (except player)
-    for sprite in all_sprites:
-        if sprite != player:
-            sprite.kill()
-    asteroids.empty()
-    resources.empty()
-    enemies.empty()
-    missiles.empty()
-    plasma_bolts.empty()
-    explosions.empty()
-
-    for _ in range(5): # Initial asteroids
-        x, y = generate_asteroid_position(player.rect.center, SCREEN_WIDTH, SCREEN_HEIGHT)
-        asteroid = Asteroid(x, y, 0, random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED),
-                            random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED))
-        asteroids.add(asteroid)
-        all_sprites.add(asteroid)
-
-    for _ in range(2): # Initial enemies
-        x, y = generate_asteroid_position(player.rect.center, SCREEN_WIDTH, SCREEN_HEIGHT)
-        enemy = Enemy(x,y)
-        enemy.target_player = player
-        enemies.add(enemy)
-        all_sprites.add(enemy)
-
-spawn_initial_entities() # Initial spawn when game starts
-
-def display_game_over_screen(screen, final_score):
-    """Displays the game over screen with final score and restart prompt."""
-    screen.fill(BLACK)
-    game_over_text = font.render("Game Over", True, RED)
-    score_text = font.render(f"Final Score: {final_score}", True, WHITE)
-    play_again_text = font.render("Press SPACE to Play Again", True, GREEN)
-    screen.blit(game_over_text, game_over_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)))
-    screen.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)))
-    screen.blit(play_again_text, play_again_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT * 2/3)))
-    pygame.display.flip()
-
-def draw_pause_menu(screen):
-    """Draws the pause menu with weapon selector."""
-    global weapon_buttons_rects # Access the global dictionary
-
-    # Darken the background
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180)) # Semi-transparent black
-    screen.blit(overlay, (0, 0))
-
-    # Title
-    title_text = menu_font.render("PAUSED", True, WHITE)
-    title_rect = title_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 4))
-    screen.blit(title_text, title_rect)
-
-    # Weapon Selector Title
-    weapon_selector_title = font.render("Weapon Selector:", True, YELLOW)
-    screen.blit(weapon_selector_title, (SCREEN_WIDTH / 2 - weapon_selector_title.get_width() / 2, SCREEN_HEIGHT / 4 + 70))
-
-    y_offset = SCREEN_HEIGHT / 4 + 120
-    button_height = 50
-    button_width = 250
-    button_spacing = 10
-    
-    weapon_buttons_rects.clear() # Clear previous rects before redrawing
-
-    # Draw weapon buttons
-    for i, (weapon_name, weapon_info) in enumerate(WEAPON_TYPES.items()):
-        button_y = y_offset + i * (button_height + button_spacing)
-        button_rect = pygame.Rect(
-            SCREEN_WIDTH / 2 - button_width / 2,
-            button_y,
-            button_width,
-            button_height
-        )
-        weapon_buttons_rects[weapon_name] = button_rect # Store rect for click detection
-
-        # Highlight current weapon
-        button_color = BLUE if player.weapon.type_name == weapon_name else (50, 50, 50)
-        text_color = WHITE
-
-        draw_button(screen, button_rect, button_color, weapon_name, text_color, font)
-        
-        # Display description and cost
-        desc_text = small_font.render(weapon_info["description"], True, (200, 200, 200))
-        cost_text = small_font.render(f"Cost: {weapon_info['cost']}", True, YELLOW)
-        
-        screen.blit(desc_text, (button_rect.right + 10, button_rect.centery - 15))
-        screen.blit(cost_text, (button_rect.right + 10, button_rect.centery + 5))
-
-# --- Game Loop ---
-running = True
-game_over = False
-game_paused = False # New flag for pause state
-
-while running:
-    # --- Event Handling ---
-    for event in pygame.event.get():
+                # Split into resources if it's the smallest size
+                for _ in range(random.randint(1, 3)):
+                    new_resources.append(self.new_resource(center_x, center_y, random.randint(0, len(RESOURCE_COLORS) - 1)))
+        for parent in self.destroyed: # Only now, so no parent is reused as a child of its own batch
+            self.recycle(parent)
+        self.destroyed = []
+
+        for resource in new_resources:
+            resource.expiry = self.timers.schedule(resource.lifetime, self.expire_resource, resource)
+        all_sprites.add(new_asteroids, new_resources)
+        asteroids.add(new_asteroids)
+        resources.add(new_resources)
+
+text_cache = TextCache(TEXT_CACHE_MAX_ENTRIES)
+sprite_atlas = SpriteAtlas(SPRITE_DIR, SPRITE_ATLAS_SIZE)
+explosion_frames = ExplosionFrames()
+fragment_images = {} # ("asteroid", size index) or ("resource", type) -> image shared by those fragments
+
+# --- Game ---
+
+class SpacinatorGame(Game):
+    """
+    One game of Spacinator: the sprites, the player and the game state, advanced one tick at a
+    time by step() and drawn by render(). pygame must be initialized and a display mode set
+    before a game is created, since sprites are converted for the display.
+    """
+    def __init__(self, seed=None, wave_mode=False, wave_curves=WAVE_CURVES):
+        self.wave_mode = wave_mode # Escalating waves instead of a few asteroids and enemies
+        self.wave_curves = wave_curves
+
+        # Fonts for UI
+        self.font = pygame.font.Font(None, 36)
+        self.menu_font = pygame.font.Font(None, 48) # Larger font for menu titles
+        self.small_font = pygame.font.Font(None, 24) # Smaller font for descriptions
+
+        # HUD labels (re-rendered only when the displayed value changes)
+        self.health_hud = HudText(self.font, "Health: {}", GREEN)
+        self.score_hud = HudText(self.font, "Score: {}", BLUE)
+        self.weapon_hud = HudText(self.font, "Weapon: {}", YELLOW)
+        self.wave_hud = HudText(self.font, "Wave: {}", WHITE)
+
+        self.weapon_buttons_rects = self.get_weapon_buttons_rects() # Pause menu buttons, for drawing and click detection
+        self.running = True # False once a QUIT event was stepped
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Starts a new game. A seed seeds the random module, so the same inputs replay the same game."""
+        if seed is not None:
+            random.seed(seed)
+        self.tick = 0 # Game clock, advanced by one per step while the game runs
+        self.time = 0.0 # Game time in seconds
+        self.timers = TimerWheel() # Lifetimes and cooldowns, keyed on the game clock
+        self.wave = 1
+        self.wave_timer = self.timers.schedule(seconds_to_ticks(WAVE_DURATION), self.next_wave) if self.wave_mode else None
+        self.game_over = False
+        self.game_paused = False
+        self.mouse_pos = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2) # Last mouse position seen in the inputs
+
+        # Sprite Groups
+        self.all_sprites = pygame.sprite.Group()
+        self.asteroids = pygame.sprite.Group()
+        self.resources = pygame.sprite.Group()
+        self.enemies = pygame.sprite.Group()
+        self.player_missiles = pygame.sprite.Group()
+        self.enemy_missiles = pygame.sprite.Group()
+        self.plasma_bolts = pygame.sprite.Group() # Player's plasma bolts
+        self.explosions = ExplosionEffects() # Explosion animations, drawn on top of the sprites
+        # Nearest asteroid lookups for auto-targeting. Enemies get no index: their missiles always home
+        # on the player and player missiles only hit asteroids, so nothing looks for the nearest enemy
+        self.asteroid_index = TargetIndex(self.asteroids, TARGET_INDEX_CELL_SIZE)
+        self.collisions = CollisionLayers(COLLISION_MATRIX, SCREEN_WIDTH, SCREEN_HEIGHT, SPATIAL_HASH_CELL_SIZE, WRAPPING_LAYERS) # Collision broadphase, rebuilt each tick
+        self.fragments = FragmentEngine(self.timers) # Splits destroyed asteroids at the end of each tick's collisions
+
+        # Player initialization
+        self.player = Spaceship(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, self.explosions, self.timers)
+        self.all_sprites.add(self.player)
+
+        self.spawn_initial_entities()
+
+    def spawn_initial_entities(self):
+        """Spawns initial asteroids and enemies."""
+        for _ in range(5): # Initial asteroids
+            x, y = generate_asteroid_position(self.player.rect.center, SCREEN_WIDTH, SCREEN_HEIGHT)
+            asteroid = Asteroid(x, y, 0, random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED),
+                                random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED))
+            self.asteroids.add(asteroid)
+            self.all_sprites.add(asteroid)
+
+        for _ in range(2): # Initial enemies
+            x, y = generate_asteroid_position(self.player.rect.center, SCREEN_WIDTH, SCREEN_HEIGHT)
+            self.spawn_enemy(x, y)
+
+    def spawn_enemy(self, x, y):
+        """Adds an enemy targeting the player and schedules its first shot."""
+        enemy = Enemy(x, y)
+        enemy.target_player = self.player
+        self.enemies.add(enemy)
+        self.all_sprites.add(enemy)
+        self.timers.schedule(seconds_to_ticks(enemy.first_shot_delay), self.enemy_shot, enemy)
+
+    def enemy_shot(self, enemy):
+        """Fires an enemy's missile when its shot is due, and schedules the next one."""
+        if not enemy.alive():
+            return
+        missile_fired = enemy.shoot_missile(self.timers, self.explosions)
+        if missile_fired:
+            self.enemy_missiles.add(missile_fired)
+            self.all_sprites.add(missile_fired)
+        self.timers.schedule(seconds_to_ticks(enemy.shoot_delay / self.wave_quantity("missile_rate", 1)), self.enemy_shot, enemy)
+
+    def wave_quantity(self, name, default):
+        """Returns a quantity from the wave curves in wave mode, or its default otherwise."""
+        return wave_value(self.wave_curves, name, self.wave) if self.wave_mode else default
+
+    def next_wave(self):
+        self.wave += 1
+        print(f"Wave {self.wave}")
+        self.wave_timer = self.timers.schedule(seconds_to_ticks(WAVE_DURATION), self.next_wave)
+
+    def entity_count(self):
+        """Returns how many sprites and explosions are alive."""
+        return len(self.all_sprites) + len(self.explosions)
+
+    def step(self, inputs):
+        """
+        Advances the game by one tick. inputs are the pygame events of this tick, from
+        pygame.event.get() or made up by the caller; the mouse position is taken from their pos.
+        The game clock stands still while the game is paused or over.
+        """
+        for event in inputs:
+            if hasattr(event, "pos"):
+                self.mouse_pos = event.pos
+            self.handle_event(event)
+        if not self.game_over and not self.game_paused: # Only update game elements if not paused
+            self.update()
+
+    def handle_event(self, event):
+        """Applies one input event to the player, the pause menu or the game over screen."""
+        player = self.player
         if event.type == pygame.QUIT:
-            running = False
+            self.running = False
+        elif self.game_over: # Game Over state
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE: # Restart game on SPACE
+                self.reset() # Respawn all game elements
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_p: # 'P' for Pause
-                game_paused = not game_paused # Toggle pause state
+                self.game_paused = not self.game_paused # Toggle pause state
                 # If pausing, ensure laser is off
-                if game_paused and player.active_laser:
-                    player.active_laser.kill()
+                if self.game_paused:
                     player.active_laser = None
                 player.shooting_laser = False
                 player.firing_weapon = False
-            
-            if not game_paused: # Only process game input if game is not paused
+
+            if not self.game_paused: # Only process game input if game is not paused
                 if event.key == pygame.K_w: player.accelerate("up")
                 elif event.key == pygame.K_s: player.accelerate("down")
                 elif event.key == pygame.K_a: player.accelerate("left")
@@ -633,28 +710,25 @@ while running:
                 elif event.key == pygame.K_LSHIFT: player.firing_weapon = True # For Missile/Plasma
             # No specific KEYDOWN handling for menu, as it's mouse-driven
         elif event.type == pygame.KEYUP:
-            if not game_paused: # Only process game input if game is not paused
+            if not self.game_paused: # Only process game input if game is not paused
                 if event.key == pygame.K_w and player.speed_y < 0: player.accelerate("stop_y")
                 elif event.key == pygame.K_s and player.speed_y > 0: player.accelerate("stop_y")
                 elif event.key == pygame.K_a and player.speed_x < 0: player.accelerate("stop_x")
                 elif event.key == pygame.K_d and player.speed_x > 0: player.accelerate("stop_x")
                 elif event.key == pygame.K_LSHIFT: player.firing_weapon = False # Stop firing discrete weapons
-        
+
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1: # Left mouse button
-            if not game_paused:
+            if not self.game_paused:
                 # This handles the Laser Cannon activation
                 if player.weapon.type == "LaserCannon":
                     player.shooting_laser = True
                     if player.active_laser is None: # Create laser only if one isn't active
-                        mouse_pos = pygame.mouse.get_pos()
-                        player.active_laser = Laser(player.rect.center, mouse_pos)
-                        all_sprites.add(player.active_laser)
+                        player.active_laser = Laser(player.rect.center, self.mouse_pos)
                 # For other weapons, mouse click might not be the primary fire, or it could be secondary
                 # For now, only Laser uses continuous mouse down.
             else: # If paused, handle mouse clicks in the pause menu
-                mouse_pos = event.pos
-                for weapon_name, rect in weapon_buttons_rects.items():
-                    if rect.collidepoint(mouse_pos):
+                for weapon_name, rect in self.weapon_buttons_rects.items():
+                    if rect.collidepoint(event.pos):
                         weapon_info = WEAPON_TYPES[weapon_name]
                         # Check if player can afford or already has the weapon
                         if player.score >= weapon_info["cost"] or player.weapon.type_name == weapon_name:
@@ -663,230 +737,288 @@ while running:
                                 print(f"Purchased {weapon_name}. Score: {player.score}")
                             player.weapon.set_weapon_type(weapon_name)
                             print(f"Weapon changed to: {weapon_name}")
-                            # Optionally unpause after selection: game_paused = False
+                            # Optionally unpause after selection: self.game_paused = False
                         else:
                             print(f"Not enough score to buy {weapon_name} (needs {weapon_info['cost']}). Current score: {player.score}")
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            if not game_paused:
+            if not self.game_paused:
                 # Deactivate Laser Cannon
                 if player.weapon.type == "LaserCannon":
                     player.shooting_laser = False
-                    if player.active_laser:
-                        player.active_laser.kill()
-                        player.active_laser = None
-
-    if not game_over:
-        if not game_paused: # Only update game elements if not paused
-            # --- Update ---
-            all_sprites.update() # This updates player, asteroids, enemies, missiles, plasma_bolts, explosions, active_laser
-
-            # Player Firing Logic (based on selected weapon)
-            if player.weapon.type == "MissileLauncher":
-                if player.firing_weapon: # Fired with Shift key
-                    # Find closest asteroid to target
-                    target_asteroid = None
-                    min_dist = float('inf')
-                    for ast in asteroids:
-                        dist = calculate_distance(player.rect.center, ast.rect.center)
-                        if dist < min_dist:
-                            min_dist = dist
-                            target_asteroid = ast
-                    
-                    if target_asteroid:
-                        missile_fired = player.weapon.fire(player.rect.centerx, player.rect.centery, target_asteroid)
-                        if missile_fired:
-                            missiles.add(missile_fired)
-                            all_sprites.add(missile_fired)
-            
-            elif player.weapon.type == "LaserCannon":
-                if player.shooting_laser and player.score > 0: # Fired with Left Mouse, drains score
-                    # Update laser beam position
-                    if player.active_laser:
-                        player.active_laser.update_beam(player.rect.center, pygame.mouse.get_pos())
-                    
-                    player.score -= 0.5 # Continuous score drain
-                    if player.score < 0: player.score = 0 # Prevent negative score
-                    
-                    # Apply continuous damage to asteroids under the mouse cursor
-                    mouse_pos = pygame.mouse.get_pos()
-                    for asteroid_target in list(asteroids): # Iterate over a copy for safe removal
-                        if asteroid_target.rect.collidepoint(mouse_pos):
-                            if asteroid_target.damage(player.weapon.damage): # Use weapon's damage
-                                player.score += 5 # Score for laser destruction
-                                expl = Explosion(asteroid_target.rect.center, 'small')
-                                all_sprites.add(expl)
-                                new_items = split_asteroid(asteroid_target)
-                                asteroid_target.kill()
-                                for item in new_items:
-                                    all_sprites.add(item)
-                                    if isinstance(item, Asteroid): asteroids.add(item)
-                                    elif isinstance(item, Resource): resources.add(item)
-                                break # Process one asteroid per frame for the laser
-                else: # If score is zero or mouse released, stop laser
-                    if player.active_laser:
-                        player.active_laser.kill()
-                        player.active_laser = None
-                    player.shooting_laser = False # Ensure flag is off
-
-            elif player.weapon.type == "PlasmaBlaster":
-                if player.firing_weapon: # Fired with Shift key
-                    mouse_pos = pygame.mouse.get_pos() # Target mouse cursor
-                    plasma_bolt_fired = player.weapon.fire(player.rect.centerx, player.rect.centery, target_pos=mouse_pos)
-                    if plasma_bolt_fired:
-                        plasma_bolts.add(plasma_bolt_fired)
-                        all_sprites.add(plasma_bolt_fired)
-
-
-            # Asteroid and player collision
-            collided_asteroids = pygame.sprite.spritecollide(player, asteroids, False) # False: don't kill asteroid yet
-            for asteroid_hit in collided_asteroids:
-                player.health -= asteroid_hit.size[0] * 2 # Damage based on size
-                
-                expl = Explosion(asteroid_hit.rect.center, 'medium')
-                all_sprites.add(expl)
-
-                new_items = split_asteroid(asteroid_hit)
-                asteroid_hit.kill() # Kill the original asteroid now
-
-                for item in new_items:
-                    all_sprites.add(item)
-                    if isinstance(item, Asteroid): asteroids.add(item)
-                    elif isinstance(item, Resource): resources.add(item)
-                if player.health <= 0:
-                    game_over = True
-                    break 
-            if game_over: continue # Skip rest of updates if game over from this collision
-                
-            # Resource and player collision
-            collected_resources = pygame.sprite.spritecollide(player, resources, True) # True: kill resource on collide
-            for resource_collected in collected_resources:
-                player.score += resource_collected.value
-
-            # Enemy and player collision
-            collided_enemies = pygame.sprite.spritecollide(player, enemies, True) # True: kill enemy on collide
-            for enemy_hit in collided_enemies:
-                player.health -= 30 # Damage from enemy collision
-                expl = Explosion(enemy_hit.rect.center, 'medium') # Enemy explodes too
-                all_sprites.add(expl)
+                    player.active_laser = None
+
+    def update(self):
+        """Moves everything, fires weapons, resolves collisions and respawns asteroids and enemies."""
+        player = self.player
+        self.tick += 1
+        self.time = self.tick / FPS
+        self.timers.advance(self.tick) # Expires projectiles and resources, ends cooldowns and fires enemy shots
+        self.explosions.update() # Before the sprites, whose update may start new explosions
+        self.all_sprites.update(self.time) # This updates player, asteroids, enemies, missiles, plasma bolts
+        self.asteroid_index.invalidate()
+        # Rehash the layers that can be hit, for the laser and the collisions below. Shots fired this
+        # tick only hit things, so they are picked up by pairs() without being hashed
+        self.collisions.build({
+            "player": (player,),
+            "asteroids": self.asteroids,
+            "resources": self.resources,
+            "enemies": self.enemies,
+            "enemy_missiles": self.enemy_missiles,
+            "player_missiles": self.player_missiles,
+            "plasma_bolts": self.plasma_bolts,
+        })
+
+        # Player Firing Logic (based on selected weapon)
+        if player.weapon.type == "MissileLauncher":
+            if player.firing_weapon and player.weapon.ready: # Fired with Shift key, once off cooldown
+                target_asteroid = self.asteroid_index.nearest(player.rect.center) # Closest asteroid to target
+                if target_asteroid:
+                    missile_fired = player.weapon.fire(player.rect.centerx, player.rect.centery, target_asteroid)
+                    if missile_fired:
+                        self.player_missiles.add(missile_fired)
+                        self.all_sprites.add(missile_fired)
+
+        elif player.weapon.type == "LaserCannon":
+            if player.shooting_laser and player.score > 0: # Fired with Left Mouse, drains score
+                # The beam runs from the ship towards the mouse and stops at the first asteroid in its way
+                asteroid_target, beam_end = self.collisions.raycast("asteroids", player.rect.center, self.mouse_pos)
+                if player.active_laser:
+                    player.active_laser.update_beam(player.rect.center, beam_end)
+
+                player.score -= 0.5 # Continuous score drain
+                if player.score < 0: player.score = 0 # Prevent negative score
+
+                # Apply continuous damage to the asteroid the beam hits
+                if asteroid_target and asteroid_target.damage(player.weapon.damage): # Use weapon's damage
+                    player.score += 5 # Score for laser destruction
+                    self.explosions.add(asteroid_target.rect.center, 'small')
+                    self.fragments.destroy(asteroid_target)
+            else: # If score is zero or mouse released, stop laser
+                player.active_laser = None
+                player.shooting_laser = False # Ensure flag is off
+
+        elif player.weapon.type == "PlasmaBlaster":
+            if player.firing_weapon: # Fired with Shift key
+                plasma_bolt_fired = player.weapon.fire(player.rect.centerx, player.rect.centery, target_pos=self.mouse_pos) # Target mouse cursor
+                if plasma_bolt_fired:
+                    self.plasma_bolts.add(plasma_bolt_fired)
+                    self.all_sprites.add(plasma_bolt_fired)
+
+
+        # Collisions, as COLLISION_MATRIX pairs the layers
+        for layer, sprite, target, hits in self.collisions.pairs():
+            self.resolve_collision(layer, sprite, target, hits)
+            if self.game_over:
+                return # Skip rest of updates if game over from this collision
+        self.fragments.flush(self.all_sprites, self.asteroids, self.resources)
+
+        # Respawn asteroids if too few
+        min_asteroids = int(self.wave_quantity("asteroids", 3))
+        if len(self.asteroids) < min_asteroids: # Maintain a minimum number of asteroids
+            for _ in range(min_asteroids - len(self.asteroids)):
+                x, y = generate_asteroid_position(player.rect.center, SCREEN_WIDTH, SCREEN_HEIGHT)
+                # Spawn a mix of sizes
+                size_idx = random.choices([0, 1, 2], weights=[0.6, 0.3, 0.1], k=1)[0]
+                new_ast = Asteroid(x, y, size_idx,
+                                random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED),
+                                random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED))
+                self.asteroids.add(new_ast)
+                self.all_sprites.add(new_ast)
+
+        # Respawn enemies if too few
+        if self.wave_mode:
+            min_enemies = max_enemies = int(self.wave_quantity("enemies", 2))
+        else:
+            min_enemies, max_enemies = 1, 2
+        if len(self.enemies) < min_enemies: # Maintain a minimum number of enemies
+            for _ in range(max_enemies - len(self.enemies)): # Spawn up to the maximum
+                x, y = generate_asteroid_position(player.rect.center, SCREEN_WIDTH, SCREEN_HEIGHT)
+                self.spawn_enemy(x, y)
+
+    def resolve_collision(self, layer, sprite, target, hits):
+        """Applies what happens when a sprite of a collision layer hits sprites of a target layer."""
+        player = self.player
+        if layer == "player":
+            for hit in hits:
+                if target == "asteroids":
+                    player.health -= hit.size[0] * 2 # Damage based on size
+                    self.explosions.add(hit.rect.center, 'medium')
+                    self.fragments.destroy(hit)
+                elif target == "resources":
+                    hit.kill() # Collected
+                    self.fragments.recycle(hit)
+                    player.score += hit.value
+                elif target == "enemies":
+                    hit.kill()
+                    player.health -= 30 # Damage from enemy collision
+                    self.explosions.add(hit.rect.center, 'medium') # Enemy explodes too
                 if player.health <= 0:
-                    game_over = True
-                    break
-            if game_over: continue
-
-            # Enemy shooting missiles
-            for enemy_unit in enemies:
-                missile_fired = enemy_unit.shoot_missile()
-                if missile_fired:
-                    missiles.add(missile_fired)
-                    all_sprites.add(missile_fired)
-
-            # Missile and player collision (only enemy missiles target player)
-            for missile in missiles:
-                if missile.target == player: # Check if this missile targets the player
-                    if pygame.sprite.collide_rect(missile, player):
-                        player.health -= missile.damage
-                        expl = Explosion(missile.rect.center, 'small') # Missile explosion on player
-                        missile.kill()
-                        all_sprites.add(expl)
-                        if player.health <= 0:
-                            game_over = True
-                            break
-            if game_over: continue
-
-            # Missile and asteroid collision (player missiles and enemy missiles)
-            missile_asteroid_hits = pygame.sprite.groupcollide(missiles, asteroids, True, False) # Missile killed, asteroid not (yet)
-            for missile_obj, asteroids_hit_list in missile_asteroid_hits.items():
-                for asteroid_obj in asteroids_hit_list:
-                    if asteroid_obj.damage(missile_obj.damage * 2): # Missiles do more damage to asteroids
-                        player.score += 10 # Score for destroying asteroid with missile
-                        
-                        expl = Explosion(asteroid_obj.rect.center, 'medium') # Asteroid explosion
-                        all_sprites.add(expl)
-
-                        new_items = split_asteroid(asteroid_obj)
-                        asteroid_obj.kill() # Kill asteroid if damage destroyed it
-                        for item in new_items:
-                            all_sprites.add(item)
-                            if isinstance(item, Asteroid): asteroids.add(item)
-                            elif isinstance(item, Resource): resources.add(item)
-                    else: # Asteroid damaged but not destroyed
-                        expl = Explosion(missile_obj.rect.center, 'small') # Smaller impact explosion
-                        all_sprites.add(expl)
-
-            # Plasma Bolt and asteroid collision
-            plasma_asteroid_hits = pygame.sprite.groupcollide(plasma_bolts, asteroids, True, False)
-            for plasma_bolt_obj, asteroids_hit_list in plasma_asteroid_hits.items():
-                for asteroid_obj in asteroids_hit_list:
-                    if asteroid_obj.damage(plasma_bolt_obj.damage): # Plasma bolts do high damage
-                        player.score += 20 # More score for plasma destruction
-                        expl = Explosion(asteroid_obj.rect.center, 'large') # Larger explosion for plasma
-                        all_sprites.add(expl)
-                        new_items = split_asteroid(asteroid_obj)
-                        asteroid_obj.kill()
-                        for item in new_items:
-                            all_sprites.add(item)
-                            if isinstance(item, Asteroid): asteroids.add(item)
-                            elif isinstance(item, Resource): resources.add(item)
-                    else:
-                        expl = Explosion(plasma_bolt_obj.rect.center, 'medium') # Medium impact explosion
-                        all_sprites.add(expl)
-
-            # Respawn asteroids if too few
-            if len(asteroids) < 3: # Maintain a minimum number of asteroids
-                for _ in range(3 - len(asteroids)):
-                    x, y = generate_asteroid_position(player.rect.center, SCREEN_WIDTH, SCREEN_HEIGHT)
-                    # Spawn a mix of sizes
-                    size_idx = random.choices([0, 1, 2], weights=[0.6, 0.3, 0.1], k=1)[0]
-                    new_ast = Asteroid(x, y, size_idx, 
-                                    random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED),
-                                    random.uniform(-MAX_ASTEROID_SPEED, MAX_ASTEROID_SPEED))
-                    asteroids.add(new_ast)
-                    all_sprites.add(new_ast)
-            
-            # Respawn enemies if too few
-            if len(enemies) < 1: # Maintain a minimum number of enemies
-                for _ in range(2 - len(enemies)): # Spawn up to 2
-                    x, y = generate_asteroid_position(player.rect.center, SCREEN_WIDTH, SCREEN_HEIGHT)
-                    new_enemy = Enemy(x,y)
-                    new_enemy.target_player = player
-                    enemies.add(new_enemy)
-                    all_sprites.add(new_enemy)
-
-        # --- Draw ---
-        screen.fill(BLACK)
-        all_sprites.draw(screen) # Draws all sprites, including player, asteroids, enemies, missiles, active_laser, explosions
+                    self.game_over = True
+                    return
+        elif target == "player": # Enemy missile
+            player.health -= sprite.damage
+            self.explosions.add(sprite.rect.center, 'small') # Missile explosion on player
+            sprite.kill()
+            if player.health <= 0:
+                self.game_over = True
+        else: # A projectile hitting asteroids; player and enemy missiles alike score for the player
+            if layer == "plasma_bolts":
+                damage, score, destroyed_size, impact_size = sprite.damage, 20, 'large', 'medium' # Plasma bolts do high damage
+            else:
+                damage, score, destroyed_size, impact_size = sprite.damage * 2, 10, 'medium', 'small' # Missiles do more damage to asteroids
+            sprite.kill() # Projectile killed, asteroid not (yet)
+            for asteroid_obj in hits:
+                if asteroid_obj.damage(damage):
+                    player.score += score
+                    self.explosions.add(asteroid_obj.rect.center, destroyed_size) # Asteroid explosion
+                    self.fragments.destroy(asteroid_obj) # Kill asteroid if damage destroyed it
+                else: # Asteroid damaged but not destroyed
+                    self.explosions.add(sprite.rect.center, impact_size) # Smaller impact explosion
+
+    def draw(self):
+        """Renders the game to the display surface, for run()."""
+        self.render(pygame.display.get_surface())
+
+    def render(self, surface):
+        """Draws the current frame (the game and HUD, the pause menu or the game over screen) onto surface."""
+        if self.game_over:
+            self.draw_game_over_screen(surface)
+            return
+
+        surface.fill(BLACK)
+        self.all_sprites.draw(surface) # Draws all sprites, including player, asteroids, enemies, missiles
+        for asteroid in self.asteroids: # Asteroids crossing an edge also show at the opposite edge
+            for dx, dy in wrap_offsets(asteroid.rect):
+                surface.blit(asteroid.image, asteroid.rect.move(dx, dy))
+        if self.player.active_laser:
+            self.player.active_laser.draw(surface)
+        self.explosions.draw(surface)
 
         # Draw UI elements (Health, Score)
-        health_text = font.render(f"Health: {max(0, int(player.health))}", True, GREEN if player.health > 30 else RED)
-        score_text = font.render(f"Score: {int(player.score)}", True, BLUE)
-        weapon_text = font.render(f"Weapon: {player.weapon.type_name}", True, YELLOW)
-        screen.blit(health_text, (10, 10))
-        screen.blit(score_text, (10, 40))
-        screen.blit(weapon_text, (10, 70))
-
-        if game_paused: # Draw pause menu on top if paused
-            draw_pause_menu(screen)
-
-        pygame.display.flip()
-        clock.tick(FPS)
-    else: # Game Over state
-        display_game_over_screen(screen, player.score)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.K_SPACE: # Restart game on SPACE
-                game_over = False
-                player.health = 100
-                player.score = 0
-                player.rect.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-                player.speed_x, player.speed_y = 0,0
-                player.weapon.set_weapon_type(PLAYER_WEAPON_TYPE_INIT) # Reset weapon
-                if player.active_laser: # Ensure laser is cleared on restart
-                    player.active_laser.kill()
-                    player.active_laser = None
-                player.shooting_laser = False
-                player.firing_weapon = False
-                
-                spawn_initial_entities() # Respawn all game elements
+        self.health_hud.draw(surface, (10, 10), max(0, int(self.player.health)), color=GREEN if self.player.health > 30 else RED)
+        self.score_hud.draw(surface, (10, 40), int(self.player.score))
+        self.weapon_hud.draw(surface, (10, 70), self.player.weapon.type_name)
+        if self.wave_mode:
+            self.wave_hud.draw(surface, (10, 100), self.wave)
+
+        if self.game_paused: # Draw pause menu on top if paused
+            self.draw_pause_menu(surface)
+
+    def draw_game_over_screen(self, surface):
+        """Displays the game over screen with final score and restart prompt."""
+        surface.fill(BLACK)
+        game_over_text = text_cache.render(self.font, "Game Over", RED)
+        score_text = text_cache.render(self.font, f"Final Score: {self.player.score}", WHITE)
+        play_again_text = text_cache.render(self.font, "Press SPACE to Play Again", GREEN)
+        surface.blit(game_over_text, game_over_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)))
+        surface.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)))
+        surface.blit(play_again_text, play_again_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT * 2/3)))
+
+    @staticmethod
+    def get_weapon_buttons_rects():
+        """Lays out the pause menu's weapon buttons, returns {weapon name: button rect}."""
+        y_offset = SCREEN_HEIGHT / 4 + 120
+        button_height = 50
+        button_width = 250
+        button_spacing = 10
+
+        weapon_buttons_rects = {}
+        for i, weapon_name in enumerate(WEAPON_TYPES):
+            button_y = y_offset + i * (button_height + button_spacing)
+            weapon_buttons_rects[weapon_name] = pygame.Rect(
+                SCREEN_WIDTH / 2 - button_width / 2,
+                button_y,
+                button_width,
+                button_height
+            )
+        return weapon_buttons_rects
+
+    def draw_pause_menu(self, surface):
+        """Draws the pause menu with weapon selector."""
+        # Darken the background
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180)) # Semi-transparent black
+        surface.blit(overlay, (0, 0))
+
+        # Title
+        title_text = text_cache.render(self.menu_font, "PAUSED", WHITE)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 4))
+        surface.blit(title_text, title_rect)
+
+        # Weapon Selector Title
+        weapon_selector_title = text_cache.render(self.font, "Weapon Selector:", YELLOW)
+        surface.blit(weapon_selector_title, (SCREEN_WIDTH / 2 - weapon_selector_title.get_width() / 2, SCREEN_HEIGHT / 4 + 70))
+
+        # Draw weapon buttons
+        for weapon_name, button_rect in self.weapon_buttons_rects.items():
+            weapon_info = WEAPON_TYPES[weapon_name]
+
+            # Highlight current weapon
+            button_color = BLUE if self.player.weapon.type_name == weapon_name else (50, 50, 50)
+            text_color = WHITE
+
+            draw_button(surface, button_rect, button_color, weapon_name, text_color, self.font)
+
+            # Display description and cost
+            desc_text = text_cache.render(self.small_font, weapon_info["description"], (200, 200, 200))
+            cost_text = text_cache.render(self.small_font, f"Cost: {weapon_info['cost']}", YELLOW)
+
+            surface.blit(desc_text, (button_rect.right + 10, button_rect.centery - 15))
+            surface.blit(cost_text, (button_rect.right + 10, button_rect.centery + 5))
+
+# --- Game Loop ---
 
-pygame.quit()
+def measure_capacity(surface, seed=0, frames_per_wave=CAPACITY_FRAMES_PER_WAVE, max_waves=CAPACITY_MAX_WAVES,
+                     frame_budget=1000 / FPS):
+    """
+    Finds how many entities the game sustains at FPS. Plays wave mode with an auto-firing player
+    that can't die, one wave per frames_per_wave frames, until the 90th percentile time of a frame
+    (step, render and flip) in a wave exceeds frame_budget milliseconds. Returns the average entity
+    count of the last wave within budget.
+    """
+    game = SpacinatorGame(seed, wave_mode=True)
+    game.wave_timer.cancel() # Waves are stepped here instead
+    game.player.firing_weapon = True
+    sustained = 0
+    for wave in range(1, max_waves + 1):
+        game.wave = wave
+        frame_times = []
+        entity_counts = []
+        for _ in range(frames_per_wave):
+            game.player.health = 10 ** 9 # Load is measured, not survival
+            start = time.perf_counter()
+            game.step([])
+            game.render(surface)
+            pygame.display.flip()
+            frame_times.append((time.perf_counter() - start) * 1000)
+            entity_counts.append(game.entity_count())
+        frame_times.sort()
+        frame_time = frame_times[int(len(frame_times) * 0.9)]
+        entities = sum(entity_counts) // len(entity_counts)
+        print(f"Wave {wave}: {entities} entities, 90th percentile frame {frame_time:.1f} ms")
+        if frame_time > frame_budget:
+            break
+        sustained = entities
+    print(f"Max sustainable entities at {FPS} FPS: {sustained}")
+    return sustained
+
+def main():
+    """Runs Spacinator in a window until it is closed, or measures its capacity."""
+    parser = argparse.ArgumentParser(description="Spacinator")
+    parser.add_argument("--waves", action="store_true", help="play escalating waves")
+    parser.add_argument("--measure-capacity", action="store_true",
+                        help=f"ramp up waves until frames miss the {FPS} FPS budget and print the entity count sustained")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                     (pygame.SCALED if DISPLAY_SCALED else 0) | (pygame.FULLSCREEN if DISPLAY_FULLSCREEN else 0))
+    pygame.display.set_caption("Space Mining Game")
+    if args.measure_capacity:
+        measure_capacity(screen)
+        pygame.quit()
+        return
+    run(SpacinatorGame(wave_mode=args.waves), FPS)
+
+if __name__ == "__main__":
+    main()